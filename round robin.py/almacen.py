@@ -0,0 +1,451 @@
+"""
+Almacenamiento columnar de cargas de trabajo y resultados de simulación
+
+Una ejecución se guarda como un directorio con un archivo .npy por columna:
+
+    meta.json           Descripción de las columnas y metadatos de la ejecución
+    processes/*.npy     Tabla de procesos (carga y métricas por proceso)
+    gantt/*.npy         Tramos del diagrama de Gantt (dueño, inicio, fin, piezas)
+
+Las columnas numéricas se escriben por bloques (sin conocer el tamaño
+final) y se leen con memoria mapeada, de modo que una ejecución de varios
+gigabytes se puede recargar sin volver a simular. Las columnas de texto se
+guardan como desplazamientos más bytes UTF-8. También se puede exportar a
+un único archivo .npz comprimido o a Parquet (si pyarrow está instalado).
+"""
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+import pandas as pd
+
+from gantt import GanttRLE
+
+# Tamaño fijo del encabezado .npy: permite reescribir la forma al cerrar
+_HEADER_SIZE = 128
+
+# Columnas de los tramos del diagrama de Gantt
+GANTT_COLUMNS = ('owner', 'start', 'end', 'count')
+
+# Variable de entorno con el directorio de salida de los programas interactivos
+OUTPUT_ENV = 'SIMULADOR_SALIDA'
+
+
+def _npy_header(dtype, length):
+    """Encabezado .npy (versión 1.0) de _HEADER_SIZE bytes para un arreglo 1-D"""
+    header = repr({'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                   'fortran_order': False, 'shape': (length,)})
+    prefix = np.lib.format.magic(1, 0) + struct.pack('<H', _HEADER_SIZE - 10)
+    return prefix + header.ljust(_HEADER_SIZE - 11).encode('latin1') + b'\n'
+
+
+class ColumnWriter:
+    def __init__(self, path, dtype):
+        """
+        Abre un archivo .npy 1-D al que se agregan valores por bloques
+
+        Args:
+            path (str): Ruta del archivo
+            dtype: Tipo de dato de la columna
+        """
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self._file = open(path, 'wb')
+        self._file.write(_npy_header(self.dtype, 0))
+
+    @classmethod
+    def reopen(cls, path, dtype, length):
+        """
+        Reabre una columna para seguir agregando después de 'length' valores
+
+        Lo escrito después de esa posición (por ejemplo, tras una interrupción)
+        se descarta.
+
+        Args:
+            path (str): Ruta del archivo
+            dtype: Tipo de dato de la columna
+            length (int): Número de valores válidos
+        """
+        writer = cls.__new__(cls)
+        writer.path = path
+        writer.dtype = np.dtype(dtype)
+        writer.length = length
+        writer._file = open(path, 'r+b')
+        writer._file.truncate(_HEADER_SIZE + length * writer.dtype.itemsize)
+        writer._file.seek(0, os.SEEK_END)
+        return writer
+
+    def append(self, values):
+        """Agrega un bloque de valores al final de la columna"""
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        self._file.write(values.tobytes())
+        self.length += len(values)
+
+    def flush(self):
+        """Lleva al disco lo escrito hasta ahora"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Escribe la longitud final en el encabezado y cierra el archivo"""
+        self._file.seek(0)
+        self._file.write(_npy_header(self.dtype, self.length))
+        self._file.close()
+
+
+def read_column(path, dtype, length):
+    """
+    Lee los primeros 'length' valores de una columna escrita con ColumnWriter
+
+    No depende del encabezado, así que sirve también para columnas que
+    nunca se cerraron.
+    """
+    values = np.fromfile(path, dtype=dtype, count=length, offset=_HEADER_SIZE)
+    if len(values) != length:
+        raise ValueError(f"La columna {path} está incompleta")
+    return values
+
+
+class StringColumnWriter:
+    def __init__(self, path):
+        """
+        Columna de texto: desplazamientos (int64) más bytes UTF-8
+
+        Args:
+            path (str): Ruta base; se crean '<path>.offsets.npy' y '<path>.data.npy'
+        """
+        self._offsets = ColumnWriter(path + '.offsets.npy', np.int64)
+        self._data = ColumnWriter(path + '.data.npy', np.uint8)
+        self._offsets.append([0])
+
+    @property
+    def length(self):
+        return self._offsets.length - 1
+
+    def append(self, values):
+        offsets, data = _encode_strings(values)
+        self._offsets.append(self._data.length + offsets[1:])
+        self._data.append(data)
+
+    def close(self):
+        self._offsets.close()
+        self._data.close()
+
+
+def _encode_strings(values):
+    """Codifica textos como (desplazamientos, bytes UTF-8)"""
+    encoded = [str(value).encode('utf-8') for value in values]
+    lengths = np.fromiter((len(item) for item in encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+def _read_strings(path, mmap_mode):
+    """Decodifica una columna de texto guardada por StringColumnWriter"""
+    offsets = np.load(path + '.offsets.npy', mmap_mode=mmap_mode)
+    data = np.load(path + '.data.npy', mmap_mode=mmap_mode)
+    return _decode_strings(offsets, data)
+
+
+def _decode_strings(offsets, data):
+    """Decodifica textos guardados como (desplazamientos, bytes UTF-8)"""
+    raw = bytes(data)
+    bounds = np.asarray(offsets).tolist()
+    values = np.empty(len(bounds) - 1, dtype=object)
+    values[:] = [raw[start:end].decode('utf-8') for start, end in zip(bounds[:-1], bounds[1:])]
+    return values
+
+
+def _is_text(values):
+    return values.dtype == object or values.dtype.kind in 'US'
+
+
+class RunWriter:
+    def __init__(self, path, quantum=None, metadata=None):
+        """
+        Crea el directorio de una ejecución y prepara la escritura por bloques
+
+        Args:
+            path (str): Directorio de la ejecución (se crea si no existe)
+            quantum (int): Quantum del diagrama de Gantt, si lo hay
+            metadata (dict): Datos adicionales serializables en JSON
+        """
+        self.path = path
+        self.quantum = quantum
+        self.metadata = metadata or {}
+        self._processes = None
+        self._process_columns = []
+        self._gantt = None
+        os.makedirs(os.path.join(path, 'processes'), exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write_processes(self, chunk):
+        """
+        Agrega un bloque de filas a la tabla de procesos
+
+        El primer bloque fija las columnas y sus tipos; los siguientes deben
+        tener las mismas columnas.
+
+        Args:
+            chunk (DataFrame): Filas de la tabla de procesos
+        """
+        if self._processes is None:
+            self._processes = {}
+            for col in chunk.columns:
+                values = chunk[col].to_numpy()
+                base = os.path.join(self.path, 'processes', col)
+                if _is_text(values):
+                    self._processes[col] = StringColumnWriter(base)
+                    self._process_columns.append({'name': col, 'kind': 'string'})
+                else:
+                    self._processes[col] = ColumnWriter(base + '.npy', values.dtype)
+                    self._process_columns.append({'name': col, 'kind': 'numeric',
+                                                  'dtype': values.dtype.str})
+        elif list(chunk.columns) != list(self._processes):
+            raise ValueError("Todos los bloques deben tener las mismas columnas")
+
+        for col, writer in self._processes.items():
+            writer.append(chunk[col].to_numpy())
+
+    def write_runs(self, owners, starts, ends, counts):
+        """
+        Agrega un bloque de tramos del diagrama de Gantt
+
+        Args:
+            owners (array): Slot (fila de la tabla de procesos) o IDLE de cada tramo
+            starts (array): Inicio de cada tramo
+            ends (array): Fin de cada tramo
+            counts (array): Piezas de cada tramo
+        """
+        if self._gantt is None:
+            os.makedirs(os.path.join(self.path, 'gantt'), exist_ok=True)
+            dtypes = (np.int64, np.asarray(starts).dtype, np.asarray(ends).dtype, np.int64)
+            self._gantt = {col: ColumnWriter(os.path.join(self.path, 'gantt', col + '.npy'), dtype)
+                           for col, dtype in zip(GANTT_COLUMNS, dtypes)}
+        for col, values in zip(GANTT_COLUMNS, (owners, starts, ends, counts)):
+            self._gantt[col].append(values)
+
+    def write_gantt(self, gantt):
+        """Agrega todos los tramos de un GanttRLE"""
+        self.write_runs(*gantt.runs())
+
+    def close(self):
+        """Cierra las columnas y escribe meta.json"""
+        n_processes = 0
+        for writer in (self._processes or {}).values():
+            writer.close()
+            n_processes = writer.length
+
+        gantt = None
+        if self._gantt is not None:
+            for writer in self._gantt.values():
+                writer.close()
+            gantt = {'quantum': self.quantum, 'n_runs': self._gantt['owner'].length}
+
+        meta = {
+            'format': 'npy',
+            'version': 1,
+            'n_processes': n_processes,
+            'processes': self._process_columns,
+            'gantt': gantt,
+            'metadata': self.metadata
+        }
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2, default=_json_default)
+
+
+def _json_default(value):
+    """Convierte escalares NumPy a tipos de Python para JSON"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"No se puede serializar {type(value).__name__}")
+
+
+def output_directory(script, argv=None):
+    """
+    Directorio donde un programa interactivo guarda sus resultados
+
+    Se toma del primer argumento de la línea de comandos, de la variable de
+    entorno SIMULADOR_SALIDA o, si no hay ninguno, del directorio del
+    script. El directorio se crea si no existe.
+
+    Args:
+        script (str): Ruta del script (normalmente __file__)
+        argv (list): Argumentos de la línea de comandos; por defecto, sys.argv[1:]
+
+    Returns:
+        str: Ruta del directorio de salida
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else os.environ.get(OUTPUT_ENV) or os.path.dirname(os.path.abspath(script))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def save_run(path, processes, gantt=None, metadata=None, format='npy'):
+    """
+    Guarda una carga (y opcionalmente sus resultados) en formato columnar
+
+    Args:
+        path (str): Directorio (formatos 'npy' y 'parquet') o archivo .npz
+        processes (DataFrame): Tabla de procesos, con o sin métricas
+        gantt (GanttRLE): Diagrama de Gantt de la ejecución
+        metadata (dict): Datos adicionales serializables en JSON
+        format (str): 'npy' (columnas con memoria mapeada), 'npz' o 'parquet'
+    """
+    quantum = gantt.quantum if gantt is not None else None
+    if format == 'npy':
+        with RunWriter(path, quantum=quantum, metadata=metadata) as writer:
+            writer.write_processes(processes)
+            if gantt is not None:
+                writer.write_gantt(gantt)
+    elif format == 'npz':
+        _save_npz(path, processes, gantt, quantum, metadata)
+    elif format == 'parquet':
+        _save_parquet(path, processes, gantt, quantum, metadata)
+    else:
+        raise ValueError(f"Formato desconocido: {format}")
+
+
+def _save_npz(path, processes, gantt, quantum, metadata):
+    arrays = {}
+    columns = []
+    for col in processes.columns:
+        values = processes[col].to_numpy()
+        if _is_text(values):
+            offsets, data = _encode_strings(values)
+            arrays[f'processes/{col}.offsets'] = offsets
+            arrays[f'processes/{col}.data'] = data
+            columns.append({'name': col, 'kind': 'string'})
+        else:
+            arrays[f'processes/{col}'] = values
+            columns.append({'name': col, 'kind': 'numeric', 'dtype': values.dtype.str})
+
+    gantt_meta = None
+    if gantt is not None:
+        for col, values in zip(GANTT_COLUMNS, gantt.runs()):
+            arrays[f'gantt/{col}'] = values
+        gantt_meta = {'quantum': quantum, 'n_runs': gantt.n_runs}
+
+    meta = {'format': 'npz', 'version': 1, 'n_processes': len(processes),
+            'processes': columns, 'gantt': gantt_meta, 'metadata': metadata or {}}
+    arrays['meta.json'] = np.frombuffer(json.dumps(meta, default=_json_default).encode('utf-8'),
+                                        dtype=np.uint8)
+    np.savez_compressed(path, **arrays)
+
+
+def _save_parquet(path, processes, gantt, quantum, metadata):
+    os.makedirs(path, exist_ok=True)
+    processes.to_parquet(os.path.join(path, 'processes.parquet'), index=False)
+    gantt_meta = None
+    if gantt is not None:
+        pd.DataFrame(dict(zip(GANTT_COLUMNS, gantt.runs()))).to_parquet(
+            os.path.join(path, 'gantt.parquet'), index=False)
+        gantt_meta = {'quantum': quantum, 'n_runs': gantt.n_runs}
+
+    meta = {'format': 'parquet', 'version': 1, 'n_processes': len(processes),
+            'processes': [{'name': col} for col in processes.columns],
+            'gantt': gantt_meta, 'metadata': metadata or {}}
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2, default=_json_default)
+
+
+def load_columns(path, mmap_mode='r'):
+    """
+    Abre las columnas de una ejecución guardada en formato 'npy'
+
+    Las columnas numéricas se devuelven como memmaps (no se leen del disco
+    hasta que se usan); las de texto se decodifican.
+
+    Args:
+        path (str): Directorio de la ejecución
+        mmap_mode (str): Modo de np.load ('r' para solo lectura, None para leer todo)
+
+    Returns:
+        tuple: (columnas de procesos, columnas de tramos o None, meta)
+    """
+    with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta['format'] != 'npy':
+        raise ValueError(f"La ejecución está en formato '{meta['format']}', no 'npy'")
+
+    columns = {}
+    for column in meta['processes']:
+        base = os.path.join(path, 'processes', column['name'])
+        if column['kind'] == 'string':
+            columns[column['name']] = _read_strings(base, mmap_mode)
+        else:
+            columns[column['name']] = np.load(base + '.npy', mmap_mode=mmap_mode)
+
+    runs = None
+    if meta['gantt'] is not None:
+        runs = {col: np.load(os.path.join(path, 'gantt', col + '.npy'), mmap_mode=mmap_mode)
+                for col in GANTT_COLUMNS}
+    return columns, runs, meta
+
+
+def load_run(path, mmap_mode='r'):
+    """
+    Carga una ejecución guardada con save_run o RunWriter
+
+    En formato 'npy' nada se copia a memoria: cada columna numérica de la
+    tabla y los tramos del diagrama de Gantt siguen mapeados sobre sus
+    archivos .npy, y solo las columnas de texto se decodifican. Con
+    mmap_mode='r' la tabla es de solo lectura ('c' permite modificarla sin
+    tocar los archivos y None la lee entera). Los formatos .npz y Parquet
+    siempre se leen completos.
+
+    Args:
+        path (str): Directorio de la ejecución o archivo .npz
+        mmap_mode (str): Modo de memoria mapeada para el formato 'npy'
+
+    Returns:
+        dict: 'processes' (DataFrame), 'gantt' (GanttRLE o None) y 'metadata'
+    """
+    if os.path.isfile(path):
+        columns, runs, meta = _load_npz(path)
+    else:
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['format'] == 'parquet':
+            columns = pd.read_parquet(os.path.join(path, 'processes.parquet'))
+            runs = None
+            if meta['gantt'] is not None:
+                frame = pd.read_parquet(os.path.join(path, 'gantt.parquet'))
+                runs = {col: frame[col].to_numpy() for col in GANTT_COLUMNS}
+        else:
+            columns, runs, meta = load_columns(path, mmap_mode)
+
+    # copy=False deja cada columna en su propio bloque sobre el memmap
+    processes = pd.DataFrame(columns, copy=False)
+    gantt = None
+    if runs is not None:
+        labels = processes['process_id'].to_numpy() if 'process_id' in processes else None
+        gantt = GanttRLE.from_runs(*(runs[col] for col in GANTT_COLUMNS),
+                                   quantum=meta['gantt']['quantum'], labels=labels)
+    return {'processes': processes, 'gantt': gantt, 'metadata': meta['metadata']}
+
+
+def _load_npz(path):
+    with np.load(path) as archive:
+        meta = json.loads(archive['meta.json'].tobytes().decode('utf-8'))
+        columns = {}
+        for column in meta['processes']:
+            key = f"processes/{column['name']}"
+            if column['kind'] == 'string':
+                columns[column['name']] = _decode_strings(archive[key + '.offsets'],
+                                                          archive[key + '.data'])
+            else:
+                columns[column['name']] = archive[key]
+        runs = None
+        if meta['gantt'] is not None:
+            runs = {col: archive[f'gantt/{col}'] for col in GANTT_COLUMNS}
+    return columns, runs, meta
@@ -0,0 +1,151 @@
+"""
+Barrido de quantums de Round Robin en paralelo
+
+Ejecuta la misma carga de trabajo con varios valores de quantum en un pool
+de procesos. Los arreglos de la carga se publican una sola vez en memoria
+compartida y cada proceso trabajador los lee desde ahí, en lugar de recibir
+una copia serializada con cada tarea.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from cargas import read_workload, merge_sorted
+from motores import RoundRobinEngine
+
+# Columnas de la tabla de resultados, en orden
+SWEEP_COLUMNS = ['quantum', 'avg_waiting_time', 'avg_turnaround_time',
+                 'avg_response_time', 'context_switches', 'total_time']
+
+# Arreglos de la carga y bloques de memoria compartida de cada trabajador
+_WORKLOAD = {}
+_BLOCKS = []
+
+
+def share_arrays(arrays):
+    """
+    Copia arreglos a bloques nuevos de memoria compartida
+
+    Los bloques se liberan con release_arrays cuando los trabajadores terminan.
+
+    Args:
+        arrays (dict): Nombre -> arreglo NumPy
+
+    Returns:
+        tuple: (bloques creados, descripción de cada arreglo para adjuntarlo)
+    """
+    blocks = []
+    specs = {}
+    for key, values in arrays.items():
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        blocks.append(block)
+        specs[key] = (block.name, values.shape, values.dtype.str)
+    return blocks, specs
+
+
+def attach_arrays(specs):
+    """
+    Inicializador de los trabajadores: abre la carga en memoria compartida
+
+    Los arreglos quedan de solo lectura y se obtienen con shared_workload().
+    """
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        values = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        values.flags.writeable = False
+        _BLOCKS.append(block)
+        _WORKLOAD[key] = values
+
+
+def shared_workload():
+    """Arreglos adjuntados por attach_arrays en este trabajador (nombre -> arreglo)"""
+    return _WORKLOAD
+
+
+def release_arrays(blocks):
+    """Cierra y elimina los bloques creados por share_arrays"""
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _run_quantum(quantum, workload=None):
+    """
+    Simula la carga con un quantum y resume sus métricas
+
+    Args:
+        quantum (int): Quantum a simular
+        workload (dict): Arreglos 'arrival_time' y 'burst_time'; por defecto,
+                         la carga adjuntada desde memoria compartida
+
+    Returns:
+        dict: Una fila de la tabla de resultados
+    """
+    workload = _WORKLOAD if workload is None else workload
+    engine = RoundRobinEngine(workload['arrival_time'], workload['burst_time'], quantum)
+    engine.run()
+
+    # Mismas métricas que PlanificadorCompleto: los procesos que no
+    # terminaron (o nunca se ejecutaron) cuentan con 0
+    terminated = engine.terminated_mask()
+    started = engine.first_response != -1
+    turnaround = np.where(terminated, engine.completion - engine.arrival, 0)
+    waiting = np.where(terminated, turnaround - engine.burst, 0)
+    response = np.where(started, engine.first_response - engine.arrival, 0)
+
+    return {
+        'quantum': quantum,
+        'avg_waiting_time': waiting.mean(),
+        'avg_turnaround_time': turnaround.mean(),
+        'avg_response_time': response.mean(),
+        'context_switches': engine.timeline.context_switches(),
+        'total_time': engine.current_time
+    }
+
+
+def sweep_quantum(workload, quanta, workers=None):
+    """
+    Simula Round Robin con cada quantum de la lista y compara las métricas
+
+    Args:
+        workload (DataFrame | dict): Procesos con 'process_id', 'arrival_time'
+                                     y 'burst_time'
+        quanta (iterable): Valores de quantum a simular
+        workers (int): Procesos trabajadores; por defecto, uno por núcleo.
+                       Con 1 se simula todo en el proceso actual
+
+    Returns:
+        DataFrame: Una fila por quantum con 'quantum', 'avg_waiting_time',
+                   'avg_turnaround_time', 'avg_response_time',
+                   'context_switches' y 'total_time'
+
+    Raises:
+        ValueError: Si la carga no es válida o algún quantum no es positivo
+    """
+    quanta = list(quanta)
+    if any(quantum <= 0 for quantum in quanta):
+        raise ValueError("Todos los quantums deben ser positivos")
+
+    # Misma tabla ordenada (y mismos slots) que usan los simuladores
+    columns = read_workload(workload)
+    table = merge_sorted(pd.DataFrame(), pd.DataFrame(columns))
+    arrays = {col: table[col].to_numpy() for col in ('arrival_time', 'burst_time')}
+
+    workers = min(workers or os.cpu_count() or 1, max(len(quanta), 1))
+    if workers == 1:
+        rows = [_run_quantum(quantum, arrays) for quantum in quanta]
+        return pd.DataFrame(rows, columns=SWEEP_COLUMNS)
+
+    blocks, specs = share_arrays(arrays)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_arrays,
+                                 initargs=(specs,)) as executor:
+            rows = list(executor.map(_run_quantum, quanta))
+    finally:
+        release_arrays(blocks)
+
+    return pd.DataFrame(rows, columns=SWEEP_COLUMNS)
@@ -0,0 +1,78 @@
+"""
+Lectura y validación de cargas de trabajo (conjuntos de procesos)
+"""
+import numpy as np
+import pandas as pd
+
+# Columnas que toda carga de trabajo debe incluir
+REQUIRED_COLUMNS = ('process_id', 'arrival_time', 'burst_time')
+
+
+def read_workload(data, optional=None):
+    """
+    Valida una carga de trabajo y extrae sus columnas como arreglos
+
+    Args:
+        data (DataFrame | dict): Tabla o diccionario de arreglos con las columnas
+                                 'process_id', 'arrival_time' y 'burst_time'
+        optional (dict): Columnas numéricas opcionales y su valor por defecto
+
+    Returns:
+        dict: Columna -> arreglo NumPy, todas con la misma longitud
+
+    Raises:
+        ValueError: Si faltan columnas o los valores no son válidos
+    """
+    optional = optional or {}
+    if not isinstance(data, (pd.DataFrame, dict)):
+        raise ValueError("La carga de trabajo debe ser un DataFrame o un diccionario de arreglos")
+
+    missing = [col for col in REQUIRED_COLUMNS if col not in data]
+    if missing:
+        raise ValueError(f"Faltan columnas en la carga de trabajo: {', '.join(missing)}")
+
+    columns = {}
+    for col in REQUIRED_COLUMNS:
+        values = data[col]
+        columns[col] = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+
+    n = len(columns['process_id'])
+    for col, default in optional.items():
+        if col in data:
+            values = data[col]
+            columns[col] = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+        else:
+            columns[col] = np.full(n, default)
+
+    for col, values in columns.items():
+        if values.ndim != 1 or len(values) != n:
+            raise ValueError(f"La columna '{col}' debe ser unidimensional y de longitud {n}")
+        if col == 'process_id':
+            continue
+        if values.dtype == bool or not np.issubdtype(values.dtype, np.number):
+            raise ValueError(f"La columna '{col}' debe ser numérica")
+        if np.issubdtype(values.dtype, np.floating) and np.isnan(values).any():
+            raise ValueError(f"La columna '{col}' contiene valores vacíos")
+
+    if (columns['arrival_time'] < 0).any():
+        raise ValueError("Los tiempos de llegada no pueden ser negativos")
+    if (columns['burst_time'] < 0).any():
+        raise ValueError("Los tiempos de ráfaga no pueden ser negativos")
+
+    return columns
+
+
+def merge_sorted(current, new_processes):
+    """
+    Une la tabla actual con procesos nuevos y ordena una sola vez
+
+    Args:
+        current (DataFrame): Tabla de procesos existente (puede estar vacía)
+        new_processes (DataFrame): Procesos a agregar
+
+    Returns:
+        DataFrame: Tabla ordenada por tiempo de llegada e ID de proceso
+    """
+    if not current.empty:
+        new_processes = pd.concat([current, new_processes], ignore_index=True)
+    return new_processes.sort_values(by=['arrival_time', 'process_id']).reset_index(drop=True)
@@ -0,0 +1,54 @@
+"""
+Columnas NumPy de solo agregado usadas por los registros de la simulación
+"""
+import numpy as np
+
+
+class GrowableArray:
+    """Arreglo append-only respaldado por un buffer NumPy que crece al doble"""
+
+    def __init__(self, dtype, capacity=1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def from_array(cls, values):
+        """
+        Envuelve un arreglo existente (por ejemplo, un memmap) sin copiarlo
+
+        El arreglo queda lleno: el primer append lo copia a un buffer nuevo,
+        de modo que el original nunca se modifica.
+        """
+        column = cls.__new__(cls)
+        column._data = values
+        column._size = len(values)
+        return column
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        if self._size == len(self._data):
+            self._grow(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        end = self._size + len(values)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size:end] = values
+        self._size = end
+
+    def _grow(self, minimum):
+        data = np.empty(max(minimum, 2 * len(self._data)), dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def view(self):
+        """Vista de los valores registrados (sin copiar)"""
+        return self._data[:self._size]
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
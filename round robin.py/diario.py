@@ -0,0 +1,213 @@
+"""
+Diario de estados de la simulación
+
+En lugar de guardar una copia completa de la tabla de procesos en cada
+paso, el diario registra solo lo que cambia (tiempo, slot, tiempo restante
+y estado) en columnas que crecen por bloques. La tabla de cualquier paso
+se reconstruye bajo demanda a partir de la tabla inicial.
+"""
+import numpy as np
+
+from columnas import GrowableArray
+from motores import NEW, TERMINATED, STATE_NAMES, RoundBatch
+
+
+class StatusJournal:
+    def __init__(self, base, time_dtype):
+        """
+        Inicializa un diario vacío
+
+        Args:
+            base (DataFrame): Tabla de procesos al inicio de la simulación,
+                              ordenada igual que los slots del motor
+            time_dtype: Tipo de dato de los tiempos de la simulación
+        """
+        self.base = base
+        self.burst = base['burst_time'].to_numpy()
+        self.steps = 0
+
+        self._step = GrowableArray(np.int64)
+        self._time = GrowableArray(time_dtype)
+        self._slot = GrowableArray(np.int64)
+        self._remaining = GrowableArray(time_dtype)
+        self._state = GrowableArray(np.int8)
+
+        # Rondas aplicadas en bloque: primer paso y campos de cada RoundBatch.
+        # Los órdenes de cola se concatenan; _batch_order_end marca el fin de cada uno.
+        self._batch_step = GrowableArray(np.int64)
+        self._batch_start = GrowableArray(time_dtype)
+        self._batch_end = GrowableArray(time_dtype)
+        self._batch_rounds = GrowableArray(np.int64)
+        self._batch_quantum = GrowableArray(np.int64)
+        self._batch_order_end = GrowableArray(np.int64)
+        self._batch_order = GrowableArray(np.int64)
+
+    def rebase(self, base):
+        """
+        Cambia la tabla inicial después de agregar procesos que aún no llegan
+
+        Las filas ya registradas en el diario deben conservar su posición.
+
+        Args:
+            base (DataFrame): Nueva tabla de procesos inicial
+        """
+        self.base = base
+        self.burst = base['burst_time'].to_numpy()
+
+    def record(self, time, slot, remaining, state):
+        """Registra un cambio ocurrido durante el paso actual"""
+        self._step.append(self.steps)
+        self._time.append(time)
+        self._slot.append(slot)
+        self._remaining.append(remaining)
+        self._state.append(state)
+
+    def end_step(self, time, slot, remaining, state):
+        """Registra el estado del proceso despachado y cierra el paso"""
+        self.record(time, slot, remaining, state)
+        self.steps += 1
+
+    def record_batch(self, batch, remaining, state):
+        """
+        Registra un bloque de rondas completas
+
+        Args:
+            batch (RoundBatch): Rondas aplicadas por el motor
+            remaining (array): Tiempos restantes de todos los slots al terminar
+            state (array): Estados de todos los slots al terminar
+        """
+        self._batch_step.append(self.steps)
+        self._batch_start.append(batch.start)
+        self._batch_end.append(batch.end)
+        self._batch_rounds.append(batch.rounds)
+        self._batch_quantum.append(batch.quantum)
+        self._batch_order.extend(batch.order)
+        self._batch_order_end.append(len(self._batch_order))
+        self.steps += len(batch.order) * batch.rounds
+
+        # Estado final de los slots del bloque, visible desde su último paso
+        slots = np.unique(batch.order)
+        self._step.extend(np.full(len(slots), self.steps - 1))
+        self._time.extend(np.full(len(slots), batch.end))
+        self._slot.extend(slots)
+        self._remaining.extend(remaining[slots])
+        self._state.extend(state[slots])
+
+    def __len__(self):
+        return self.steps
+
+    def __getitem__(self, step):
+        return self.frame(step)
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por las columnas del diario"""
+        return sum(column.nbytes for column in self.log_columns().values())
+
+    def log_columns(self):
+        """Columnas de solo agregado del diario, para guardarlas por partes"""
+        return {
+            'step': self._step, 'time': self._time, 'slot': self._slot,
+            'remaining': self._remaining, 'state': self._state,
+            'batch_step': self._batch_step, 'batch_start': self._batch_start,
+            'batch_end': self._batch_end, 'batch_rounds': self._batch_rounds,
+            'batch_quantum': self._batch_quantum, 'batch_order_end': self._batch_order_end,
+            'batch_order': self._batch_order
+        }
+
+    def restore(self, columns, steps):
+        """
+        Reemplaza el contenido del diario por columnas guardadas
+
+        Args:
+            columns (dict): Nombre -> arreglo, con las claves de log_columns()
+            steps (int): Número de pasos registrados
+        """
+        for name, values in columns.items():
+            setattr(self, '_' + name, GrowableArray.from_array(values))
+        self.steps = steps
+
+    def _batch(self, index):
+        """Reconstruye el RoundBatch registrado en la posición 'index'"""
+        order_end = self._batch_order_end.view()
+        order_start = order_end[index - 1] if index > 0 else 0
+        return RoundBatch(self._batch_order.view()[order_start:order_end[index]],
+                          self._batch_start.view()[index], self._batch_end.view()[index],
+                          int(self._batch_rounds.view()[index]),
+                          int(self._batch_quantum.view()[index]))
+
+    def frame(self, step):
+        """
+        Reconstruye la tabla de procesos tal como quedó al final de un paso
+
+        Args:
+            step (int): Índice del paso (se admiten índices negativos)
+
+        Returns:
+            DataFrame: Tabla de procesos con la columna adicional 'current_time'
+        """
+        if step < 0:
+            step += self.steps
+        if not 0 <= step < self.steps:
+            raise IndexError("Paso fuera de rango")
+
+        # Si el paso cae dentro de un bloque de rondas, se reconstruye el
+        # inicio del bloque y luego se aplican los quantums ya ejecutados
+        batch = None
+        pos = np.searchsorted(self._batch_step.view(), step, side='right') - 1
+        if pos >= 0:
+            first_step = self._batch_step.view()[pos]
+            candidate = self._batch(pos)
+            if step < first_step + len(candidate.order) * candidate.rounds:
+                batch = candidate
+                limit = np.searchsorted(self._step.view(), first_step - 1, side='right')
+        if batch is None:
+            limit = np.searchsorted(self._step.view(), step, side='right')
+
+        times = self._time.view()[:limit]
+        slots = self._slot.view()[:limit]
+        remaining_log = self._remaining.view()[:limit]
+        state_log = self._state.view()[:limit]
+
+        n = len(self.base)
+        remaining = self.burst.astype(remaining_log.dtype, copy=True)
+        state = np.full(n, NEW, dtype=np.int8)
+        completion = self.base['completion_time'].to_numpy().copy()
+        first_response = np.full(n, -1, dtype=remaining_log.dtype)
+
+        # La última entrada de cada slot define su estado
+        reversed_slots, reversed_index = np.unique(slots[::-1], return_index=True)
+        last = limit - 1 - reversed_index
+        remaining[reversed_slots] = remaining_log[last]
+        state[reversed_slots] = state_log[last]
+        finished = state_log[last] == TERMINATED
+        completion[reversed_slots[finished]] = times[last[finished]]
+
+        # La primera entrada con ejecución marca la primera respuesta
+        executed = remaining_log < self.burst[slots]
+        run_slots, run_index = np.unique(slots[executed], return_index=True)
+        first_end = times[executed][run_index]
+        first_run = remaining_log[executed][run_index]
+        first_response[run_slots] = first_end - (self.burst[run_slots] - first_run)
+
+        if batch is not None:
+            done = step - first_step + 1
+            full_rounds, partial = divmod(done, len(batch.order))
+            np.subtract.at(remaining, batch.order, batch.quantum * full_rounds)
+            np.subtract.at(remaining, batch.order[:partial], batch.quantum)
+            current_time = batch.start + done * batch.quantum
+        else:
+            current_time = times[-1]
+
+        terminated = state == TERMINATED
+        turnaround = completion - self.base['arrival_time'].to_numpy()
+
+        status = self.base.copy()
+        status['remaining_time'] = remaining
+        status['completion_time'] = completion
+        status['waiting_time'] = np.where(terminated, turnaround - self.burst, status['waiting_time'])
+        status['turnaround_time'] = np.where(terminated, turnaround, status['turnaround_time'])
+        status['first_response'] = first_response
+        status['state'] = STATE_NAMES[state]
+        status['current_time'] = current_time
+        return status
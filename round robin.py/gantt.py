@@ -0,0 +1,371 @@
+"""
+Diagrama de Gantt codificado por tramos (run-length)
+
+Los intervalos contiguos de un mismo dueño se fusionan en un solo tramo,
+guardado en arreglos paralelos (dueño, inicio, fin, piezas). Con quantum,
+un tramo está formado por piezas de un quantum seguidas de una última
+pieza con el resto, de modo que siempre se puede expandir de nuevo a
+intervalos de un quantum para quien necesite ese detalle. Sin quantum
+(algoritmos sin rebanadas de tiempo), los intervalos contiguos se unen en
+uno solo y cada tramo cuenta como una pieza.
+
+Los simuladores devuelven 'execution_sequence' y 'gantt_data' como vistas
+SliceView de solo lectura sobre el diagrama, no como listas: se recorren,
+se indexan y se comparan igual, pero para modificarlas hay que copiarlas
+antes con copy() o list().
+"""
+from collections.abc import Sequence
+
+import numpy as np
+
+from columnas import GrowableArray
+
+# Dueño y etiqueta de los tramos en los que la CPU está inactiva
+IDLE = -1
+IDLE_LABEL = 'IDLE'
+
+
+class GanttRLE:
+    def __init__(self, quantum=None, labels=None, time_dtype=np.int64):
+        """
+        Inicializa un diagrama de Gantt vacío
+
+        Args:
+            quantum (int): Duración de una pieza completa. Sin quantum, los
+                           intervalos contiguos de un dueño se unen en uno
+            labels (array): ID de proceso de cada slot, para nombrar los tramos
+            time_dtype: Tipo de dato de los tiempos
+        """
+        self.quantum = quantum
+        self.labels = None if labels is None else np.asarray(labels)
+        self.n_slices = 0
+
+        self._owner = GrowableArray(np.int64)
+        self._start = GrowableArray(time_dtype)
+        self._end = GrowableArray(time_dtype)
+        self._count = GrowableArray(np.int64)
+
+        # Último tramo, que todavía puede crecer: [dueño, inicio, fin, piezas]
+        self._open = None
+
+    @classmethod
+    def from_runs(cls, owners, starts, ends, counts, quantum=None, labels=None):
+        """
+        Reconstruye un diagrama a partir de sus tramos, sin copiarlos ni fusionarlos
+
+        Args:
+            owners (array): Dueño de cada tramo
+            starts (array): Inicio de cada tramo
+            ends (array): Fin de cada tramo
+            counts (array): Piezas de cada tramo
+            quantum (int): Duración de una pieza completa
+            labels (array): ID de proceso de cada slot
+
+        Returns:
+            GanttRLE: Diagrama con esos tramos (el último queda cerrado)
+        """
+        gantt = cls(quantum=quantum, labels=labels, time_dtype=np.asarray(starts).dtype)
+        gantt._owner = GrowableArray.from_array(owners)
+        gantt._start = GrowableArray.from_array(starts)
+        gantt._end = GrowableArray.from_array(ends)
+        gantt._count = GrowableArray.from_array(counts)
+        gantt.n_slices = int(np.sum(counts))
+        return gantt
+
+    def _is_full(self, start, end, count):
+        """True si el tramo puede crecer: solo tiene piezas de un quantum, o no hay quantum"""
+        return self.quantum is None or end - start == count * self.quantum
+
+    def _close(self):
+        """Pasa el tramo abierto a las columnas"""
+        owner, start, end, count = self._open
+        self._owner.append(owner)
+        self._start.append(start)
+        self._end.append(end)
+        self._count.append(count)
+        self._open = None
+
+    def append(self, owner, start, end):
+        """
+        Agrega un intervalo, fusionándolo con el tramo anterior si es posible
+
+        Args:
+            owner (int): Slot del proceso o IDLE
+            start: Inicio del intervalo
+            end: Fin del intervalo
+        """
+        run = self._open
+        if run is not None:
+            if run[0] == owner and run[2] == start and self._is_full(run[1], run[2], run[3]):
+                run[2] = end
+                if self.quantum is not None:
+                    run[3] += 1
+                    self.n_slices += 1
+                return
+            self._close()
+        self._open = [owner, start, end, 1]
+        self.n_slices += 1
+
+    def extend(self, owners, starts, ends, counts=None):
+        """
+        Agrega varios intervalos (o tramos) fusionando los contiguos
+
+        Args:
+            owners (array): Dueño de cada tramo
+            starts (array): Inicio de cada tramo
+            ends (array): Fin de cada tramo
+            counts (array): Piezas de cada tramo (por defecto, una; sin
+                            quantum se ignora y cada tramo es una pieza)
+        """
+        if len(owners) == 0:
+            return
+        owners = np.asarray(owners, dtype=np.int64)
+        starts = np.asarray(starts)
+        ends = np.asarray(ends)
+        if counts is None or self.quantum is None:
+            counts = np.ones(len(owners), dtype=np.int64)
+        else:
+            counts = np.asarray(counts, dtype=np.int64)
+
+        if self._open is not None:
+            # El tramo abierto se vuelve a contar junto con los nuevos
+            owner, start, end, count = self._open
+            self._open = None
+            self.n_slices -= count
+            owners = np.concatenate(([owner], owners))
+            starts = np.concatenate(([start], starts))
+            ends = np.concatenate(([end], ends))
+            counts = np.concatenate(([count], counts))
+
+        # Un tramo se fusiona con el anterior si es del mismo dueño, empieza
+        # donde el anterior termina y el anterior puede crecer (ver _is_full)
+        if self.quantum is not None:
+            full = ends - starts == counts * self.quantum
+        else:
+            full = np.ones(len(owners), dtype=bool)
+        merge = np.zeros(len(owners), dtype=bool)
+        merge[1:] = (owners[1:] == owners[:-1]) & (starts[1:] == ends[:-1]) & full[:-1]
+
+        first = np.flatnonzero(~merge)
+        last = np.append(first[1:] - 1, len(owners) - 1)
+        counts = np.add.reduceat(counts, first) if self.quantum is not None else counts[first]
+        owners, starts, ends = owners[first], starts[first], ends[last]
+        self.n_slices += int(counts.sum())
+
+        self._owner.extend(owners[:-1])
+        self._start.extend(starts[:-1])
+        self._end.extend(ends[:-1])
+        self._count.extend(counts[:-1])
+        self._open = [owners[-1].item(), starts[-1].item(), ends[-1].item(), int(counts[-1])]
+
+    def extend_rounds(self, batch):
+        """
+        Agrega un bloque de rondas completas sin expandirlo a quantums
+
+        Args:
+            batch (RoundBatch): Rondas aplicadas por el motor Round Robin
+        """
+        order = batch.order
+        size = len(order)
+
+        # Tramos dentro del patrón de una ronda
+        first = np.flatnonzero(np.append(True, order[1:] != order[:-1]))
+        pattern_owner = order[first]
+        pattern_count = np.diff(np.append(first, size))
+
+        if len(first) == 1:
+            # Un solo dueño: todas las rondas forman un único tramo
+            self.extend(pattern_owner, [batch.start], [batch.end], [size * batch.rounds])
+            return
+
+        offsets = (np.arange(batch.rounds)[:, None] * size + first[None, :]).ravel()
+        counts = np.tile(pattern_count, batch.rounds)
+        starts = batch.start + offsets * batch.quantum
+        self.extend(np.tile(pattern_owner, batch.rounds), starts, starts + counts * batch.quantum, counts)
+
+    @property
+    def n_runs(self):
+        """Número de tramos"""
+        return len(self._owner) + (self._open is not None)
+
+    def runs(self):
+        """
+        Devuelve los tramos como arreglos paralelos
+
+        Returns:
+            tuple: (dueños, inicios, fines, piezas)
+        """
+        columns = [self._owner.view(), self._start.view(), self._end.view(), self._count.view()]
+        if self._open is not None:
+            columns = [np.append(column, value) for column, value in zip(columns, self._open)]
+        return tuple(columns)
+
+    def names(self, owners):
+        """Convierte dueños (slots o IDLE) en IDs de proceso"""
+        if self.labels is None:
+            return owners
+        names = self.labels[np.maximum(owners, 0)].astype(object)
+        names[owners == IDLE] = IDLE_LABEL
+        return names
+
+    def context_switches(self):
+        """
+        Cuenta los cambios de contexto entre procesos
+
+        Un cambio ocurre cada vez que la CPU pasa a ejecutar un proceso
+        distinto del último que ejecutó; el tiempo ocioso y los intervalos
+        vacíos no cuentan.
+
+        Returns:
+            int: Número de cambios de contexto
+        """
+        owners, starts, ends, _ = self.runs()
+        owners = owners[(owners != IDLE) & (ends > starts)]
+        return int(np.count_nonzero(owners[1:] != owners[:-1]))
+
+    def iter_runs(self):
+        """Genera los tramos como tuplas (process_id, inicio, fin)"""
+        owners, starts, ends, _ = self.runs()
+        return zip(self.names(owners), starts.tolist(), ends.tolist())
+
+    def expand(self):
+        """
+        Expande los tramos a sus piezas originales
+
+        Returns:
+            tuple: (dueños, inicios, fines), un elemento por intervalo
+        """
+        owners, starts, ends, counts = self.runs()
+        run_end = np.cumsum(counts)
+        piece = np.arange(self.n_slices) - np.repeat(run_end - counts, counts)
+        quantum = self.quantum or 0
+
+        piece_start = np.repeat(starts, counts) + piece * quantum
+        piece_end = piece_start + quantum
+        piece_end[run_end - 1] = ends
+        return np.repeat(owners, counts), piece_start, piece_end
+
+    def records(self):
+        """Vista de los intervalos como diccionarios {'process', 'start', 'end'}"""
+        return SliceView(self, as_records=True)
+
+    def sequence(self, include_idle=True):
+        """Vista de los intervalos como tuplas (process_id, inicio, fin)"""
+        return SliceView(self, include_idle=include_idle)
+
+    def to_frame(self):
+        """
+        Tabla con un tramo por fila
+
+        Returns:
+            DataFrame: Columnas 'process', 'start', 'end' y 'slices'
+        """
+        import pandas as pd
+
+        owners, starts, ends, counts = self.runs()
+        return pd.DataFrame({'process': self.names(owners), 'start': starts,
+                             'end': ends, 'slices': counts})
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por las columnas de tramos"""
+        return sum(column.nbytes for column in self.log_columns().values())
+
+    @property
+    def open_run(self):
+        """Último tramo, que todavía puede crecer: [dueño, inicio, fin, piezas] o None"""
+        return None if self._open is None else list(self._open)
+
+    def log_columns(self):
+        """Columnas de solo agregado de los tramos cerrados, para guardarlas por partes"""
+        return {'owner': self._owner, 'start': self._start, 'end': self._end, 'count': self._count}
+
+    def restore(self, columns, open_run, n_slices):
+        """
+        Reemplaza el contenido del diagrama por tramos guardados
+
+        Args:
+            columns (dict): Nombre -> arreglo, con las claves de log_columns()
+            open_run (list): Último tramo [dueño, inicio, fin, piezas], o None
+            n_slices (int): Número total de intervalos
+        """
+        for name, values in columns.items():
+            setattr(self, '_' + name, GrowableArray.from_array(values))
+        self._open = None if open_run is None else list(open_run)
+        self.n_slices = n_slices
+
+
+class SliceView(Sequence):
+    """
+    Vista de solo lectura de un GanttRLE, intervalo por intervalo
+
+    Admite lo que no modifica la lista de intervalos de siempre (iteración,
+    len, índices, comparación, copy() y +), generando cada elemento al vuelo
+    a partir de los tramos. No tiene append ni extend: copy() o list()
+    devuelven una lista independiente para quien necesite modificarla.
+    """
+
+    def __init__(self, gantt, as_records=False, include_idle=True):
+        self.gantt = gantt
+        self.as_records = as_records
+        self.include_idle = include_idle
+        self._expanded = None
+
+    def _item(self, name, start, end):
+        if self.as_records:
+            return {'process': name, 'start': start, 'end': end}
+        return (name, start, end)
+
+    def __iter__(self):
+        gantt = self.gantt
+        owners, starts, ends, counts = gantt.runs()
+        if not self.include_idle:
+            keep = owners != IDLE
+            owners, starts, ends, counts = owners[keep], starts[keep], ends[keep], counts[keep]
+        quantum = gantt.quantum
+        for name, start, end, count in zip(gantt.names(owners), starts.tolist(),
+                                           ends.tolist(), counts.tolist()):
+            for _ in range(count - 1):
+                yield self._item(name, start, start + quantum)
+                start += quantum
+            yield self._item(name, start, end)
+
+    def __len__(self):
+        owners, _, _, counts = self.gantt.runs()
+        if not self.include_idle:
+            counts = counts[owners != IDLE]
+        return int(counts.sum())
+
+    def __getitem__(self, index):
+        if self._expanded is None:
+            owners, starts, ends = self.gantt.expand()
+            if not self.include_idle:
+                keep = owners != IDLE
+                owners, starts, ends = owners[keep], starts[keep], ends[keep]
+            self._expanded = (self.gantt.names(owners), starts, ends)
+        names, starts, ends = self._expanded
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(names)))]
+        return self._item(names[index], starts[index].item(), ends[index].item())
+
+    def copy(self):
+        """Lista con todos los intervalos, independiente del diagrama"""
+        return list(self)
+
+    def __add__(self, other):
+        if not isinstance(other, (list, SliceView)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return repr(list(self))
@@ -0,0 +1,366 @@
+"""
+Generador de cargas de trabajo sintéticas por bloques
+
+La línea de tiempo se divide en ventanas de duración fija y cada ventana
+produce un bloque (DataFrame) con los procesos que llegan en ella. Cada
+bloque usa su propio flujo aleatorio, derivado con SeedSequence a partir
+de la semilla y del índice del bloque, de modo que cualquier bloque se
+puede generar por separado (por ejemplo, en paralelo) y siempre sale igual.
+
+Los IDs de proceso también salen de la ventana ('P<ventana>-<posición>'),
+así que los bloques generados por separado se pueden unir sin renumerarlos.
+
+Procesos de llegada: PoissonArrivals, MMPPArrivals (ráfagas) y
+DiurnalArrivals (ciclo diario). Distribuciones de ráfaga:
+ExponentialBursts, ParetoBursts y BimodalBursts.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _check_positive(value, message):
+    """Lanza ValueError con 'message' si value no es un número positivo y finito"""
+    if not np.isfinite(value) or value <= 0:
+        raise ValueError(message)
+
+
+def _uniform_times(rng, starts, lengths, rates):
+    """
+    Llegadas de Poisson homogéneas en varios segmentos
+
+    Args:
+        rng (Generator): Flujo aleatorio
+        starts (array): Inicio de cada segmento
+        lengths (array): Duración de cada segmento
+        rates (array): Tasa de llegadas de cada segmento
+
+    Returns:
+        ndarray: Tiempos de llegada ordenados
+    """
+    counts = rng.poisson(np.asarray(rates) * np.asarray(lengths))
+    offsets = rng.random(int(counts.sum())) * np.repeat(lengths, counts)
+    return np.sort(np.repeat(starts, counts) + offsets)
+
+
+class PoissonArrivals:
+    def __init__(self, rate):
+        """
+        Llegadas de Poisson con tasa constante
+
+        Args:
+            rate (float): Llegadas esperadas por unidad de tiempo
+
+        Raises:
+            ValueError: Si la tasa no es positiva y finita
+        """
+        _check_positive(rate, "La tasa de llegadas debe ser positiva")
+        self.rate = rate
+
+    def sample(self, rng, start, end, control):
+        """Tiempos de llegada ordenados en [start, end)"""
+        return _uniform_times(rng, [start], [end - start], [self.rate])
+
+
+class MMPPArrivals:
+    def __init__(self, rates, switch_rates):
+        """
+        Llegadas moduladas por una cadena de Markov (MMPP), para cargas en ráfagas
+
+        La cadena recorre los estados en orden cíclico; en el estado i las
+        llegadas son de Poisson con tasa rates[i] y el estado dura un tiempo
+        exponencial de tasa switch_rates[i].
+
+        Args:
+            rates (sequence): Tasa de llegadas de cada estado
+            switch_rates (sequence): Tasa de salida de cada estado
+
+        Raises:
+            ValueError: Si no hay estados, las longitudes no coinciden o
+                        alguna tasa no es positiva y finita
+        """
+        self.rates = np.asarray(rates, dtype=np.float64)
+        self.switch_rates = np.asarray(switch_rates, dtype=np.float64)
+        if self.rates.ndim != 1 or len(self.rates) != len(self.switch_rates):
+            raise ValueError("rates y switch_rates deben tener la misma longitud")
+        if len(self.rates) == 0:
+            raise ValueError("La cadena debe tener al menos un estado")
+        for values in (self.rates, self.switch_rates):
+            if not np.isfinite(values).all() or (values <= 0).any():
+                raise ValueError("Las tasas deben ser positivas")
+
+        # Tramo de la trayectoria de la cadena que cubre la última ventana:
+        # _switch_times[k] es el inicio del estado número _first_state + k
+        self._control = None
+        self._first_state = 0
+        self._switch_times = np.zeros(1)
+
+    def _extend_path(self, control, start, end):
+        """
+        Genera los cambios de estado de la cadena que cubren [start, end)
+
+        Solo se conservan los cambios desde el estado vigente en 'start', de
+        modo que la memoria no crece con el horizonte. Si se pide una ventana
+        anterior, la trayectoria se vuelve a generar desde el principio con
+        el mismo flujo de control, así que siempre sale igual.
+        """
+        if self._control is not control or start < self._switch_times[0]:
+            self._control = control
+            self._rng = np.random.default_rng(control)
+            self._first_state = 0
+            self._switch_times = np.zeros(1)
+
+        block = 1024
+        while True:
+            # Descartar los estados que terminaron antes de la ventana
+            first = int(np.searchsorted(self._switch_times, start, side='right')) - 1
+            if first > 0:
+                self._first_state += first
+                self._switch_times = self._switch_times[first:]
+            if self._switch_times[-1] > end:
+                break
+            done = self._first_state + len(self._switch_times) - 1
+            states = np.arange(done, done + block) % len(self.rates)
+            holding = self._rng.standard_exponential(block) / self.switch_rates[states]
+            self._switch_times = np.concatenate(
+                (self._switch_times, self._switch_times[-1] + np.cumsum(holding)))
+
+    def sample(self, rng, start, end, control):
+        """Tiempos de llegada ordenados en [start, end)"""
+        self._extend_path(control, start, end)
+        switch_times = self._switch_times
+
+        # Segmentos de estado constante que se cruzan con la ventana
+        last = np.searchsorted(switch_times, end, side='left')
+        segment_start = np.maximum(switch_times[:last], start)
+        segment_end = np.minimum(switch_times[1:last + 1], end)
+        states = np.arange(self._first_state, self._first_state + last) % len(self.rates)
+        return _uniform_times(rng, segment_start, segment_end - segment_start, self.rates[states])
+
+
+class DiurnalArrivals:
+    def __init__(self, base_rate, amplitude=0.5, period=1440, phase=0):
+        """
+        Llegadas de Poisson con tasa sinusoidal (ciclo diario)
+
+        La tasa es base_rate * (1 + amplitude * sin(2π (t - phase) / period)).
+
+        Args:
+            base_rate (float): Tasa media de llegadas
+            amplitude (float): Amplitud relativa del ciclo, entre 0 y 1
+            period (float): Duración de un ciclo
+            phase (float): Desplazamiento del ciclo
+
+        Raises:
+            ValueError: Si la tasa o el período no son positivos y finitos, o
+                        la amplitud no está entre 0 y 1
+        """
+        _check_positive(base_rate, "La tasa de llegadas debe ser positiva")
+        _check_positive(period, "El período debe ser positivo")
+        if not 0 <= amplitude <= 1:
+            raise ValueError("La amplitud debe estar entre 0 y 1")
+        self.base_rate = base_rate
+        self.amplitude = amplitude
+        self.period = period
+        self.phase = phase
+
+    def rate(self, times):
+        """Tasa de llegadas en cada instante"""
+        angle = 2 * np.pi * (np.asarray(times) - self.phase) / self.period
+        return self.base_rate * (1 + self.amplitude * np.sin(angle))
+
+    def sample(self, rng, start, end, control):
+        """Tiempos de llegada ordenados en [start, end), por adelgazamiento"""
+        peak = self.base_rate * (1 + self.amplitude)
+        candidates = _uniform_times(rng, [start], [end - start], [peak])
+        keep = rng.random(len(candidates)) * peak < self.rate(candidates)
+        return candidates[keep]
+
+
+class ExponentialBursts:
+    def __init__(self, mean):
+        """
+        Ráfagas exponenciales
+
+        Args:
+            mean (float): Duración media de la ráfaga
+
+        Raises:
+            ValueError: Si la media no es positiva y finita
+        """
+        _check_positive(mean, "La duración media debe ser positiva")
+        self.mean = mean
+
+    def sample(self, rng, n):
+        return rng.exponential(self.mean, n)
+
+
+class ParetoBursts:
+    def __init__(self, shape, scale=1.0):
+        """
+        Ráfagas de Pareto (cola pesada)
+
+        Args:
+            shape (float): Índice de cola; con shape <= 2 la varianza es infinita
+            scale (float): Ráfaga mínima
+
+        Raises:
+            ValueError: Si shape o scale no son positivos y finitos
+        """
+        _check_positive(shape, "El índice de cola debe ser positivo")
+        _check_positive(scale, "La ráfaga mínima debe ser positiva")
+        self.shape = shape
+        self.scale = scale
+
+    def sample(self, rng, n):
+        return self.scale * (1 + rng.pareto(self.shape, n))
+
+
+class BimodalBursts:
+    def __init__(self, short_mean, long_mean, long_fraction=0.2, spread=0.25):
+        """
+        Ráfagas bimodales: procesos interactivos cortos y procesos de cómputo largos
+
+        Args:
+            short_mean (float): Duración media de las ráfagas cortas
+            long_mean (float): Duración media de las ráfagas largas
+            long_fraction (float): Proporción de ráfagas largas, entre 0 y 1
+                                   (sin incluirlos)
+            spread (float): Desviación de cada modo, relativa a su media
+
+        Raises:
+            ValueError: Si alguna media o spread no son positivos y finitos, o
+                        long_fraction no está estrictamente entre 0 y 1
+        """
+        _check_positive(short_mean, "La duración media de las ráfagas cortas debe ser positiva")
+        _check_positive(long_mean, "La duración media de las ráfagas largas debe ser positiva")
+        _check_positive(spread, "La desviación relativa debe ser positiva")
+        if not 0 < long_fraction < 1:
+            raise ValueError("La proporción de ráfagas largas debe estar entre 0 y 1")
+        self.short_mean = short_mean
+        self.long_mean = long_mean
+        self.long_fraction = long_fraction
+        self.spread = spread
+
+    def sample(self, rng, n):
+        means = np.where(rng.random(n) < self.long_fraction, self.long_mean, self.short_mean)
+        return np.maximum(rng.normal(means, self.spread * means), 0)
+
+
+class WorkloadGenerator:
+    def __init__(self, arrivals, bursts, priority_levels=5, chunk_duration=1000,
+                 seed=None, integer=True):
+        """
+        Inicializa el generador de cargas
+
+        Args:
+            arrivals: Proceso de llegadas (PoissonArrivals, MMPPArrivals o DiurnalArrivals)
+            bursts: Distribución de ráfagas (ExponentialBursts, ParetoBursts o BimodalBursts)
+            priority_levels (int): Prioridades posibles, de 1 (más alta) a priority_levels
+            chunk_duration (float): Duración de la ventana de tiempo de cada bloque
+            seed (int | SeedSequence): Semilla de la carga
+            integer (bool): Si es True, las llegadas se truncan a enteros y las
+                            ráfagas se redondean hacia arriba (mínimo 1)
+
+        Raises:
+            ValueError: Si no hay al menos un nivel de prioridad o la duración
+                        de los bloques no es positiva y finita
+        """
+        if priority_levels < 1:
+            raise ValueError("Debe haber al menos un nivel de prioridad")
+        _check_positive(chunk_duration, "La duración de los bloques debe ser positiva")
+        self.arrivals = arrivals
+        self.bursts = bursts
+        self.priority_levels = priority_levels
+        self.chunk_duration = chunk_duration
+        self.integer = integer
+
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.seed = root
+
+        # Flujo de control (estado compartido entre bloques, como la cadena
+        # del MMPP) y flujos de los bloques, en ramas separadas del árbol
+        self._control = self._child(1)
+
+    def _child(self, *key):
+        """SeedSequence hija identificada por 'key', sin depender del orden de uso"""
+        return np.random.SeedSequence(self.seed.entropy, spawn_key=self.seed.spawn_key + key)
+
+    def chunk(self, index):
+        """
+        Genera el bloque de procesos que llegan en la ventana 'index'
+
+        El ID de cada proceso es 'P<index>-<posición en el bloque>', de modo
+        que es único en toda la carga sin importar qué bloques se generen ni
+        en qué orden.
+
+        Args:
+            index (int): Índice de la ventana [index * D, (index + 1) * D)
+
+        Returns:
+            DataFrame: Columnas 'process_id', 'arrival_time', 'burst_time' y
+                       'priority', ordenadas por llegada
+        """
+        rng = np.random.default_rng(self._child(0, index))
+        start = index * self.chunk_duration
+        arrival_times = self.arrivals.sample(rng, start, start + self.chunk_duration, self._control)
+        n = len(arrival_times)
+        burst_times = self.bursts.sample(rng, n)
+        priorities = rng.integers(1, self.priority_levels + 1, n)
+
+        if self.integer:
+            arrival_times = np.floor(arrival_times).astype(np.int64)
+            burst_times = np.maximum(np.ceil(burst_times), 1).astype(np.int64)
+
+        return pd.DataFrame({
+            'process_id': [f'P{index}-{i}' for i in range(n)],
+            'arrival_time': arrival_times,
+            'burst_time': burst_times,
+            'priority': priorities
+        })
+
+    def iter_chunks(self, n_processes=None, horizon=None):
+        """
+        Genera los bloques en orden (los mismos que chunk(0), chunk(1), ...)
+
+        Sin n_processes ni horizon, el flujo no termina.
+
+        Args:
+            n_processes (int): Número total de procesos a generar
+            horizon (float): Tiempo hasta el que se generan llegadas
+
+        Yields:
+            DataFrame: Bloques no vacíos de procesos ordenados por llegada
+        """
+        generated = 0
+        index = 0
+        while n_processes is None or generated < n_processes:
+            if horizon is not None and index * self.chunk_duration >= horizon:
+                break
+            block = self.chunk(index)
+            index += 1
+            if horizon is not None:
+                block = block[block['arrival_time'] < horizon]
+            if n_processes is not None:
+                block = block.iloc[:n_processes - generated]
+            if block.empty:
+                continue
+            generated += len(block)
+            yield block
+
+    def generate(self, n_processes=None, horizon=None):
+        """
+        Genera una carga completa en un solo DataFrame
+
+        Args:
+            n_processes (int): Número total de procesos
+            horizon (float): Tiempo hasta el que se generan llegadas
+
+        Returns:
+            DataFrame: Todos los procesos, ordenados por llegada
+        """
+        if n_processes is None and horizon is None:
+            raise ValueError("Se debe indicar n_processes o horizon")
+        blocks = list(self.iter_chunks(n_processes, horizon))
+        if not blocks:
+            return self.chunk(0).iloc[:0]
+        return pd.concat(blocks, ignore_index=True)
@@ -0,0 +1,165 @@
+"""
+Dibujo de diagramas de Gantt con colecciones de matplotlib
+
+En lugar de llamar a ax.barh y ax.text una vez por intervalo, los tramos
+se dibujan con una PolyCollection por color y las etiquetas solo se agregan
+donde caben a la resolución actual de la figura. Cuando el diagrama tiene
+demasiados tramos, se reduce a un tramo por píxel antes de dibujarlo.
+
+matplotlib se importa recién cuando se dibuja algo (ver pyplot), de modo
+que los simuladores pueden importar este módulo y ejecutarse sin
+matplotlib instalado y sin pagar su tiempo de importación.
+"""
+import numpy as np
+
+from gantt import IDLE
+
+# Número de tramos a partir del cual el diagrama se reduce a nivel de píxel
+DECIMATE_ABOVE = 20000
+
+# Color del tiempo ocioso
+IDLE_COLOR = 'lightgrey'
+
+# Dueño de los píxeles que no cubre ningún tramo
+_NO_OWNER = IDLE - 1
+
+
+def pyplot():
+    """
+    Importa matplotlib.pyplot la primera vez que se necesita
+
+    Returns:
+        module: matplotlib.pyplot
+
+    Raises:
+        ImportError: Si matplotlib no está instalado
+    """
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as error:
+        raise ImportError("Se necesita matplotlib para generar gráficos "
+                          "(pip install matplotlib)") from error
+    return plt
+
+
+def _bar_vertices(starts, ends, y, height):
+    """Vértices de los rectángulos (inicio, fin) como arreglo (n, 4, 2)"""
+    bottom = y - height / 2
+    top = y + height / 2
+    verts = np.empty((len(starts), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = starts
+    verts[:, 2, 0] = verts[:, 3, 0] = ends
+    verts[:, [0, 3], 1] = bottom
+    verts[:, [1, 2], 1] = top
+    return verts
+
+
+def _decimate(owners, starts, ends, x_min, x_max, n_pixels):
+    """
+    Reduce los tramos a lo sumo a un tramo por píxel
+
+    Cada columna de píxeles toma el dueño del tramo que cubre su centro y
+    las columnas contiguas con el mismo dueño se fusionan.
+
+    Args:
+        owners (array): Dueño de cada tramo, ordenados por inicio
+        starts (array): Inicio de cada tramo
+        ends (array): Fin de cada tramo
+        x_min (float): Inicio del eje x
+        x_max (float): Fin del eje x
+        n_pixels (int): Ancho del eje en píxeles
+
+    Returns:
+        tuple: (dueños, inicios, fines) de los tramos reducidos
+    """
+    edges = np.linspace(x_min, x_max, n_pixels + 1)
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    index = np.searchsorted(starts, centers, side='right') - 1
+    covered = index >= 0
+    index = np.maximum(index, 0)
+    covered &= centers < ends[index]
+    pixel_owner = np.where(covered, owners[index], _NO_OWNER)
+
+    first = np.flatnonzero(np.append(True, pixel_owner[1:] != pixel_owner[:-1]))
+    last = np.append(first[1:], n_pixels)
+    keep = pixel_owner[first] != _NO_OWNER
+    return pixel_owner[first][keep], edges[first][keep], edges[last][keep]
+
+
+def draw_gantt(ax, gantt, y=0, height=0.5, alpha=0.8, edgecolor='black', linewidth=1,
+               xlim=None, decimate_above=DECIMATE_ABOVE):
+    """
+    Dibuja un diagrama de Gantt en un eje, con una colección por color
+
+    Los procesos reciben los colores de la paleta en orden de aparición;
+    todos los tramos de un mismo color se dibujan en una sola colección.
+
+    Args:
+        ax (Axes): Eje de matplotlib donde dibujar
+        gantt (GanttRLE): Diagrama a dibujar
+        y (float): Posición vertical de las barras
+        height (float): Alto de las barras
+        alpha (float): Transparencia de las barras
+        edgecolor: Color del borde de las barras
+        linewidth (float): Grosor del borde de las barras
+        xlim (tuple): Límites del eje x; por defecto, de 0 al último instante
+        decimate_above (int): Número de tramos a partir del cual se dibuja
+                              un tramo por píxel (None para no reducir nunca)
+
+    Returns:
+        list: Colecciones agregadas al eje
+    """
+    plt = pyplot()
+    from matplotlib.collections import PolyCollection
+
+    owners, starts, ends, _ = gantt.runs()
+    positive = ends > starts
+    owners, starts, ends = owners[positive], starts[positive], ends[positive]
+
+    if xlim is None:
+        xlim = (0, ends[-1] if len(ends) else 1)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(y - height, y + height)
+    if len(owners) == 0:
+        return []
+
+    # Color de cada dueño en orden de primera aparición; IDLE siempre en gris
+    palette = list(plt.cm.tab10.colors) + [IDLE_COLOR]
+    unique_owners, first_seen = np.unique(owners, return_index=True)
+    ranked = unique_owners[np.argsort(first_seen)]
+    ranked = ranked[ranked != IDLE]
+    color_of = np.full(unique_owners[-1] + 2, len(palette) - 1)
+    color_of[ranked + 1] = np.arange(len(ranked)) % (len(palette) - 1)
+
+    n_pixels = max(int(ax.bbox.width), 1)
+    if decimate_above is not None and len(owners) > decimate_above:
+        owners, starts, ends = _decimate(owners, starts, ends, xlim[0], xlim[1], n_pixels)
+        # Con un tramo por píxel los bordes ocultarían las barras
+        edgecolor = 'none'
+
+    collections = []
+    run_colors = color_of[owners + 1]
+    for color in np.unique(run_colors).tolist():
+        mine = run_colors == color
+        collection = PolyCollection(_bar_vertices(starts[mine], ends[mine], y, height),
+                                    facecolors=palette[color], edgecolors=edgecolor,
+                                    linewidths=linewidth, alpha=alpha)
+        ax.add_collection(collection)
+        collections.append(collection)
+
+    # Etiquetas solo en las barras donde el nombre cabe en píxeles
+    pixels_per_unit = n_pixels / (xlim[1] - xlim[0])
+    char_pixels = 0.65 * plt.rcParams['font.size'] * ax.figure.dpi / 72
+    widths = (ends - starts) * pixels_per_unit
+    labeled = np.flatnonzero(widths >= char_pixels + 4)
+    if len(labeled):
+        names = gantt.names(owners[labeled])
+        name_pixels = np.array([len(str(name)) for name in names]) * char_pixels + 4
+        fits = widths[labeled] >= name_pixels
+        for name, start, end in zip(names[fits], starts[labeled][fits].tolist(),
+                                    ends[labeled][fits].tolist()):
+            ax.text((start + end) / 2, y, name, ha='center', va='center',
+                    color='black', fontweight='bold', clip_on=True)
+
+    return collections
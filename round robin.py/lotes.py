@@ -0,0 +1,255 @@
+"""
+Simulación por lotes de muchas cargas de trabajo independientes (Monte Carlo)
+
+Las cargas se reciben como un arreglo 3-D (carga x proceso x campo) y todas
+avanzan a la vez: cada iteración del bucle toma una decisión de planificación
+en cada carga con operaciones vectorizadas de NumPy. Los resultados
+coinciden con los de PlanificadorCompleto para cada carga por separado.
+
+Dentro de una carga, el ID de un proceso es su posición en el eje de
+procesos; igual que en los simuladores, los empates de llegada se resuelven
+por ese ID.
+"""
+from statistics import NormalDist
+
+import numpy as np
+
+# Campos del último eje del arreglo de cargas
+FIELDS = ('arrival_time', 'burst_time', 'priority')
+ARRIVAL, BURST, PRIORITY = range(len(FIELDS))
+
+# Métricas calculadas para cada carga
+METRICS = ('avg_waiting_time', 'avg_turnaround_time', 'avg_response_time')
+
+
+def stack_workloads(frames):
+    """
+    Apila varias tablas de procesos del mismo tamaño en un arreglo 3-D
+
+    Args:
+        frames (list): DataFrames con 'arrival_time', 'burst_time' y,
+                       opcionalmente, 'priority' (0 por defecto)
+
+    Returns:
+        ndarray: Arreglo (carga, proceso, campo) con los campos de FIELDS
+    """
+    columns = []
+    for frame in frames:
+        priority = frame['priority'] if 'priority' in frame else np.zeros(len(frame))
+        columns.append(np.column_stack([frame['arrival_time'], frame['burst_time'], priority]))
+    return np.stack(columns).astype(np.float64)
+
+
+def _sort_by_arrival(workloads):
+    """Ordena los procesos de cada carga por llegada (estable: desempata por ID)"""
+    order = np.argsort(workloads[:, :, ARRIVAL], axis=1, kind='stable')
+    return np.take_along_axis(workloads, order[:, :, None], axis=1)
+
+
+def _summarize(arrival, burst, start, end):
+    """Promedios por carga a partir del primer inicio y la finalización"""
+    turnaround = end - arrival
+    return {
+        'avg_waiting_time': (turnaround - burst).mean(axis=1),
+        'avg_turnaround_time': turnaround.mean(axis=1),
+        'avg_response_time': (start - arrival).mean(axis=1)
+    }
+
+
+def _batch_fifo(arrival, burst):
+    """
+    FIFO vectorizado: fin_i = max(llegada_i, fin_(i-1)) + ráfaga_i
+
+    La recurrencia se resuelve con sumas acumuladas y un máximo acumulado,
+    sin bucle sobre los procesos.
+    """
+    total = np.cumsum(burst, axis=1)
+    end = total + np.maximum.accumulate(arrival - (total - burst), axis=1)
+    return _summarize(arrival, burst, end - burst, end)
+
+
+def _batch_non_preemptive(arrival, burst, key):
+    """
+    Planificación no expropiativa eligiendo el proceso disponible de menor clave
+
+    Args:
+        arrival (ndarray): Llegadas (carga, proceso), ordenadas por llegada
+        burst (ndarray): Ráfagas con la misma forma
+        key (ndarray): Clave de selección; los empates se resuelven por posición
+    """
+    n_batch, n_processes = arrival.shape
+    rows = np.arange(n_batch)
+    pending = np.ones((n_batch, n_processes), dtype=bool)
+    start = np.zeros((n_batch, n_processes))
+    end = np.zeros((n_batch, n_processes))
+    current_time = np.zeros(n_batch)
+
+    for _ in range(n_processes):
+        # Si no hay nadie disponible, avanzar hasta el próximo arribo
+        next_arrival = np.where(pending, arrival, np.inf).min(axis=1)
+        current_time = np.maximum(current_time, next_arrival)
+
+        available = pending & (arrival <= current_time[:, None])
+        selected = np.where(available, key, np.inf).argmin(axis=1)
+
+        start[rows, selected] = current_time
+        current_time = current_time + burst[rows, selected]
+        end[rows, selected] = current_time
+        pending[rows, selected] = False
+
+    return _summarize(arrival, burst, start, end)
+
+
+def _batch_round_robin(arrival, burst, quantum):
+    """
+    Round Robin en paralelo sobre todas las cargas
+
+    Reproduce las reglas de RoundRobinEngine: cada carga tiene su propia cola
+    circular de slots (con a lo sumo dos copias por slot), su cursor de
+    llegadas y su reloj. Los procesos sin ráfaga nunca se ejecutan y cuentan
+    con métricas 0, igual que en PlanificadorCompleto.
+    """
+    n_batch, n_processes = arrival.shape
+    capacity = 2 * n_processes + 1
+
+    queue = np.zeros((n_batch, capacity), dtype=np.int64)
+    head = np.zeros(n_batch, dtype=np.int64)
+    size = np.zeros(n_batch, dtype=np.int64)
+    queued = np.zeros((n_batch, n_processes), dtype=np.int8)
+    cursor = np.zeros(n_batch, dtype=np.int64)
+    current_time = np.zeros(n_batch)
+
+    remaining = burst.copy()
+    completion = np.zeros((n_batch, n_processes))
+    first_response = np.full((n_batch, n_processes), -1.0)
+
+    # Primer slot con ráfaga a partir de cada posición (n_processes si no hay)
+    position = np.where(burst > 0, np.arange(n_processes), n_processes)
+    next_with_burst = np.minimum.accumulate(position[:, ::-1], axis=1)[:, ::-1]
+    next_with_burst = np.column_stack([next_with_burst, np.full(n_batch, n_processes)])
+
+    def enqueue(rows, slots):
+        queue[rows, (head[rows] + size[rows]) % capacity] = slots
+        size[rows] += 1
+        queued[rows, slots] += 1
+
+    def admit(rows):
+        # Cada vuelta admite a lo sumo un proceso por carga, en orden de la tabla
+        while len(rows):
+            rows = rows[cursor[rows] < n_processes]
+            slots = cursor[rows]
+            arrived = arrival[rows, slots] <= current_time[rows]
+            rows, slots = rows[arrived], slots[arrived]
+            cursor[rows] += 1
+            with_burst = burst[rows, slots] > 0
+            enqueue(rows[with_burst], slots[with_burst])
+
+    admit(np.arange(n_batch))
+    active = np.arange(n_batch)
+
+    while len(active):
+        # Cargas con la cola vacía: tiempo ocioso hasta el próximo arribo
+        idle = active[size[active] == 0]
+        if len(idle):
+            cursor[idle] = next_with_burst[idle, cursor[idle]]
+            waiting = cursor[idle] < n_processes
+            finished = idle[~waiting]
+            idle = idle[waiting]
+            current_time[idle] = arrival[idle, cursor[idle]]
+            admit(idle)
+            if len(finished):
+                active = np.setdiff1d(active, finished, assume_unique=True)
+                if not len(active):
+                    break
+
+        # Despachar el primer slot de cada cola
+        rows = active
+        slots = queue[rows, head[rows]]
+        head[rows] = (head[rows] + 1) % capacity
+        size[rows] -= 1
+        queued[rows, slots] -= 1
+
+        unstarted = first_response[rows, slots] == -1
+        first_response[rows[unstarted], slots[unstarted]] = current_time[rows[unstarted]]
+
+        execution = np.minimum(quantum, remaining[rows, slots])
+        current_time[rows] += execution
+        left = remaining[rows, slots] - execution
+        remaining[rows, slots] = left
+
+        # El interrumpido sin otra copia se reencola antes de los arribos
+        again = (left > 0) & (queued[rows, slots] == 0)
+        enqueue(rows[again], slots[again])
+        admit(rows)
+
+        done = left == 0
+        completion[rows[done], slots[done]] = current_time[rows[done]]
+        enqueue(rows[~done], slots[~done])
+
+    executed = burst > 0
+    start = np.where(executed, first_response, arrival)
+    end = np.where(executed, completion, arrival)
+    return _summarize(arrival, np.where(executed, burst, 0), start, end)
+
+
+def confidence_interval(values, confidence=0.95):
+    """
+    Intervalo de confianza de la media (aproximación normal)
+
+    Args:
+        values (ndarray): Una métrica por carga
+        confidence (float): Nivel de confianza
+
+    Returns:
+        tuple: (media, límite inferior, límite superior)
+    """
+    mean = float(np.mean(values))
+    if len(values) < 2:
+        return mean, np.nan, np.nan
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    half_width = float(z * np.std(values, ddof=1) / np.sqrt(len(values)))
+    return mean, mean - half_width, mean + half_width
+
+
+def simulate_batch(workloads, quantum=3, confidence=0.95):
+    """
+    Simula FIFO, SJF, Round Robin y Prioridad sobre un lote de cargas
+
+    Args:
+        workloads (ndarray): Arreglo (carga, proceso, campo) con los campos
+                             de FIELDS: llegada, ráfaga y prioridad
+        quantum (int): Quantum de Round Robin
+        confidence (float): Nivel de confianza de los intervalos
+
+    Returns:
+        dict: Algoritmo -> {métrica: arreglo con un valor por carga,
+              'intervals': {métrica: (media, inferior, superior)}}
+
+    Raises:
+        ValueError: Si el arreglo no tiene la forma esperada o hay
+                    tiempos negativos
+    """
+    workloads = np.asarray(workloads, dtype=np.float64)
+    if workloads.ndim != 3 or workloads.shape[2] != len(FIELDS):
+        raise ValueError(f"Las cargas deben tener forma (carga, proceso, {len(FIELDS)})")
+    if np.isnan(workloads).any():
+        raise ValueError("Las cargas contienen valores vacíos")
+    if (workloads[:, :, ARRIVAL] < 0).any() or (workloads[:, :, BURST] < 0).any():
+        raise ValueError("Los tiempos de llegada y de ráfaga no pueden ser negativos")
+    if quantum <= 0:
+        raise ValueError("El quantum debe ser positivo")
+
+    workloads = _sort_by_arrival(workloads)
+    arrival = workloads[:, :, ARRIVAL]
+    burst = workloads[:, :, BURST]
+
+    results = {
+        'FIFO': _batch_fifo(arrival, burst),
+        'SJF': _batch_non_preemptive(arrival, burst, burst),
+        'Round Robin': _batch_round_robin(arrival, burst, quantum),
+        'Prioridad': _batch_non_preemptive(arrival, burst, workloads[:, :, PRIORITY])
+    }
+    for metrics in results.values():
+        metrics['intervals'] = {metric: confidence_interval(metrics[metric], confidence)
+                                for metric in METRICS}
+    return results
@@ -0,0 +1,299 @@
+"""
+Métricas en línea de los procesos terminados
+
+Las métricas se actualizan a medida que cada proceso termina y se pueden
+leer en cualquier momento de la simulación, sin guardar una fila por
+proceso. Cada métrica lleva:
+
+    - media y varianza con el método de Welford (combinadas por bloques
+      con la fórmula de Chan, que da el mismo resultado)
+    - mínimo y máximo
+    - un resumen de cuantiles tipo t-digest para p50, p95, p99 y p99.9
+
+La memoria usada por métrica es constante: el resumen conserva del orden
+de 'compression / 2' centroides, más un búfer de tamaño fijo.
+"""
+import math
+
+import numpy as np
+
+# Métricas registradas por OnlineMetrics, en orden
+METRICS = ('waiting_time', 'turnaround_time', 'response_time')
+
+# Cuantiles incluidos en los resúmenes
+QUANTILES = {'p50': 0.5, 'p95': 0.95, 'p99': 0.99, 'p99.9': 0.999}
+
+# Valores que se acumulan antes de incorporarlos a los resúmenes
+BUFFER_SIZE = 512
+
+# Lotes a partir de este tamaño se agrupan por rango antes de combinarse
+SUMMARIZE_ABOVE = 100_000
+
+
+class QuantileSketch:
+    def __init__(self, compression=200):
+        """
+        Resumen de cuantiles aproximados (t-digest con fusión)
+
+        Los valores se agrupan en centroides (media, peso). Cerca de los
+        extremos de la distribución los centroides son más pequeños, de modo
+        que los cuantiles altos como p99.9 se estiman con más precisión que
+        la mediana.
+
+        Args:
+            compression (float): Precisión del resumen; se conservan del
+                                 orden de compression / 2 centroides
+        """
+        if compression <= 0:
+            raise ValueError("La compresión debe ser positiva")
+        self.compression = compression
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def add_many(self, values, weights=None):
+        """
+        Incorpora varios valores y vuelve a comprimir los centroides
+
+        Args:
+            values (array): Valores nuevos
+            weights (array): Peso de cada valor (1 por defecto)
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+
+        if weights is None:
+            # Valores sueltos: ordenarlos solos es mucho más rápido que un
+            # argsort, y los centroides (ya ordenados) se intercalan después
+            values = np.sort(values)
+            self.min = min(self.min, float(values[0]))
+            self.max = max(self.max, float(values[-1]))
+            if len(values) > SUMMARIZE_ABOVE:
+                values, weights = self._summarize_sorted(values)
+            else:
+                weights = np.ones(len(values))
+            positions = np.searchsorted(values, self.means)
+            means = np.insert(values, positions, self.means)
+            weights = np.insert(weights, positions, self.weights)
+        else:
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            means = np.concatenate((self.means, values))
+            weights = np.concatenate((self.weights, np.asarray(weights, dtype=np.float64)))
+            order = np.argsort(means, kind='stable')
+            means, weights = means[order], weights[order]
+
+        # Cada centroide cubre a lo sumo una unidad de la escala
+        # k(q) = δ/Z · log(q / (1 - q)), que se estrecha en las colas; Z
+        # depende del total para que el número de centroides no crezca
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        q = (cumulative - weights / 2) / total
+        normalizer = 4 * math.log(max(total / self.compression, 1)) + 24
+        k = self.compression / normalizer * np.log(q / (1 - q))
+        bins = np.floor(k - k[0]).astype(np.int64)
+
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        merged = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged
+        self.weights = merged
+
+    def _summarize_sorted(self, values):
+        """
+        Agrupa un lote grande de valores ordenados en centroides
+
+        Con pesos unitarios, la posición de un valor en la escala k solo
+        depende de su rango, así que los límites de los centroides se
+        calculan directamente (uno por unidad de k) sin evaluar k valor a
+        valor.
+
+        Returns:
+            tuple: (medias, pesos) de los centroides, en orden
+        """
+        n = len(values)
+        scale = self.compression / (4 * math.log(max(n / self.compression, 1)) + 24)
+        # El rango r está en q = (r + 1/2) / n; k(q) es simétrica alrededor de 0
+        k_first = scale * math.log(0.5 / (n - 0.5))
+        steps = k_first + np.arange(1, math.floor(-2 * k_first) + 1)
+        q = 1 / (1 + np.exp(-steps / scale))
+        starts = np.unique(np.r_[0, np.ceil(q * n - 0.5).astype(np.int64)])
+        starts = starts[starts < n]
+        counts = np.diff(np.append(starts, n)).astype(np.float64)
+        return np.add.reduceat(values, starts) / counts, counts
+
+    def merge(self, other):
+        """Incorpora los centroides de otro resumen"""
+        if len(other.means):
+            self.add_many(other.means, other.weights)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """
+        Estima un cuantil
+
+        Args:
+            q (float | array): Cuantil(es) entre 0 y 1
+
+        Returns:
+            float | ndarray: Estimación, o NaN si el resumen está vacío
+        """
+        if not len(self.means):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else math.nan
+        # Interpolar entre los centros de los centroides, con el mínimo y el
+        # máximo exactos en los extremos
+        cumulative = np.cumsum(self.weights)
+        total = cumulative[-1]
+        positions = np.concatenate(([0], cumulative - self.weights / 2, [total]))
+        values = np.concatenate(([self.min], self.means, [self.max]))
+        result = np.interp(np.asarray(q) * total, positions, values)
+        return float(result) if np.ndim(result) == 0 else result
+
+
+class OnlineStats:
+    def __init__(self, compression=200):
+        """
+        Estadísticas en línea de una métrica
+
+        Args:
+            compression (float): Precisión del resumen de cuantiles
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(compression)
+        self._buffer = []
+
+    def add(self, value):
+        """Registra un valor"""
+        self._buffer.append(value)
+        if len(self._buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def add_many(self, values):
+        """Registra varios valores a la vez"""
+        self.flush()
+        self._combine(np.asarray(values, dtype=np.float64).ravel())
+
+    def flush(self):
+        """Incorpora a las estadísticas los valores del búfer"""
+        if self._buffer:
+            values = np.array(self._buffer, dtype=np.float64)
+            self._buffer.clear()
+            self._combine(values)
+
+    def _combine(self, values):
+        """Combina un bloque de valores con las estadísticas acumuladas (Chan)"""
+        n = len(values)
+        if not n:
+            return
+        mean = float(values.mean())
+        deviation = values - mean
+        m2 = float(np.dot(deviation, deviation))
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.add_many(values)
+
+    def merge(self, other):
+        """Incorpora las estadísticas de otro acumulador"""
+        self.flush()
+        other.flush()
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self):
+        """Varianza muestral (NaN con menos de dos valores)"""
+        self.flush()
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    def quantile(self, q):
+        """Cuantil aproximado (ver QuantileSketch.quantile)"""
+        self.flush()
+        return self.sketch.quantile(q)
+
+    def summary(self):
+        """
+        Resumen de la métrica hasta el momento
+
+        Returns:
+            dict: 'count', 'mean', 'std', 'min', 'max' y los cuantiles de QUANTILES
+        """
+        self.flush()
+        empty = self.count == 0
+        result = {
+            'count': self.count,
+            'mean': math.nan if empty else self.mean,
+            'std': math.sqrt(self.variance) if self.count > 1 else math.nan,
+            'min': math.nan if empty else self.min,
+            'max': math.nan if empty else self.max
+        }
+        result.update(zip(QUANTILES, np.atleast_1d(self.sketch.quantile(list(QUANTILES.values()))).tolist()))
+        return result
+
+
+class OnlineMetrics:
+    def __init__(self, compression=200):
+        """
+        Tiempos de espera, retorno y respuesta de los procesos terminados
+
+        Args:
+            compression (float): Precisión de los resúmenes de cuantiles
+        """
+        self.stats = {metric: OnlineStats(compression) for metric in METRICS}
+
+    def __getitem__(self, metric):
+        return self.stats[metric]
+
+    @property
+    def count(self):
+        """Procesos registrados"""
+        waiting = self.stats['waiting_time']
+        return waiting.count + len(waiting._buffer)
+
+    def record(self, waiting_time, turnaround_time, response_time):
+        """Registra un proceso que acaba de terminar"""
+        self.stats['waiting_time'].add(waiting_time)
+        self.stats['turnaround_time'].add(turnaround_time)
+        self.stats['response_time'].add(response_time)
+
+    def record_many(self, waiting_times, turnaround_times, response_times):
+        """Registra varios procesos terminados (arreglos paralelos)"""
+        self.stats['waiting_time'].add_many(waiting_times)
+        self.stats['turnaround_time'].add_many(turnaround_times)
+        self.stats['response_time'].add_many(response_times)
+
+    def merge(self, other):
+        """Incorpora las métricas de otro acumulador"""
+        for metric in METRICS:
+            self.stats[metric].merge(other.stats[metric])
+
+    def summary(self):
+        """
+        Resumen de todas las métricas hasta el momento
+
+        Returns:
+            dict: Métrica -> resumen de OnlineStats.summary()
+        """
+        return {metric: stats.summary() for metric, stats in self.stats.items()}
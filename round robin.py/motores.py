@@ -0,0 +1,800 @@
+"""
+Motores de simulación respaldados por arreglos NumPy
+
+Los simuladores (RoundRobinSimulator y PlanificadorCompleto) trabajan con
+DataFrames para la entrada y la salida, pero el bucle de planificación se
+ejecuta aquí sobre arreglos preasignados indexados por posición (slot).
+El slot de un proceso es su fila en la tabla ordenada por llegada.
+"""
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
+from fractions import Fraction
+
+import numpy as np
+
+from gantt import GanttRLE, IDLE
+
+# Códigos de estado de los procesos
+NEW = 0
+READY = 1
+RUNNING = 2
+TERMINATED = 3
+STATE_NAMES = np.array(['NEW', 'READY', 'RUNNING', 'TERMINATED'], dtype=object)
+
+
+class RoundBatch(namedtuple('RoundBatch', ['order', 'start', 'end', 'rounds', 'quantum'])):
+    """
+    Rondas completas de Round Robin aplicadas en un solo paso
+
+    Cada ronda ejecuta un quantum por cada entrada de la cola, en el orden
+    de 'order'; la cola queda igual al terminar cada ronda.
+    """
+    __slots__ = ()
+
+    def iter_slices(self):
+        """Genera los intervalos de un quantum uno a uno, sin materializarlos"""
+        order = self.order.tolist()
+        start_time = self.start
+        for _ in range(self.rounds):
+            for slot in order:
+                yield slot, start_time, start_time + self.quantum
+                start_time += self.quantum
+
+
+class RoundRobinEngine:
+    def __init__(self, arrival_times, burst_times, quantum, batch_rounds=True, journal=None,
+                 keep_slices=True, metrics=None):
+        """
+        Inicializa el motor Round Robin
+
+        Args:
+            arrival_times (array): Tiempos de llegada, ordenados de forma ascendente
+            burst_times (array): Tiempos de ráfaga en el mismo orden
+            quantum (int): Cantidad de tiempo asignado a cada proceso
+            batch_rounds (bool): Si es True, aplica de una vez las rondas completas
+                                 en las que no hay llegadas ni finalizaciones
+            journal (StatusJournal): Diario donde registrar los cambios de estado
+            keep_slices (bool): Si es False, los intervalos no se guardan (modo streaming)
+            metrics (OnlineMetrics): Métricas en línea a actualizar cuando
+                                     termina cada proceso
+        """
+        self.arrival = np.asarray(arrival_times)
+        self.burst = np.asarray(burst_times)
+        if len(self.arrival) != len(self.burst):
+            raise ValueError("arrival_times y burst_times deben tener la misma longitud")
+        if len(self.arrival) > 1 and np.any(np.diff(self.arrival) < 0):
+            raise ValueError("Los tiempos de llegada deben estar ordenados")
+
+        dtype = np.result_type(self.arrival, self.burst)
+        n = len(self.arrival)
+
+        self.quantum = quantum
+        self.batch_rounds = batch_rounds and quantum > 0
+        self.journal = journal
+        self.metrics = metrics
+        self.current_time = 0
+
+        # Tiempo que los bloques de rondas no deben sobrepasar (ver run_until)
+        self.horizon = None
+        self.remaining = self.burst.astype(dtype, copy=True)
+        self.completion = np.zeros(n, dtype=dtype)
+        self.first_response = np.full(n, -1, dtype=dtype)
+        self.state = np.full(n, NEW, dtype=np.int8)
+
+        # Cola de listos (slots) y número de copias de cada slot en la cola.
+        # Como la tabla está ordenada por llegada, un cursor marca el primer
+        # slot que todavía no ha sido admitido.
+        self.ready_queue = deque()
+        self.queued = np.zeros(n, dtype=np.int8)
+        self.arrival_cursor = 0
+
+        # Slots con una sola copia en la cola. Cuando no hay ninguno, cada
+        # despacho reencola exactamente una copia y la cola solo rota.
+        self._singles = 0
+        self._since_batch_check = 0
+
+        # Intervalos ejecutados, codificados por tramos
+        self.timeline = GanttRLE(quantum=quantum, time_dtype=dtype) if keep_slices else None
+
+        # Agregar procesos que ya han llegado al tiempo 0
+        self._admit()
+
+    def _enqueue(self, slot):
+        """Agrega un slot al final de la cola de listos"""
+        self.ready_queue.append(slot)
+        self.queued[slot] += 1
+        self._singles += 1 if self.queued[slot] == 1 else -1
+        if self.state[slot] == NEW:
+            self.state[slot] = READY
+            if self.journal is not None:
+                self.journal.record(self.current_time, slot, self.remaining[slot], READY)
+
+    def _admit(self):
+        """Agrega a la cola, en orden de la tabla, los procesos que han llegado"""
+        arrival = self.arrival
+        n = len(arrival)
+        cursor = self.arrival_cursor
+        while cursor < n and arrival[cursor] <= self.current_time:
+            if self.remaining[cursor] > 0:
+                self._enqueue(cursor)
+            cursor += 1
+        self.arrival_cursor = cursor
+
+    def _next_arrival(self):
+        """
+        Devuelve el tiempo del próximo arribo con trabajo pendiente
+
+        Returns:
+            El tiempo de llegada, o None si no quedan procesos por llegar
+        """
+        n = len(self.arrival)
+        cursor = self.arrival_cursor
+        # Los procesos sin ráfaga nunca entran a la cola
+        while cursor < n and self.remaining[cursor] <= 0:
+            cursor += 1
+        self.arrival_cursor = cursor
+        return self.arrival[cursor] if cursor < n else None
+
+    def _record(self, owner, start, end):
+        """Registra un intervalo de ejecución"""
+        if self.timeline is not None:
+            self.timeline.append(owner, start, end)
+
+    def _run_rounds(self):
+        """
+        Aplica de una vez las rondas completas que caben antes del próximo evento
+
+        Solo se llama cuando todos los slots de la cola tienen dos copias, de
+        modo que una ronda es una rotación completa de la cola. El número de
+        rondas se limita para que ningún proceso termine y ningún arribo
+        ocurra dentro de ellas.
+
+        Returns:
+            RoundBatch: Rondas aplicadas, o None si no cabe ninguna
+        """
+        self._since_batch_check = 0
+        quantum = self.quantum
+        round_length = len(self.ready_queue) * quantum
+        start_time = self.current_time
+
+        next_arrival = self._next_arrival()
+        if next_arrival is not None and next_arrival <= start_time + round_length:
+            return None
+
+        order = np.fromiter(self.ready_queue, dtype=np.int64, count=len(self.ready_queue))
+        remaining = self.remaining[order]
+
+        # Cada slot aparece dos veces por ronda: consume 2 quantums por ronda
+        # y debe conservar tiempo restante después de la última
+        rounds = int((-(-remaining // (2 * quantum)) - 1).min())
+        if next_arrival is not None:
+            rounds = min(rounds, int(-(-(next_arrival - start_time) // round_length)) - 1)
+        if self.horizon is not None and self.horizon > start_time:
+            rounds = min(rounds, int((self.horizon - start_time) // round_length))
+        if rounds < 1:
+            return None
+
+        np.subtract.at(self.remaining, order, quantum * rounds)
+        self.current_time = start_time + round_length * rounds
+
+        batch = RoundBatch(order, start_time, self.current_time, rounds, quantum)
+        if self.timeline is not None:
+            self.timeline.extend_rounds(batch)
+        if self.journal is not None:
+            self.journal.record_batch(batch, self.remaining, self.state)
+        return batch
+
+    def step(self):
+        """
+        Avanza la simulación una decisión de planificación
+
+        Returns:
+            tuple: (slot, inicio, fin) del intervalo decidido, con slot = IDLE
+                   para tiempo ocioso, un RoundBatch si se aplicaron varias
+                   rondas completas, o None si la simulación terminó
+        """
+        if (self.batch_rounds and self._singles == 0 and self.ready_queue and
+                self._since_batch_check >= len(self.ready_queue)):
+            batch = self._run_rounds()
+            if batch is not None:
+                return batch
+
+        if not self.ready_queue:
+            next_arrival = self._next_arrival()
+            if next_arrival is None:
+                return None
+
+            # Avanzar el tiempo al próximo arribo registrando el tiempo ocioso
+            start_time = self.current_time
+            self._record(IDLE, start_time, next_arrival)
+            self.current_time = next_arrival
+            self._admit()
+            return IDLE, start_time, next_arrival
+
+        # Obtener el próximo proceso a ejecutar (FIFO en la cola)
+        slot = self.ready_queue.popleft()
+        self.queued[slot] -= 1
+        self._singles += 1 if self.queued[slot] == 1 else -1
+        self._since_batch_check += 1
+
+        # Registrar primera respuesta si no se ha hecho
+        if self.first_response[slot] == -1:
+            self.first_response[slot] = self.current_time
+        self.state[slot] = RUNNING
+
+        remaining = self.remaining[slot]
+        execution_time = min(self.quantum, remaining)
+        start_time = self.current_time
+        end_time = start_time + execution_time
+        self._record(slot, start_time, end_time)
+
+        self.current_time = end_time
+        new_remaining = remaining - execution_time
+        self.remaining[slot] = new_remaining
+
+        # Agregar procesos que llegaron DURANTE la ejecución actual. El proceso
+        # interrumpido, si no tenía otra copia en la cola, se reencola antes que
+        # ellos porque su fila está antes en la tabla.
+        if new_remaining > 0 and self.queued[slot] == 0:
+            self._enqueue(slot)
+        self._admit()
+
+        if new_remaining == 0:
+            self.state[slot] = TERMINATED
+            self.completion[slot] = end_time
+            # Una copia pendiente en la cola todavía moverá la finalización
+            # (intervalo vacío), así que se registra cuando se despacha la última
+            if self.metrics is not None and self.queued[slot] == 0:
+                turnaround = end_time - self.arrival[slot]
+                self.metrics.record(turnaround - self.burst[slot], turnaround,
+                                    self.first_response[slot] - self.arrival[slot])
+        else:
+            # El proceso vuelve AL FINAL de la cola
+            self.state[slot] = READY
+            self._enqueue(slot)
+
+        if self.journal is not None:
+            self.journal.end_step(end_time, slot, new_remaining, self.state[slot])
+        return slot, start_time, end_time
+
+    def run_until(self, time):
+        """
+        Avanza la simulación hasta que el reloj alcance 'time' (o no quede trabajo)
+
+        Se detiene antes de un tiempo ocioso que cruce 'time' y los bloques de
+        rondas no lo sobrepasan, así que el reloj queda a lo sumo un quantum
+        después de 'time'.
+
+        Args:
+            time: Tiempo hasta el que avanzar
+
+        Returns:
+            bool: True si todavía queda trabajo por simular
+        """
+        self.horizon = time
+        try:
+            while self.current_time < time:
+                if not self.ready_queue:
+                    next_arrival = self._next_arrival()
+                    if next_arrival is None:
+                        return False
+                    if next_arrival > time:
+                        return True
+                if self.step() is None:
+                    return False
+        finally:
+            self.horizon = None
+        return self.has_pending()
+
+    def has_pending(self):
+        """True si todavía queda trabajo por simular"""
+        return bool(self.ready_queue) or self._next_arrival() is not None
+
+    def replace_pending(self, arrival_times, burst_times):
+        """
+        Reemplaza los slots que todavía no llegaron por una nueva lista
+
+        Los slots con llegada posterior al reloj nunca entraron a la cola ni
+        al registro, así que se pueden renumerar sin afectar lo ya simulado.
+        Los que llegan justo en el tiempo actual se admiten de inmediato, al
+        final de la cola.
+
+        Args:
+            arrival_times (array): Llegadas de los nuevos slots pendientes,
+                                   ordenadas y no anteriores al reloj
+            burst_times (array): Ráfagas en el mismo orden
+
+        Returns:
+            int: Primer slot pendiente (los anteriores no cambian)
+
+        Raises:
+            ValueError: Si alguna llegada es anterior al reloj o los tiempos
+                        no se pueden representar con el tipo de la simulación
+        """
+        arrival_times = np.asarray(arrival_times)
+        burst_times = np.asarray(burst_times)
+        if not (np.can_cast(arrival_times.dtype, self.arrival.dtype) and
+                np.can_cast(burst_times.dtype, self.burst.dtype)):
+            raise ValueError("Los tiempos de los procesos nuevos no son compatibles con los de la simulación")
+        if len(arrival_times) and (arrival_times.min() < self.current_time or
+                                   np.any(np.diff(arrival_times) < 0)):
+            raise ValueError("Las llegadas pendientes deben estar ordenadas y no ser anteriores al reloj")
+
+        # Todos los slots con llegada <= reloj ya pasaron por el cursor
+        cut = int(np.searchsorted(self.arrival, self.current_time, side='right'))
+        n = cut + len(arrival_times)
+        self.arrival = np.concatenate((self.arrival[:cut], arrival_times.astype(self.arrival.dtype)))
+        self.burst = np.concatenate((self.burst[:cut], burst_times.astype(self.burst.dtype)))
+
+        def resized(values, fill):
+            result = np.full(n, fill, dtype=values.dtype)
+            result[:cut] = values[:cut]
+            return result
+
+        self.remaining = resized(self.remaining, 0)
+        self.remaining[cut:] = burst_times
+        self.completion = resized(self.completion, 0)
+        self.first_response = resized(self.first_response, -1)
+        self.state = resized(self.state, NEW)
+        self.queued = resized(self.queued, 0)
+        self.arrival_cursor = cut
+
+        self._admit()
+        return cut
+
+    def run(self, checkpointer=None):
+        """
+        Ejecuta la simulación hasta que no quede trabajo
+
+        Args:
+            checkpointer (Checkpointer): Si se indica, guarda puntos de control
+                                         periódicos durante la ejecución
+        """
+        if checkpointer is None:
+            while self.step() is not None:
+                pass
+            return
+        while self.step() is not None:
+            checkpointer.maybe_save()
+
+    def state_dict(self):
+        """
+        Estado completo del motor (sin los intervalos registrados)
+
+        Returns:
+            dict: Reloj, cola de listos en orden, arreglos por slot y cursor de llegadas
+        """
+        return {
+            'current_time': self.current_time,
+            'remaining': self.remaining,
+            'completion': self.completion,
+            'first_response': self.first_response,
+            'state': self.state,
+            'queued': self.queued,
+            'ready_queue': np.fromiter(self.ready_queue, dtype=np.int64, count=len(self.ready_queue)),
+            'arrival_cursor': self.arrival_cursor,
+            'singles': self._singles,
+            'since_batch_check': self._since_batch_check
+        }
+
+    def load_state_dict(self, state):
+        """
+        Restaura un estado obtenido con state_dict()
+
+        Las métricas en línea, si las hay, se reconstruyen a partir de los
+        procesos que ya terminaron. Un proceso terminado que todavía tiene
+        una copia en la cola se registra cuando step() despacha esa copia,
+        así que aquí se omite para no contarlo dos veces.
+        """
+        self.current_time = self.remaining.dtype.type(state['current_time'])
+        for name in ('remaining', 'completion', 'first_response', 'state', 'queued'):
+            np.copyto(getattr(self, name), state[name])
+        self.ready_queue = deque(np.asarray(state['ready_queue']).tolist())
+        self.arrival_cursor = int(state['arrival_cursor'])
+        self._singles = int(state['singles'])
+        self._since_batch_check = int(state['since_batch_check'])
+
+        if self.metrics is not None:
+            done = self.terminated_mask() & (self.queued == 0)
+            turnaround = self.completion[done] - self.arrival[done]
+            self.metrics.record_many(turnaround - self.burst[done], turnaround,
+                                     self.first_response[done] - self.arrival[done])
+
+    def slices(self):
+        """
+        Devuelve los intervalos ejecutados como arreglos paralelos
+
+        Returns:
+            tuple: (dueños, inicios, fines)
+        """
+        if self.timeline is None:
+            empty = np.zeros(0, dtype=self.remaining.dtype)
+            return np.zeros(0, dtype=np.int64), empty, empty
+        return self.timeline.expand()
+
+    def terminated_mask(self):
+        """Máscara de los slots que terminaron su ejecución"""
+        return self.state == TERMINATED
+
+
+class NonPreemptiveEngine:
+    def __init__(self, arrival_times, burst_times, keys, keep_slices=True, metrics=None):
+        """
+        Inicializa un motor no expropiativo que elige por clave
+
+        Los procesos que ya llegaron esperan en un montículo ordenado por
+        (clave, slot). Como los slots siguen el orden (llegada, ID), los
+        empates de clave se resuelven por llegada y luego por ID. Un cursor
+        sobre la tabla admite las llegadas, así que cada proceso entra y sale
+        del montículo una sola vez: O(n log n) en total.
+
+        Args:
+            arrival_times (array): Tiempos de llegada, ordenados de forma ascendente
+            burst_times (array): Tiempos de ráfaga en el mismo orden
+            keys (array): Clave de selección de cada slot (menor = primero)
+            keep_slices (bool): Si es False, los intervalos no se guardan (modo streaming)
+            metrics (OnlineMetrics): Métricas en línea a actualizar cuando
+                                     termina cada proceso
+        """
+        self.arrival = np.asarray(arrival_times)
+        self.burst = np.asarray(burst_times)
+        if not len(self.arrival) == len(self.burst) == len(keys):
+            raise ValueError("arrival_times, burst_times y keys deben tener la misma longitud")
+        if len(self.arrival) > 1 and np.any(np.diff(self.arrival) < 0):
+            raise ValueError("Los tiempos de llegada deben estar ordenados")
+
+        dtype = np.result_type(self.arrival, self.burst)
+        n = len(self.arrival)
+
+        self.metrics = metrics
+        self.current_time = 0
+        self.completion = np.zeros(n, dtype=dtype)
+        self.first_response = np.full(n, -1, dtype=dtype)
+        self.state = np.full(n, NEW, dtype=np.int8)
+
+        # Copias como listas de Python: el bucle las lee elemento a elemento
+        self._arrival = self.arrival.tolist()
+        self._burst = self.burst.tolist()
+        self._keys = np.asarray(keys).tolist()
+
+        self.ready = []
+        self.arrival_cursor = 0
+        self.timeline = GanttRLE(time_dtype=dtype) if keep_slices else None
+
+        self._admit()
+
+    def _admit(self):
+        """Agrega al montículo los procesos que han llegado"""
+        arrival = self._arrival
+        n = len(arrival)
+        cursor = self.arrival_cursor
+        while cursor < n and arrival[cursor] <= self.current_time:
+            heapq.heappush(self.ready, (self._keys[cursor], cursor))
+            self.state[cursor] = READY
+            cursor += 1
+        self.arrival_cursor = cursor
+
+    def step(self):
+        """
+        Ejecuta el próximo proceso completo (o el tiempo ocioso hasta un arribo)
+
+        Returns:
+            tuple: (slot, inicio, fin), con slot = IDLE para tiempo ocioso,
+                   o None si la simulación terminó
+        """
+        start_time = self.current_time
+        if not self.ready:
+            if self.arrival_cursor >= len(self._arrival):
+                return None
+            next_arrival = self._arrival[self.arrival_cursor]
+            if self.timeline is not None:
+                self.timeline.append(IDLE, start_time, next_arrival)
+            self.current_time = next_arrival
+            self._admit()
+            return IDLE, start_time, next_arrival
+
+        _, slot = heapq.heappop(self.ready)
+        end_time = start_time + self._burst[slot]
+        if self.timeline is not None:
+            self.timeline.append(slot, start_time, end_time)
+
+        self.first_response[slot] = start_time
+        self.completion[slot] = end_time
+        self.state[slot] = TERMINATED
+        self.current_time = end_time
+        if self.metrics is not None:
+            turnaround = end_time - self._arrival[slot]
+            self.metrics.record(turnaround - self._burst[slot], turnaround,
+                                start_time - self._arrival[slot])
+
+        self._admit()
+        return slot, start_time, end_time
+
+    def run(self):
+        """Ejecuta la simulación hasta que no quede trabajo"""
+        while self.step() is not None:
+            pass
+
+    def terminated_mask(self):
+        """Máscara de los slots que terminaron su ejecución"""
+        return self.state == TERMINATED
+
+
+class PreemptiveEngine(ABC):
+    def __init__(self, arrival_times, burst_times, keep_slices=True, metrics=None):
+        """
+        Base de los motores expropiativos por eventos
+
+        Los procesos en espera están en un montículo cuya clave (ver _key) se
+        calcula al entrar y no cambia mientras esperan. El proceso en
+        ejecución solo puede ser desplazado en un punto de decisión: una
+        llegada o, si la subclase lo indica con _next_check, un momento en
+        que su orden relativo cambia. El motor avanza de evento en evento y
+        nunca por unidad de tiempo: O((n + expropiaciones) log n) en total.
+
+        Args:
+            arrival_times (array): Tiempos de llegada, ordenados de forma ascendente
+            burst_times (array): Tiempos de ráfaga en el mismo orden
+            keep_slices (bool): Si es False, los intervalos no se guardan (modo streaming)
+            metrics (OnlineMetrics): Métricas en línea a actualizar cuando
+                                     termina cada proceso
+        """
+        self.arrival = np.asarray(arrival_times)
+        self.burst = np.asarray(burst_times)
+        if len(self.arrival) != len(self.burst):
+            raise ValueError("arrival_times y burst_times deben tener la misma longitud")
+        if len(self.arrival) > 1 and np.any(np.diff(self.arrival) < 0):
+            raise ValueError("Los tiempos de llegada deben estar ordenados")
+
+        dtype = np.result_type(self.arrival, self.burst)
+        n = len(self.arrival)
+
+        self.metrics = metrics
+        self.current_time = 0
+        self.remaining = self.burst.astype(dtype, copy=True)
+        self.completion = np.zeros(n, dtype=dtype)
+        self.first_response = np.full(n, -1, dtype=dtype)
+        self.state = np.full(n, NEW, dtype=np.int8)
+
+        # Copias como listas de Python: el bucle las lee elemento a elemento
+        self._arrival = self.arrival.tolist()
+        self._burst = self.burst.tolist()
+        self._remaining = self.remaining.tolist()
+
+        self.ready = []
+        self.arrival_cursor = 0
+        # Proceso en ejecución y momento en que empezó su intervalo actual
+        self.running = None
+        self.slice_start = None
+        self.timeline = GanttRLE(time_dtype=dtype) if keep_slices else None
+
+    @abstractmethod
+    def _key(self, slot):
+        """Clave del montículo de un slot que pasa a esperar en el tiempo actual"""
+
+    @abstractmethod
+    def _preempts(self, slot):
+        """True si el primero del montículo debe desplazar al slot en ejecución"""
+
+    def _next_check(self, slot):
+        """
+        Próximo momento, aparte de las llegadas, en que el primero del
+        montículo podría desplazar al slot en ejecución (None si no hay)
+        """
+        return None
+
+    def _enqueue(self, slot):
+        """Agrega un slot al montículo de espera"""
+        heapq.heappush(self.ready, (self._key(slot), slot))
+        self.state[slot] = READY
+
+    def _admit(self):
+        """Agrega al montículo los procesos que han llegado"""
+        arrival = self._arrival
+        n = len(arrival)
+        cursor = self.arrival_cursor
+        while cursor < n and arrival[cursor] <= self.current_time:
+            self._enqueue(cursor)
+            cursor += 1
+        self.arrival_cursor = cursor
+
+    def _dispatch(self, entry=None):
+        """Pasa a ejecución el primero del montículo (o la entrada ya extraída)"""
+        _, slot = heapq.heappop(self.ready) if entry is None else entry
+        self.running = slot
+        self.slice_start = self.current_time
+        self.state[slot] = RUNNING
+        if self.first_response[slot] == -1:
+            self.first_response[slot] = self.current_time
+        return slot
+
+    def _finish_slice(self, slot, start_time):
+        """Registra el intervalo que el proceso en ejecución acaba de cerrar"""
+        self.running = None
+        if self.timeline is not None:
+            self.timeline.append(slot, start_time, self.current_time)
+        return slot, start_time, self.current_time
+
+    def step(self):
+        """
+        Ejecuta hasta que el proceso actual termina o es desplazado
+
+        Los puntos de decisión que no desplazan al proceso en ejecución (una
+        llegada, por ejemplo) no cortan su intervalo.
+
+        Returns:
+            tuple: (slot, inicio, fin), con slot = IDLE para tiempo ocioso,
+                   o None si la simulación terminó
+        """
+        n = len(self._arrival)
+        if self.running is None:
+            if not self.ready:
+                if self.arrival_cursor >= n:
+                    return None
+                start_time = self.current_time
+                next_arrival = self._arrival[self.arrival_cursor]
+                if self.timeline is not None:
+                    self.timeline.append(IDLE, start_time, next_arrival)
+                self.current_time = next_arrival
+                self._admit()
+                return IDLE, start_time, next_arrival
+            self._dispatch()
+
+        slot = self.running
+        start_time = self.slice_start
+        while True:
+            finish = self.current_time + self._remaining[slot]
+            event = self._arrival[self.arrival_cursor] if self.arrival_cursor < n else None
+            check = self._next_check(slot) if self.ready else None
+            if check is not None and (event is None or check < event):
+                event = check
+            if event is None or finish <= event:
+                break
+
+            # Correr hasta el próximo punto de decisión y ver si alguien lo desplaza
+            self._remaining[slot] -= event - self.current_time
+            self.remaining[slot] = self._remaining[slot]
+            self.current_time = event
+            self._admit()
+            if self.ready and self._preempts(slot):
+                # El sucesor sale del montículo antes de que entre el
+                # desplazado, así que nunca se vuelve a despachar a este
+                successor = heapq.heappop(self.ready)
+                self._enqueue(slot)
+                preempted = self._finish_slice(slot, start_time)
+                self._dispatch(successor)
+                return preempted
+
+        # El proceso termina antes del próximo punto de decisión (o no hay más)
+        self.current_time = finish
+        self._remaining[slot] = 0
+        self.remaining[slot] = 0
+        self.completion[slot] = finish
+        self.state[slot] = TERMINATED
+        if self.metrics is not None:
+            turnaround = finish - self._arrival[slot]
+            self.metrics.record(turnaround - self._burst[slot], turnaround,
+                                self.first_response[slot].item() - self._arrival[slot])
+        self._admit()
+        return self._finish_slice(slot, start_time)
+
+    def run(self):
+        """Ejecuta la simulación hasta que no quede trabajo"""
+        while self.step() is not None:
+            pass
+
+    def terminated_mask(self):
+        """Máscara de los slots que terminaron su ejecución"""
+        return self.state == TERMINATED
+
+
+class SRTFEngine(PreemptiveEngine):
+    def __init__(self, arrival_times, burst_times, keep_slices=True, metrics=None):
+        """
+        Inicializa un motor SRTF (Shortest Remaining Time First)
+
+        El montículo ordena por (tiempo restante, slot): el restante de un
+        proceso no cambia mientras espera, así que las claves nunca quedan
+        viejas. Solo una llegada puede desplazar al proceso en ejecución, y
+        lo hace si le queda estrictamente menos tiempo.
+
+        Args:
+            Los de PreemptiveEngine
+        """
+        super().__init__(arrival_times, burst_times, keep_slices, metrics)
+        self._admit()
+
+    def _key(self, slot):
+        return self._remaining[slot]
+
+    def _preempts(self, slot):
+        return self.ready[0][0] < self._remaining[slot]
+
+
+class AgingPriorityEngine(PreemptiveEngine):
+    def __init__(self, arrival_times, burst_times, priorities, aging_rate,
+                 keep_slices=True, metrics=None):
+        """
+        Inicializa un motor de prioridades expropiativo con envejecimiento lineal
+
+        La prioridad efectiva de un proceso es prioridad - aging_rate × espera
+        (menor = primero), donde la espera es el tiempo total que lleva en la
+        cola. Mientras esperan, todos los procesos envejecen al mismo ritmo,
+        así que entre ellos el orden no cambia: la clave del montículo
+
+            prioridad - aging_rate × (espera previa - instante en que entró)
+
+        se calcula una sola vez al entrar, y la prioridad efectiva en el
+        tiempo t es clave - aging_rate × t. El proceso en ejecución no
+        envejece; el momento en que el primero de la cola lo alcanza se
+        calcula directamente (_next_check) en vez de revisar la cola en cada
+        unidad de tiempo.
+
+        Las decisiones se toman en tiempos enteros: un proceso desplaza al
+        que está en ejecución en el primer instante en que su prioridad
+        efectiva es estrictamente mejor. Para que los empates se decidan de
+        forma exacta, la tasa se toma como la fracción que escribe su
+        representación decimal (0.1 es 1/10) y las claves se guardan
+        multiplicadas por su denominador: con prioridades y tiempos enteros
+        todas las comparaciones son entre enteros.
+
+        Args:
+            arrival_times (array): Tiempos de llegada, ordenados de forma ascendente
+            burst_times (array): Tiempos de ráfaga en el mismo orden
+            priorities (array): Prioridad de cada slot (menor número = mayor prioridad)
+            aging_rate (float): Mejora de prioridad por unidad de tiempo de
+                                espera (0: prioridades expropiativas sin envejecimiento)
+            keep_slices (bool): Si es False, los intervalos no se guardan (modo streaming)
+            metrics (OnlineMetrics): Métricas en línea a actualizar cuando
+                                     termina cada proceso
+
+        Raises:
+            ValueError: Si aging_rate es negativo o las longitudes no coinciden
+        """
+        if aging_rate < 0:
+            raise ValueError("La tasa de envejecimiento no puede ser negativa")
+        super().__init__(arrival_times, burst_times, keep_slices, metrics)
+        if len(priorities) != len(self._arrival):
+            raise ValueError("priorities debe tener la misma longitud que arrival_times")
+
+        self.aging_rate = aging_rate
+        rate = Fraction(str(aging_rate))
+        # Tasa y prioridades escaladas por el denominador de la tasa
+        self._rate = rate.numerator
+        self._scale = rate.denominator
+        self._priority = [p * self._scale for p in np.asarray(priorities).tolist()]
+        # Espera acumulada de cada slot e instante en que entró a la cola
+        self._wait = [0] * len(self._arrival)
+        self._ready_since = [0] * len(self._arrival)
+        self._admit()
+
+    def _key(self, slot):
+        # Las llegadas entran a la cola en su tiempo de llegada
+        since = self.current_time if self.state[slot] != NEW else self._arrival[slot]
+        self._ready_since[slot] = since
+        return self._priority[slot] - self._rate * (self._wait[slot] - since)
+
+    def _dispatch(self, entry=None):
+        slot = super()._dispatch(entry)
+        self._wait[slot] += self.current_time - self._ready_since[slot]
+        return slot
+
+    def effective_priority(self, slot):
+        """Prioridad efectiva de un slot en el tiempo actual"""
+        waited = self._wait[slot]
+        if self.state[slot] == READY:
+            waited += self.current_time - self._ready_since[slot]
+        return (self._priority[slot] - self._rate * waited) / self._scale
+
+    def _preempts(self, slot):
+        running = self._priority[slot] - self._rate * self._wait[slot]
+        return self.ready[0][0] - self._rate * self.current_time < running
+
+    def _next_check(self, slot):
+        if not self._rate:
+            return None
+        # Primer tiempo entero t con clave - tasa × t < prioridad del que corre
+        running = self._priority[slot] - self._rate * self._wait[slot]
+        crossing = (self.ready[0][0] - running) // self._rate
+        return max(int(crossing) + 1, self.current_time + 1)
@@ -0,0 +1,176 @@
+"""
+Visualización paso a paso en la terminal
+
+En lugar de limpiar la pantalla e imprimir la tabla completa en cada
+quantum, StepRenderer dibuja con secuencias ANSI solo las líneas que
+cambiaron desde el cuadro anterior. La tabla se limita al proceso en
+ejecución y a la cola de listos (hasta el alto de la terminal), y los
+cuadros se limitan a un máximo por segundo: los pasos que llegan antes
+se omiten sin detener la simulación.
+"""
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+from motores import TERMINATED, STATE_NAMES
+
+# Secuencias ANSI de control del cursor
+CLEAR_SCREEN = '\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+CLEAR_BELOW = '\x1b[J'
+HIDE_CURSOR = '\x1b[?25l'
+SHOW_CURSOR = '\x1b[?25h'
+
+# Columnas de la tabla, en orden
+COLUMNS = ('process_id', 'arrival_time', 'burst_time', 'remaining_time', 'progress', 'state')
+
+# Líneas de la pantalla que no son filas de procesos (el pie incluye
+# espacio para el mensaje de continuar del modo paso a paso)
+HEADER_LINES = 6
+FOOTER_LINES = 4
+
+
+def move_to(row):
+    """Secuencia para llevar el cursor al inicio de una línea (desde 0)"""
+    return f'\x1b[{row + 1};1H'
+
+
+class StepRenderer:
+    def __init__(self, process_ids, arrival_times, burst_times, max_fps=10,
+                 max_rows=None, stream=None):
+        """
+        Prepara la visualización de una simulación
+
+        Args:
+            process_ids (array): IDs de los procesos, indexados por slot
+            arrival_times (array): Tiempos de llegada por slot
+            burst_times (array): Tiempos de ráfaga por slot
+            max_fps (float): Cuadros por segundo como máximo (None: sin límite)
+            max_rows (int): Filas de procesos como máximo; por defecto, las
+                            que caben en la terminal
+            stream: Salida donde dibujar (sys.stdout por defecto)
+        """
+        self.process_ids = np.asarray(process_ids)
+        self.arrival = np.asarray(arrival_times)
+        self.burst = np.asarray(burst_times)
+        self.min_interval = 1 / max_fps if max_fps else 0
+        if max_rows is None:
+            max_rows = shutil.get_terminal_size().lines - HEADER_LINES - FOOTER_LINES
+        self.max_rows = max(max_rows, 1)
+        self.stream = stream if stream is not None else sys.stdout
+
+        # Ancho fijo de cada columna, para que una fila solo cambie con su contenido
+        n = len(self.process_ids)
+        self._widths = [
+            max(len(COLUMNS[0]), max((len(str(pid)) for pid in self.process_ids), default=0)),
+            max(len(COLUMNS[1]), len(str(self.arrival.max())) if n else 0),
+            max(len(COLUMNS[2]), len(str(self.burst.max())) if n else 0),
+            max(len(COLUMNS[3]), len(str(self.burst.max())) if n else 0),
+            max(len(COLUMNS[4]), len('100.0')),
+            max(len(name) for name in STATE_NAMES)
+        ]
+        self.width = sum(self._widths) + len(self._widths) - 1
+
+        self._lines = None
+        self._last_draw = -float('inf')
+        self._pending = None
+
+        # Activar las secuencias ANSI en la consola de Windows
+        if os.name == 'nt':
+            os.system('')
+
+    def _row(self, values):
+        cells = [str(values[0]).ljust(self._widths[0])]
+        cells += [str(value).rjust(width) for value, width in zip(values[1:], self._widths[1:])]
+        return ' '.join(cells)
+
+    def _frame(self, engine, slot, time_slice):
+        """Líneas de un cuadro: encabezado, proceso en ejecución, cola y resumen"""
+        lines = [
+            '=' * self.width,
+            f"Tiempo actual: {engine.current_time}",
+            f"Ejecutando proceso: {self.process_ids[slot]} por {time_slice} unidades de tiempo",
+            '=' * self.width,
+            '',
+            self._row(COLUMNS)
+        ]
+
+        # Proceso despachado seguido de la cola de listos (sin copias repetidas);
+        # solo se recorre el principio de la cola
+        window = [slot]
+        shown = {slot}
+        for row in engine.ready_queue:
+            if len(window) >= self.max_rows:
+                break
+            if row not in shown:
+                window.append(row)
+                shown.add(row)
+        for row in window:
+            burst = self.burst[row]
+            remaining = engine.remaining[row]
+            progress = round((burst - remaining) / burst * 100, 1) if burst else 100.0
+            lines.append(self._row((self.process_ids[row], self.arrival[row], burst, remaining,
+                                    progress, STATE_NAMES[engine.state[row]])))
+
+        ready = np.count_nonzero(engine.queued)
+        hidden = ready + (engine.queued[slot] == 0) - len(window)
+        finished = np.count_nonzero(engine.state == TERMINATED)
+        lines.append('')
+        lines.append(f"Listos: {ready}" + (f" ({hidden} sin mostrar)" if hidden > 0 else "") +
+                     f" | Terminados: {finished}/{len(self.process_ids)}")
+        return lines
+
+    def render(self, engine, slot, time_slice, force=False):
+        """
+        Dibuja el estado después de un paso, si ya pasó el intervalo mínimo
+
+        Args:
+            engine (RoundRobinEngine): Motor de la simulación
+            slot (int): Slot del proceso que se acaba de ejecutar
+            time_slice: Tiempo que se ejecutó
+            force (bool): Dibujar aunque no haya pasado el intervalo mínimo
+
+        Returns:
+            bool: True si se dibujó el cuadro
+        """
+        now = time.monotonic()
+        if not force and now - self._last_draw < self.min_interval:
+            # Se recuerda el paso para dibujarlo al cerrar si fue el último
+            self._pending = (engine, slot, time_slice)
+            return False
+        self._pending = None
+        self._last_draw = now
+        self._draw(self._frame(engine, slot, time_slice))
+        return True
+
+    def _draw(self, lines):
+        """Escribe solo las líneas que cambiaron desde el cuadro anterior"""
+        if self._lines is None:
+            output = [HIDE_CURSOR, CLEAR_SCREEN]
+            previous = []
+        else:
+            output = []
+            previous = self._lines
+
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                output.append(move_to(row) + line + CLEAR_LINE)
+        # El cursor queda debajo de la tabla, donde escribe input()
+        output.append(move_to(len(lines)))
+        if len(lines) < len(previous):
+            output.append(CLEAR_BELOW)
+
+        self.stream.write(''.join(output))
+        self.stream.flush()
+        self._lines = lines
+
+    def close(self):
+        """Dibuja el último paso pendiente y vuelve a mostrar el cursor"""
+        if self._pending is not None:
+            self.render(*self._pending, force=True)
+        if self._lines is not None:
+            self.stream.write(SHOW_CURSOR)
+            self.stream.flush()
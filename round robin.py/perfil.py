@@ -0,0 +1,238 @@
+"""
+Medición del tiempo de cada fase de la simulación
+
+PhaseProfiler reemplaza, solo mientras está activo, los métodos de cada
+fase (admisión, despacho, registro del Gantt...) por envoltorios que miden
+su duración con perf_counter_ns. Los envoltorios se instalan en los objetos
+de la simulación medida (el simulador, su motor, el diario...), nunca en
+las clases, de modo que otras simulaciones no se ven afectadas. Al salir
+se quitan, así que con la medición desactivada el bucle de simulación no
+paga ningún costo.
+
+El tiempo de cada fase es exclusivo: si una fase llama a otra (el despacho
+admite llegadas, por ejemplo), el tiempo de la llamada interna se cuenta
+solo en la fase interna.
+"""
+import functools
+from time import perf_counter_ns
+
+from diario import StatusJournal
+from gantt import GanttRLE
+from metricas import OnlineMetrics
+from motores import RoundRobinEngine
+from puntos_control import Checkpointer
+
+# Fases del motor Round Robin, comunes a los dos simuladores: (clase, método, fase)
+ENGINE_PHASES = (
+    (RoundRobinEngine, 'step', 'despacho'),
+    (RoundRobinEngine, '_admit', 'admisión'),
+    (RoundRobinEngine, '_next_arrival', 'admisión'),
+    (RoundRobinEngine, '_run_rounds', 'rondas en bloque'),
+    (GanttRLE, 'append', 'gantt'),
+    (GanttRLE, 'extend_rounds', 'gantt'),
+    (StatusJournal, 'record', 'diario'),
+    (StatusJournal, 'end_step', 'diario'),
+    (StatusJournal, 'record_batch', 'diario'),
+    (OnlineMetrics, 'record', 'métricas'),
+    (Checkpointer, 'maybe_save', 'puntos de control')
+)
+
+# Fase del tiempo no atribuido a ningún método medido
+OTHER = 'otros'
+
+
+class PhaseProfiler:
+    def __init__(self, phases, targets=()):
+        """
+        Prepara la medición de un conjunto de fases
+
+        Args:
+            phases (iterable): Tuplas (clase, nombre del método, fase); varios
+                               métodos pueden compartir la misma fase
+            targets (iterable): Objetos a instrumentar al entrar (ver
+                                instrument); los creados durante la medición
+                                se agregan con instrument o track
+        """
+        self._initial = list(targets)
+        self.phases = list(dict.fromkeys(phases))
+        self.time_ns = {}
+        self.calls = {}
+        self.total_ns = 0
+        self._classes = tuple({owner for owner, _, _ in self.phases})
+        self._targets = []
+        self._patched = []
+        self._seen = set()
+        self._children = []
+        self._start = None
+        for _, _, phase in self.phases:
+            self.time_ns.setdefault(phase, 0)
+            self.calls.setdefault(phase, 0)
+
+    def _wrap(self, method, phase):
+        time_ns = self.time_ns
+        calls = self.calls
+        children = self._children
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            children.append(0)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                inner = children.pop()
+                time_ns[phase] += elapsed - inner
+                calls[phase] += 1
+                if children:
+                    children[-1] += elapsed
+        return timed
+
+    def instrument(self, obj):
+        """
+        Mide los métodos de un objeto de la simulación mientras la medición está activa
+
+        Los envoltorios se guardan como atributos del objeto, que ocultan el
+        método de la clase. También se instrumentan los objetos medibles que
+        el objeto guarda en sus atributos (el diario y las métricas de un
+        motor, por ejemplo). Instrumentar dos veces el mismo objeto no tiene
+        efecto.
+
+        Args:
+            obj: Objeto cualquiera; solo se miden los métodos de las fases
+                 cuya clase es la del objeto o una de sus bases
+        """
+        if id(obj) in self._seen or not hasattr(obj, '__dict__'):
+            return
+        self._seen.add(id(obj))
+        self._targets.append(obj)
+        for owner, name, phase in self.phases:
+            if isinstance(obj, owner) and name not in obj.__dict__:
+                self._patched.append((obj, name))
+                setattr(obj, name, self._wrap(getattr(obj, name), phase))
+        for value in list(vars(obj).values()):
+            if isinstance(value, self._classes):
+                self.instrument(value)
+
+    def _restore(self):
+        """Quita los envoltorios instalados, en orden inverso"""
+        while self._patched:
+            obj, name = self._patched.pop()
+            obj.__dict__.pop(name, None)
+        self._seen.clear()
+        self._targets.clear()
+
+    def __enter__(self):
+        try:
+            for target in self._initial:
+                self.instrument(target)
+        except BaseException:
+            self._restore()
+            raise
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.total_ns += perf_counter_ns() - self._start
+        finally:
+            self._restore()
+        return False
+
+    def report(self, events=None):
+        """
+        Desglose del tiempo por fase
+
+        Args:
+            events (int): Eventos de la simulación (intervalos del Gantt),
+                          para calcular el costo por evento
+
+        Returns:
+            dict: 'total_ns', 'events' y 'phases': fase -> 'calls', 'time_ns',
+                  'share', 'ns_per_call' y 'ns_per_event', de mayor a menor
+                  tiempo (sin las fases que no se ejecutaron)
+        """
+        times = dict(self.time_ns)
+        calls = dict(self.calls)
+        times[OTHER] = max(self.total_ns - sum(times.values()), 0)
+        calls[OTHER] = 0
+
+        phases = {}
+        for phase, time_ns in sorted(times.items(), key=lambda item: -item[1]):
+            if not calls[phase] and phase != OTHER:
+                continue
+            phases[phase] = {
+                'calls': calls[phase],
+                'time_ns': time_ns,
+                'share': time_ns / self.total_ns if self.total_ns else 0.0,
+                'ns_per_call': time_ns / calls[phase] if calls[phase] else None,
+                'ns_per_event': time_ns / events if events else None
+            }
+        return {'total_ns': self.total_ns, 'events': events, 'phases': phases}
+
+
+def format_report(report):
+    """Tabla de texto con el desglose de PhaseProfiler.report()"""
+    lines = [f"{'Fase':20} {'Llamadas':>10} {'Tiempo (ms)':>12} {'%':>6} "
+             f"{'ns/llamada':>11} {'ns/evento':>10}"]
+    for phase, row in report['phases'].items():
+        per_call = f"{row['ns_per_call']:.0f}" if row['ns_per_call'] is not None else '-'
+        per_event = f"{row['ns_per_event']:.0f}" if row['ns_per_event'] is not None else '-'
+        lines.append(f"{phase:20} {row['calls']:>10} {row['time_ns'] / 1e6:>12.2f} "
+                     f"{row['share'] * 100:>6.1f} {per_call:>11} {per_event:>10}")
+    lines.append(f"Total: {report['total_ns'] / 1e6:.2f} ms"
+                 + (f" en {report['events']} eventos" if report['events'] else ""))
+    return '\n'.join(lines)
+
+
+def profiled(method):
+    """
+    Decorador de los métodos simulate_*/run_simulation de los simuladores
+
+    Si el simulador tiene self.profile activado, ejecuta el método dentro de
+    un PhaseProfiler con las fases de self.profile_phases(), instrumentando
+    el propio simulador (los objetos que cree el método se agregan con
+    track), guarda el desglose en self.profile_report (y en la clave
+    'profile' del resultado) y lo imprime. Si no, llama al método
+    directamente.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Un método medido que llama a otro (resume, continue_simulation) se mide una vez
+        if not self.profile or self.__dict__.get('_profiler') is not None:
+            return method(self, *args, **kwargs)
+
+        try:
+            with PhaseProfiler(self.profile_phases(), [self]) as profiler:
+                self._profiler = profiler
+                results = method(self, *args, **kwargs)
+        finally:
+            self._profiler = None
+        events = self.gantt.n_slices if self.gantt is not None else None
+        self.profile_report = profiler.report(events)
+        if isinstance(results, dict):
+            results['profile'] = self.profile_report
+        print(f"\nTiempo por fase ({method.__name__}):")
+        print(format_report(self.profile_report))
+        return results
+    return wrapper
+
+
+def track(simulator, obj):
+    """
+    Instrumenta un objeto creado durante una medición activa del simulador
+
+    Los simuladores pasan por aquí los motores, diagramas y puntos de control
+    que crean dentro de un método medido; sin medición activa no hace nada.
+
+    Args:
+        simulator: Simulador dueño de la medición (ver profiled)
+        obj: Objeto recién creado
+
+    Returns:
+        El mismo objeto, para usarlo en la misma expresión
+    """
+    profiler = simulator.__dict__.get('_profiler')
+    if profiler is not None:
+        profiler.instrument(obj)
+    return obj
@@ -0,0 +1,208 @@
+"""
+Puntos de control para simulaciones largas de Round Robin
+
+Un punto de control es un directorio con:
+
+    workload/      La tabla de procesos inicial (formato de almacen.py)
+    logs/*.npy     Columnas de salida (tramos del Gantt y diario de estados),
+                   a las que cada guardado solo agrega lo nuevo
+    state.npz      Estado del motor y longitud válida de cada columna de salida
+
+state.npz se reemplaza de forma atómica en cada guardado y se escribe
+después de las columnas, así que siempre describe un estado consistente:
+si la ejecución se interrumpe, lo escrito después en las columnas se
+descarta al reanudar y la simulación continúa de forma idéntica.
+"""
+import json
+import os
+import time
+import zlib
+
+import numpy as np
+
+from almacen import ColumnWriter, read_column, save_run, load_run
+
+# Intervalo por defecto entre guardados, en segundos
+DEFAULT_INTERVAL = 60.0
+
+
+def _fingerprint(engine):
+    """Suma de verificación de la carga, para no reanudar con otros datos"""
+    checksum = zlib.crc32(np.ascontiguousarray(engine.arrival).tobytes())
+    return zlib.crc32(np.ascontiguousarray(engine.burst).tobytes(), checksum)
+
+
+class Checkpointer:
+    def __init__(self, path, interval=DEFAULT_INTERVAL):
+        """
+        Prepara un directorio de puntos de control
+
+        Args:
+            path (str): Directorio de los puntos de control
+            interval (float): Segundos mínimos entre guardados de maybe_save()
+        """
+        self.path = path
+        self.interval = interval
+        self.meta = {}
+        self.processes = None
+        self._engine = None
+        self._logs = {}
+        self._writers = {}
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def create(cls, path, processes, engine, journal=None, meta=None, interval=DEFAULT_INTERVAL):
+        """
+        Inicia los puntos de control de una simulación nueva
+
+        Args:
+            path (str): Directorio de los puntos de control (se crea si no existe)
+            processes (DataFrame): Tabla de procesos inicial
+            engine (RoundRobinEngine): Motor recién creado
+            journal (StatusJournal): Diario de estados, si la simulación lo lleva
+            meta (dict): Parámetros de la simulación (quantum, algoritmo...)
+            interval (float): Segundos mínimos entre guardados
+
+        Returns:
+            Checkpointer: Listo para guardar; ya escribió el primer punto de control
+        """
+        checkpointer = cls(path, interval)
+        checkpointer.meta = dict(meta or {})
+        checkpointer.meta['batch_rounds'] = engine.batch_rounds
+        checkpointer.meta['journal'] = journal is not None
+        checkpointer.meta['fingerprint'] = _fingerprint(engine)
+
+        os.makedirs(os.path.join(path, 'logs'), exist_ok=True)
+        save_run(os.path.join(path, 'workload'), processes)
+        checkpointer._attach(engine, journal, lengths=None)
+        checkpointer.save()
+        return checkpointer
+
+    @classmethod
+    def open(cls, path, interval=DEFAULT_INTERVAL):
+        """
+        Abre un punto de control existente para reanudarlo
+
+        Args:
+            path (str): Directorio de los puntos de control
+            interval (float): Segundos mínimos entre guardados al continuar
+
+        Returns:
+            Checkpointer: Con meta, processes y el estado guardado cargados
+        """
+        checkpointer = cls(path, interval)
+        with np.load(os.path.join(path, 'state.npz')) as archive:
+            checkpointer._saved = {name: archive[name] for name in archive.files}
+        checkpointer.meta = json.loads(checkpointer._saved.pop('meta').tobytes().decode('utf-8'))
+        checkpointer.processes = load_run(os.path.join(path, 'workload'), mmap_mode=None)['processes']
+        return checkpointer
+
+    def restore(self, engine, journal=None):
+        """
+        Lleva un motor (y su diario) recién creados al estado guardado
+
+        Args:
+            engine (RoundRobinEngine): Motor creado con la tabla de self.processes
+            journal (StatusJournal): Diario nuevo, si la simulación lo lleva
+
+        Raises:
+            ValueError: Si la carga del motor no es la del punto de control
+        """
+        if _fingerprint(engine) != self.meta['fingerprint']:
+            raise ValueError("La carga de trabajo no coincide con la del punto de control")
+        saved = self._saved
+
+        engine.load_state_dict({name[len('engine/'):]: values for name, values in saved.items()
+                                if name.startswith('engine/')})
+        lengths = {name[len('length/'):]: int(values) for name, values in saved.items()
+                   if name.startswith('length/')}
+
+        logs = self._log_columns(engine, journal)
+        columns = {name: read_column(self._log_path(name), column.view().dtype, lengths[name])
+                   for name, column in logs.items()}
+
+        if engine.timeline is not None:
+            open_run = None
+            if 'timeline/open_ids' in saved:
+                owner, count = saved['timeline/open_ids'].tolist()
+                start, end = saved['timeline/open_times'].tolist()
+                open_run = [owner, start, end, count]
+            engine.timeline.restore({name[len('timeline/'):]: values for name, values in columns.items()
+                                     if name.startswith('timeline/')},
+                                    open_run, int(saved['timeline/n_slices']))
+        if journal is not None:
+            journal.restore({name[len('journal/'):]: values for name, values in columns.items()
+                             if name.startswith('journal/')},
+                            int(saved['journal/steps']))
+
+        self._attach(engine, journal, lengths)
+
+    def _log_path(self, name):
+        return os.path.join(self.path, 'logs', name.replace('/', '.') + '.npy')
+
+    @staticmethod
+    def _log_columns(engine, journal):
+        """Columnas de salida de solo agregado, con nombre 'origen/columna'"""
+        logs = {}
+        if engine.timeline is not None:
+            logs.update({'timeline/' + name: column
+                         for name, column in engine.timeline.log_columns().items()})
+        if journal is not None:
+            logs.update({'journal/' + name: column for name, column in journal.log_columns().items()})
+        return logs
+
+    def _attach(self, engine, journal, lengths):
+        """Abre las columnas de salida (nuevas, o truncadas a 'lengths')"""
+        self._engine = engine
+        self._journal = journal
+        self._logs = self._log_columns(engine, journal)
+        for name, column in self._logs.items():
+            dtype = column.view().dtype
+            if lengths is None:
+                self._writers[name] = ColumnWriter(self._log_path(name), dtype)
+            else:
+                self._writers[name] = ColumnWriter.reopen(self._log_path(name), dtype, lengths[name])
+
+    def maybe_save(self):
+        """Guarda un punto de control si pasó el intervalo desde el último"""
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save()
+
+    def save(self):
+        """Agrega las salidas nuevas a las columnas y reemplaza state.npz"""
+        arrays = {}
+        for name, column in self._logs.items():
+            writer = self._writers[name]
+            writer.append(column.view()[writer.length:])
+            writer.flush()
+            arrays['length/' + name] = writer.length
+
+        for name, value in self._engine.state_dict().items():
+            arrays['engine/' + name] = value
+        timeline = self._engine.timeline
+        if timeline is not None:
+            arrays['timeline/n_slices'] = timeline.n_slices
+            open_run = timeline.open_run
+            if open_run is not None:
+                owner, start, end, count = open_run
+                arrays['timeline/open_ids'] = np.array([owner, count], dtype=np.int64)
+                arrays['timeline/open_times'] = np.array([start, end], dtype=self._engine.remaining.dtype)
+        if self._journal is not None:
+            arrays['journal/steps'] = self._journal.steps
+        arrays['meta'] = np.frombuffer(json.dumps(self.meta).encode('utf-8'), dtype=np.uint8)
+
+        # Escribir aparte y reemplazar: state.npz nunca queda a medias
+        target = os.path.join(self.path, 'state.npz')
+        temporary = target + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, target)
+        self._last_save = time.monotonic()
+
+    def close(self):
+        """Guarda un último punto de control y cierra las columnas"""
+        self.save()
+        for writer in self._writers.values():
+            writer.close()
@@ -0,0 +1,340 @@
+"""
+Pruebas de rendimiento de los simuladores
+
+Ejecuta las tres implementaciones de Round Robin (RoundRobinSimulator,
+PlanificadorCompleto.simulate_round_robin y nuevo.round_robin) y los
+algoritmos FIFO, SJF, Prioridad, SRTF y Prioridad con envejecimiento de
+PlanificadorCompleto sobre cargas generadas de 10 a 10^6 procesos, con
+varios quantums y densidades de llegada. Cada caso corre en un proceso
+nuevo, de modo que la memoria máxima (peak RSS) medida es solo la suya.
+
+Los resultados se guardan en JSON. Con --baseline se comparan con una
+ejecución anterior y se marcan las regresiones de tiempo y de escala
+(exponente empírico de crecimiento entre tamaños consecutivos).
+
+Uso:
+    python rendimiento.py --sizes 10 100 1000 --output resultados.json
+    python rendimiento.py --baseline base.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+import pandas as pd
+
+from generador import WorkloadGenerator, PoissonArrivals, ExponentialBursts
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPLEMENTATIONS = ('rr_simulador', 'rr_planificador', 'rr_nuevo', 'fifo', 'sjf', 'prioridad', 'srtf',
+                   'envejecimiento')
+SIZES = (10, 100, 1000, 10_000, 100_000, 1_000_000)
+QUANTA = (2, 8)
+
+# Densidad de llegadas: fracción de la CPU que piden los procesos (ρ = tasa × ráfaga media)
+DENSITIES = {'baja': 0.5, 'alta': 0.9, 'saturada': 1.5}
+MEAN_BURST = 10
+
+# Algoritmos que no usan el quantum: se miden una sola vez por tamaño y densidad
+QUANTUM_FREE = ('fifo', 'sjf', 'prioridad', 'srtf', 'envejecimiento')
+
+# Las regresiones de tiempo por debajo de este umbral se consideran ruido
+NOISE_FLOOR = 0.005
+
+
+def make_workload(size, density, seed=0):
+    """
+    Genera la carga de un caso (siempre la misma para los mismos parámetros)
+
+    Args:
+        size (int): Número de procesos
+        density (str): Clave de DENSITIES
+        seed (int): Semilla
+
+    Returns:
+        DataFrame: Procesos con 'process_id', 'arrival_time', 'burst_time' y 'priority'
+    """
+    rate = DENSITIES[density] / MEAN_BURST
+    generator = WorkloadGenerator(PoissonArrivals(rate), ExponentialBursts(MEAN_BURST),
+                                  chunk_duration=10_000 / rate, seed=seed)
+    return generator.generate(n_processes=size)
+
+
+def _load_module(name, filename):
+    """Importa un módulo del directorio por ruta (algunos nombres tienen espacios)"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _prepare(implementation, workload, quantum):
+    """
+    Construye el simulador de un caso, fuera del tiempo medido
+
+    Returns:
+        callable: Ejecuta la simulación y devuelve el número de intervalos
+    """
+    if implementation == 'rr_simulador':
+        simulator = _load_module('round_robin', 'round robin.py').RoundRobinSimulator(quantum)
+        simulator.load_processes(workload[['process_id', 'arrival_time', 'burst_time']])
+
+        def run():
+            simulator.run_simulation(visualize=False)
+            return simulator.gantt.n_slices
+        return run
+
+    if implementation == 'rr_nuevo':
+        # nuevo.py ejecuta su ejemplo al importarse
+        with contextlib.redirect_stdout(io.StringIO()):
+            nuevo = _load_module('nuevo', 'nuevo.py')
+        processes = [nuevo.Proceso(*row) for row in
+                     workload[['process_id', 'arrival_time', 'burst_time', 'priority']]
+                     .itertuples(index=False)]
+
+        def run():
+            _, gantt = nuevo.round_robin(processes, quantum)
+            return len(gantt)
+        return run
+
+    from simulador_completo import PlanificadorCompleto
+    planner = PlanificadorCompleto(quantum)
+    planner.load_processes(workload)
+    simulate = {
+        'rr_planificador': planner.simulate_round_robin,
+        'fifo': planner.simulate_fifo,
+        'sjf': planner.simulate_sjf,
+        'prioridad': planner.simulate_priority,
+        'srtf': planner.simulate_srtf,
+        'envejecimiento': planner.simulate_priority_aging
+    }[implementation]
+
+    def run():
+        return simulate()['gantt'].n_slices
+    return run
+
+
+def _peak_rss():
+    """Memoria residente máxima del proceso en bytes (None si no se puede medir)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes; macOS, bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _run_case(case, results):
+    """Proceso hijo: genera la carga, ejecuta un caso y envía sus medidas"""
+    try:
+        workload = make_workload(case['size'], case['density'], case['seed'])
+        # Las implementaciones imprimen su progreso: se descarta
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            run = _prepare(case['implementation'], workload, case['quantum'])
+            rss_before = _peak_rss()
+            start = time.perf_counter()
+            slices = run()
+            wall_time = time.perf_counter() - start
+        results.put({
+            'status': 'ok',
+            'wall_time': wall_time,
+            'slices': int(slices),
+            'slices_per_second': slices / wall_time if wall_time > 0 else None,
+            'rss_before': rss_before,
+            'peak_rss': _peak_rss()
+        })
+    except Exception as error:
+        results.put({'status': 'error', 'error': f"{type(error).__name__}: {error}"})
+
+
+def run_case(case, timeout):
+    """
+    Ejecuta un caso en un proceso nuevo
+
+    Args:
+        case (dict): 'implementation', 'size', 'density', 'quantum' y 'seed'
+        timeout (float): Segundos máximos del caso
+
+    Returns:
+        dict: El caso con sus medidas y 'status' ('ok', 'timeout' o 'error')
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    worker = context.Process(target=_run_case, args=(case, results))
+    worker.start()
+
+    # Esperar las medidas sin quedar bloqueado si el hijo muere (p. ej. sin memoria)
+    deadline = time.monotonic() + timeout
+    measures = {'status': 'timeout'}
+    while time.monotonic() < deadline:
+        try:
+            measures = results.get(timeout=min(1, max(deadline - time.monotonic(), 0.01)))
+            break
+        except queue.Empty:
+            if not worker.is_alive():
+                measures = {'status': 'error', 'error': f"código de salida {worker.exitcode}"}
+                break
+    if worker.is_alive() and measures['status'] == 'timeout':
+        worker.terminate()
+    worker.join()
+    return {**case, **measures}
+
+
+def _key(result):
+    return result['implementation'], result['size'], result['density'], result['quantum']
+
+
+def add_exponents(results):
+    """
+    Agrega a cada resultado el exponente empírico de crecimiento del tiempo
+
+    El exponente entre dos tamaños consecutivos del mismo algoritmo,
+    densidad y quantum es log(t2 / t1) / log(n2 / n1): cerca de 1 para un
+    costo lineal y de 2 para uno cuadrático.
+    """
+    previous = {}
+    for result in sorted(results, key=lambda r: (_key(r)[0], r['density'], r['quantum'], r['size'])):
+        series = (result['implementation'], result['density'], result['quantum'])
+        result['exponent'] = None
+        before = previous.get(series)
+        if result['status'] == 'ok' and before is not None and before['wall_time'] > 0:
+            result['exponent'] = (math.log(result['wall_time'] / before['wall_time']) /
+                                  math.log(result['size'] / before['size']))
+        if result['status'] == 'ok':
+            previous[series] = result
+
+
+def compare(results, baseline, tolerance=0.25, exponent_tolerance=0.3):
+    """
+    Marca las regresiones respecto a una ejecución anterior
+
+    Args:
+        results (list): Resultados actuales (con exponentes)
+        baseline (list): Resultados de referencia
+        tolerance (float): Aumento relativo de tiempo permitido
+        exponent_tolerance (float): Aumento permitido del exponente de escala
+
+    Returns:
+        list: Resultados con alguna regresión
+    """
+    reference = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        result['flags'] = []
+        base = reference.get(_key(result))
+        if base is None or base.get('status') != 'ok':
+            continue
+        if result['status'] != 'ok':
+            result['flags'].append(result['status'])
+        else:
+            slower = result['wall_time'] - base['wall_time']
+            if slower > NOISE_FLOOR and result['wall_time'] > base['wall_time'] * (1 + tolerance):
+                result['flags'].append('tiempo')
+            if (result['exponent'] is not None and base.get('exponent') is not None and
+                    result['exponent'] > base['exponent'] + exponent_tolerance):
+                result['flags'].append('escala')
+        result['baseline_wall_time'] = base['wall_time']
+        if result['flags']:
+            regressions.append(result)
+    return regressions
+
+
+def run_benchmarks(implementations=IMPLEMENTATIONS, sizes=SIZES, quanta=QUANTA,
+                   densities=tuple(DENSITIES), timeout=300, max_seconds=60, seed=0):
+    """
+    Ejecuta todos los casos, de menor a mayor tamaño
+
+    Cuando un caso tarda más de max_seconds (o no termina), los tamaños
+    mayores de la misma serie se omiten y se registran como 'skipped'.
+
+    Returns:
+        list: Un resultado por caso
+    """
+    results = []
+    for implementation in implementations:
+        for density in densities:
+            for quantum in (quanta[:1] if implementation in QUANTUM_FREE else quanta):
+                too_slow = False
+                for size in sorted(sizes):
+                    case = {'implementation': implementation, 'size': size, 'density': density,
+                            'quantum': quantum, 'seed': seed}
+                    if too_slow:
+                        results.append({**case, 'status': 'skipped'})
+                        continue
+                    result = run_case(case, timeout)
+                    results.append(result)
+                    print(f"{implementation:16} n={size:<8} {density:9} q={quantum:<3} "
+                          + (f"{result['wall_time']:10.4f} s" if result['status'] == 'ok'
+                             else result['status']))
+                    too_slow = result['status'] != 'ok' or result['wall_time'] > max_seconds
+    add_exponents(results)
+    return results
+
+
+def environment():
+    """Datos del entorno de ejecución, guardados junto a los resultados"""
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento de los simuladores")
+    parser.add_argument('--implementations', nargs='+', choices=IMPLEMENTATIONS, default=IMPLEMENTATIONS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--quanta', nargs='+', type=int, default=QUANTA)
+    parser.add_argument('--densities', nargs='+', choices=tuple(DENSITIES), default=tuple(DENSITIES))
+    parser.add_argument('--timeout', type=float, default=300, help="Segundos máximos por caso")
+    parser.add_argument('--max-seconds', type=float, default=60,
+                        help="Tiempo a partir del cual se omiten los tamaños mayores")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='resultados_rendimiento.json')
+    parser.add_argument('--baseline', help="Resultados de referencia para detectar regresiones")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Aumento relativo de tiempo tolerado respecto a la referencia")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.implementations, args.sizes, args.quanta, args.densities,
+                             args.timeout, args.max_seconds, args.seed)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    print(f"\nResultados guardados en {args.output}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regresiones respecto a {args.baseline}:")
+        for result in regressions:
+            print(f"  {result['implementation']} n={result['size']} {result['density']} "
+                  f"q={result['quantum']}: {', '.join(result['flags'])}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,758 +1,931 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import time
-
-# Definir una función para limpiar la pantalla sin depender de IPython
-def clear_screen():
-    """Función alternativa para limpiar la pantalla"""
-    print("\n" * 50)  # Imprimir líneas en blanco como alternativa
-
-class RoundRobinSimulator:
-    def __init__(self, quantum):
-        """
-        Inicializa el simulador de Round Robin con un quantum especificado
-        
-        Args:
-            quantum (int): Cantidad de tiempo asignado a cada proceso
-        """
-        self.quantum = quantum
-        self.processes = pd.DataFrame()
-        self.current_time = 0
-        self.execution_sequence = []
-        self.gantt_data = []
-        self.process_status = []
-        self.waiting_times = {}
-        self.turnaround_times = {}
-    
-    def add_process(self, process_id, arrival_time, burst_time):
-        """
-        Agrega un proceso a la simulación
-        
-        Args:
-            process_id (str): Identificador único del proceso
-            arrival_time (int): Tiempo de llegada del proceso
-            burst_time (int): Tiempo de CPU requerido por el proceso
-        """
-        new_process = pd.DataFrame({
-            'process_id': [process_id],             # ID del proceso
-            'arrival_time': [arrival_time],         # Tiempo de llegada al sistema
-            'burst_time': [burst_time],             # Tiempo total de ejecución requerido
-            'remaining_time': [burst_time],         # Tiempo restante de ejecución
-            'completion_time': [0],                 # Tiempo de finalización
-            'waiting_time': [0],                    # Tiempo de espera en cola
-            'turnaround_time': [0],                 # Tiempo total en el sistema
-            'first_response': [-1],                 # Tiempo de primera respuesta
-            'state': ['NEW']                        # Estado del proceso
-        })
-        
-        # Concatenar el nuevo proceso al DataFrame de procesos
-        self.processes = pd.concat([self.processes, new_process], ignore_index=True)
-        
-        # Ordenar los procesos por tiempo de llegada
-        self.processes = self.processes.sort_values(by=['arrival_time', 'process_id']).reset_index(drop=True)
-        
-    def add_processes_from_dataframe(self, df):
-        """
-        Agrega múltiples procesos desde un DataFrame
-        
-        Args:
-            df (DataFrame): DataFrame con columnas 'process_id', 'arrival_time', 'burst_time'
-        """
-        for _, row in df.iterrows():
-            self.add_process(row['process_id'], row['arrival_time'], row['burst_time'])
-            
-    def is_arrived(self, process_id, current_time):
-        """Verifica si un proceso ha llegado al sistema"""
-        process = self.processes[self.processes['process_id'] == process_id]
-        return process['arrival_time'].values[0] <= current_time
-            
-    def get_ready_queue(self, current_time):
-        """
-        Obtiene la cola de procesos listos en el tiempo actual
-        
-        Returns:
-            DataFrame: DataFrame con los procesos listos para ejecutar
-        """
-        # Procesos que han llegado y aún no han terminado
-        ready = self.processes[
-            (self.processes['arrival_time'] <= current_time) & 
-            (self.processes['remaining_time'] > 0)
-        ]
-        return ready
-    
-    def run_simulation(self, visualize=False, step_by_step=False, delay=0.5):
-        """
-        Ejecuta la simulación del algoritmo Round Robin
-        
-        Args:
-            visualize (bool): Si es True, muestra la simulación visualmente
-            step_by_step (bool): Si es True, espera entrada del usuario entre pasos
-            delay (float): Tiempo de espera entre pasos si step_by_step es False
-        """sssssssssssssssssssssssssssssssssss
-        self.execution_sequence = []
-        self.gantt_data = []
-        self.process_status = []
-        self.current_time = 0
-        ready_queue = []
-        
-        # Inicializar el tiempo restante para cada proceso
-        self.processes['remaining_time'] = self.processes['burst_time']
-        self.processes['state'] = 'NEW'
-        self.processes['first_response'] = -
-        
-        # Función auxiliar para agregar procesos que han llegado
-        def add_arrived_processes():
-            for i, row in self.processes.iterrows():
-                if (row['arrival_time'] <= self.current_time and 
-                    row['remaining_time'] > 0 and 
-                    row['process_id'] not in ready_queue and 
-                    row['state'] != 'TERMINATED'):
-                    
-                    ready_queue.append(row['process_id'])
-                    
-                    # Actualizar el estado del proceso a READY
-                    if self.processes.loc[i, 'state'] == 'NEW':
-                        self.processes.loc[i, 'state'] = 'READY'
-        
-        # Agregar procesos que ya han llegado al tiempo 0
-        add_arrived_processes()
-        
-        # Mientras haya procesos con tiempo restante
-        while True:
-            # Si la cola está vacía pero aún hay procesos que no han llegado
-            if not ready_queue and self.processes[self.processes['remaining_time'] > 0].shape[0] > 0:
-                next_arrival = self.processes[
-                    (self.processes['remaining_time'] > 0) & 
-                    (self.processes['arrival_time'] > self.current_time)
-                ]['arrival_time'].min()
-                
-                # Registrar tiempo ocioso
-                idle_duration = next_arrival - self.current_time
-                self.execution_sequence.append(('IDLE', self.current_time, next_arrival))
-                self.gantt_data.append({
-                    'process': 'IDLE',
-                    'start': self.current_time,
-                    'end': next_arrival
-                })
-                
-                # Avanzar el tiempo al próximo arribo
-                self.current_time = next_arrival
-                
-                # Agregar procesos que acaban de llegar
-                add_arrived_processes()
-                continue
-            
-            # Si no hay más procesos en la cola y no hay más procesos por llegar
-            if not ready_queue:
-                break
-            
-            # Obtener el próximo proceso a ejecutar (FIFO - First In First Out)
-            current_process_id = ready_queue.pop(0)
-            current_process_idx = self.processes[self.processes['process_id'] == current_process_id].index[0]
-            
-            # Registrar primera respuesta si no se ha hecho
-            if self.processes.loc[current_process_idx, 'first_response'] == -1:
-                self.processes.loc[current_process_idx, 'first_response'] = self.current_time
-            
-            # Actualizar el estado del proceso a RUNNING
-            self.processes.loc[current_process_idx, 'state'] = 'RUNNING'
-            
-            # Determinar cuánto tiempo se ejecutará este proceso
-            remaining = self.processes.loc[current_process_idx, 'remaining_time']
-            execution_time = min(self.quantum, remaining)
-            
-            # Registrar ejecución en la secuencia
-            start_time = self.current_time
-            end_time = self.current_time + execution_time
-            self.execution_sequence.append((current_process_id, start_time, end_time))
-            self.gantt_data.append({
-                'process': current_process_id,
-                'start': start_time,
-                'end': end_time
-            })
-            
-            # Actualizar el tiempo actual
-            self.current_time += execution_time
-            
-            # Actualizar el tiempo restante del proceso
-            new_remaining = remaining - execution_time
-            self.processes.loc[current_process_idx, 'remaining_time'] = new_remaining
-            
-            # IMPORTANTE: Agregar procesos que llegaron DURANTE la ejecución actual
-            add_arrived_processes()
-            
-            # Guardar el estado actual de los procesos para visualización
-            current_status = self.processes.copy()
-            current_status['current_time'] = self.current_time
-            self.process_status.append(current_status)
-            
-            # Si el proceso ha terminado
-            if new_remaining == 0:
-                self.processes.loc[current_process_idx, 'state'] = 'TERMINATED'
-                self.processes.loc[current_process_idx, 'completion_time'] = self.current_time
-                
-                # Calcular tiempos de espera y retorno
-                arrival = self.processes.loc[current_process_idx, 'arrival_time']
-                burst = self.processes.loc[current_process_idx, 'burst_time']
-                completion = self.processes.loc[current_process_idx, 'completion_time']
-                
-                turnaround_time = completion - arrival
-                waiting_time = turnaround_time - burst
-                
-                self.processes.loc[current_process_idx, 'turnaround_time'] = turnaround_time
-                self.processes.loc[current_process_idx, 'waiting_time'] = waiting_time
-                
-                self.turnaround_times[current_process_id] = turnaround_time
-                self.waiting_times[current_process_id] = waiting_time
-            else:
-                # Si el proceso aún necesita más tiempo, vuelve AL FINAL de la cola
-                self.processes.loc[current_process_idx, 'state'] = 'READY'
-                ready_queue.append(current_process_id)  # Esto mantiene el orden Round Robin
-            
-            # Visualización paso a paso si está activada
-            if visualize:
-                self.visualize_step(current_process_id, execution_time, step_by_step, delay)
-        
-        # Calcular métricas finales
-        avg_waiting_time = self.processes['waiting_time'].mean()
-        avg_turnaround_time = self.processes['turnaround_time'].mean()
-        
-        return {
-            'processes': self.processes,
-            'execution_sequence': self.execution_sequence,
-            'gantt_data': self.gantt_data,
-            'avg_waiting_time': avg_waiting_time,
-            'avg_turnaround_time': avg_turnaround_time
-        }
-    
-    def visualize_step(self, current_process, time_slice, step_by_step, delay):
-        """Visualiza un paso de la simulación"""
-        # Usar la función definida al principio del archivo
-        clear_screen()
-        
-        print(f"\n{'='*80}")
-        print(f"Tiempo actual: {self.current_time}")
-        print(f"Ejecutando proceso: {current_process} por {time_slice} unidades de tiempo")
-        print(f"{'='*80}\n")
-        
-        # Mostrar estado de todos los procesos
-        status_df = self.processes.copy()
-        status_df['progress'] = ((status_df['burst_time'] - status_df['remaining_time']) / 
-                                status_df['burst_time'] * 100).round(1)
-        
-        print(status_df[['process_id', 'arrival_time', 'burst_time', 
-                        'remaining_time', 'progress', 'state']].to_string(index=False))
-        
-        if step_by_step:
-            input("\nPresiona Enter para continuar...")
-        else:
-            time.sleep(delay)
-    
-    def generate_gantt_chart(self, fig_size=(12, 4)):
-        """
-        Genera un diagrama de Gantt de la ejecución
-        
-        Args:
-            fig_size (tuple): Tamaño de la figura (ancho, alto)
-        """
-        if not self.gantt_data:
-            print("No hay datos de ejecución. Ejecuta la simulación primero.")
-            return
-        
-        # Crear el diagrama de Gantt
-        fig, ax = plt.subplots(figsize=fig_size)
-        
-        # Configurar etiquetas en español
-        plt.rcParams['axes.titlesize'] = 12
-        plt.rcParams['axes.labelsize'] = 10
-        
-        # Colores para los procesos (ciclo entre varios colores)
-        colors = plt.cm.tab10.colors
-        process_colors = {}
-        
-        # Asignar un color a cada proceso
-        unique_processes = set([d['process'] for d in self.gantt_data if d['process'] != 'IDLE'])
-        for i, process in enumerate(unique_processes):
-            process_colors[process] = colors[i % len(colors)]
-        
-        # IDLE siempre en gris
-        process_colors['IDLE'] = 'lightgrey'
-        
-        # Dibujar barras para cada bloque de ejecución
-        y_pos = 0
-        for i, data in enumerate(self.gantt_data):
-            process = data['process']
-            start = data['start']
-            end = data['end']
-            duration = end - start
-            
-            ax.barh(y_pos, duration, left=start, height=0.5, 
-                    color=process_colors[process], alpha=0.8, 
-                    edgecolor='black', linewidth=1)
-            
-            # Añadir etiqueta en el centro de la barra
-            if duration > 0.5:  # Solo si hay espacio suficiente
-                ax.text(start + duration/2, y_pos, process, 
-                        ha='center', va='center', color='black',
-                        fontweight='bold')
-        
-        # Configuración de ejes y etiquetas en español
-        ax.set_yticks([])
-        ax.set_xlabel('Tiempo (unidades)')
-        ax.set_title('Diagrama de Gantt - Algoritmo Round Robin')
-        
-        # Ajustar los límites del eje x
-        ax.set_xlim(0, self.current_time)
-        
-        # Añadir cuadrícula
-        ax.grid(axis='x', linestyle='--', alpha=0.7)
-        
-        plt.tight_layout()
-        return fig
-    
-    def generate_metrics_summary(self):
-        """
-        Genera un resumen de métricas de la simulación
-        
-        Returns:
-            DataFrame: DataFrame con las métricas de cada proceso
-        """
-        # Crear una copia del DataFrame original
-        metrics = self.processes[['process_id', 'arrival_time', 'burst_time', 
-                                'completion_time', 'turnaround_time', 'waiting_time']].copy()
-        
-        # Renombrar las columnas a español
-        metrics = metrics.rename(columns={
-            'process_id': 'ID Proceso',
-            'arrival_time': 'Tiempo Llegada',
-            'burst_time': 'Tiempo Ráfaga',
-            'completion_time': 'Tiempo Finalización',
-            'turnaround_time': 'Tiempo Retorno',
-            'waiting_time': 'Tiempo Espera'
-        })
-        
-        # Añadir promedios
-        averages = pd.DataFrame({
-            'ID Proceso': ['PROMEDIO'],
-            'Tiempo Llegada': [None],
-            'Tiempo Ráfaga': [metrics['Tiempo Ráfaga'].mean()],
-            'Tiempo Finalización': [None],
-            'Tiempo Retorno': [metrics['Tiempo Retorno'].mean()],
-            'Tiempo Espera': [metrics['Tiempo Espera'].mean()]
-        })
-        
-        metrics = pd.concat([metrics, averages], ignore_index=True)
-        return metrics
-        
-    def plot_comprehensive_metrics(self, fig_size=(14, 10)):
-        """
-        Genera un gráfico completo con todas las métricas importantes
-        
-        Args:
-            fig_size (tuple): Tamaño de la figura (ancho, alto)
-            
-        Returns:
-            Figure: Figura de matplotlib con el gráfico
-        """
-        if self.processes.empty:
-            print("No hay datos de procesos. Ejecuta la simulación primero.")
-            return
-            
-        # Crear una figura más completa con 4 subplots
-        fig, axes = plt.subplots(2, 2, figsize=fig_size)
-        
-        # Configurar estilo y fuentes en español
-        plt.rcParams['axes.titlesize'] = 12
-        plt.rcParams['axes.labelsize'] = 10
-        
-        # Filtrar datos excluyendo el promedio si existe
-        process_data = self.processes[self.processes['process_id'] != 'PROMEDIO'].copy()
-        
-        # Ordenar los procesos para mejor visualización
-        process_data = process_data.sort_values('process_id')
-        
-        # Colores para los gráficos
-        colors_cycle = plt.cm.tab10(np.linspace(0, 1, len(process_data)))
-        
-        # 1. Gráfico de tiempo de espera
-        axes[0, 0].bar(process_data['process_id'], process_data['waiting_time'], 
-                      color=colors_cycle, edgecolor='black', linewidth=1.2)
-        axes[0, 0].set_title('Tiempo de Espera', fontsize=12, fontweight='bold')
-        axes[0, 0].set_xlabel('Proceso')
-        axes[0, 0].set_ylabel('Tiempo (unidades)')
-        axes[0, 0].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Añadir línea de promedio
-        avg_waiting = process_data['waiting_time'].mean()
-        axes[0, 0].axhline(y=avg_waiting, color='red', linestyle='--')
-        axes[0, 0].text(0, avg_waiting * 1.05, f'Promedio: {avg_waiting:.2f}', 
-                      color='red', fontweight='bold')
-                      
-        # 2. Gráfico de tiempo de retorno
-        axes[0, 1].bar(process_data['process_id'], process_data['turnaround_time'], 
-                      color=colors_cycle, edgecolor='black', linewidth=1.2)
-        axes[0, 1].set_title('Tiempo de Retorno', fontsize=12, fontweight='bold')
-        axes[0, 1].set_xlabel('Proceso')
-        axes[0, 1].set_ylabel('Tiempo (unidades)')
-        axes[0, 1].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Añadir línea de promedio
-        avg_turnaround = process_data['turnaround_time'].mean()
-        axes[0, 1].axhline(y=avg_turnaround, color='red', linestyle='--')
-        axes[0, 1].text(0, avg_turnaround * 1.05, f'Promedio: {avg_turnaround:.2f}', 
-                       color='red', fontweight='bold')
-        
-        # 3. Gráfico comparativo de tiempos
-        processes = process_data['process_id'].tolist()
-        burst_times = process_data['burst_time'].tolist()
-        waiting_times = process_data['waiting_time'].tolist()
-        turnaround_times = process_data['turnaround_time'].tolist()
-        
-        x = np.arange(len(processes))  # Posiciones en el eje x
-        width = 0.25  # Ancho de las barras
-        
-        axes[1, 0].bar(x - width, burst_times, width, label='Tiempo de Ráfaga',
-                      color='skyblue', edgecolor='black', linewidth=1.2)
-        axes[1, 0].bar(x, waiting_times, width, label='Tiempo de Espera',
-                      color='lightgreen', edgecolor='black', linewidth=1.2)
-        axes[1, 0].bar(x + width, turnaround_times, width, label='Tiempo de Retorno',
-                      color='salmon', edgecolor='black', linewidth=1.2)
-        
-        axes[1, 0].set_title('Comparación de Tiempos', fontsize=12, fontweight='bold')
-        axes[1, 0].set_xlabel('Proceso')
-        axes[1, 0].set_ylabel('Tiempo (unidades)')
-        axes[1, 0].set_xticks(x)
-        axes[1, 0].set_xticklabels(processes)
-        axes[1, 0].legend()
-        axes[1, 0].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # 4. Diagrama de Gantt simplificado
-        gantt_data = pd.DataFrame(self.gantt_data)
-        
-        # Crear un conjunto de colores para cada proceso
-        unique_processes = gantt_data['process'].unique()
-        process_colors = {}
-        for i, proc in enumerate(unique_processes):
-            if proc != 'IDLE':
-                process_colors[proc] = plt.cm.tab10(i % 10)
-            else:
-                process_colors[proc] = (0.8, 0.8, 0.8, 1.0)  # Gris para IDLE
-                
-        # Dibujar barras para cada bloque de ejecución
-        for i, row in gantt_data.iterrows():
-            process = row['process']
-            start = row['start']
-            end = row['end']
-            duration = end - start
-            
-            axes[1, 1].barh(0, duration, left=start, height=0.5,
-                           color=process_colors[process], edgecolor='black')
-            
-            # Añadir etiqueta en el centro de la barra
-            if duration > 0.5:
-                axes[1, 1].text(start + duration/2, 0, process,
-                              ha='center', va='center', fontweight='bold')
-        
-        axes[1, 1].set_title('Diagrama de Gantt Simplificado', fontsize=12, fontweight='bold')
-        axes[1, 1].set_xlabel('Tiempo (unidades)')
-        axes[1, 1].set_yticks([])
-        axes[1, 1].grid(axis='x', linestyle='--', alpha=0.7)
-        axes[1, 1].set_xlim(0, gantt_data['end'].max())
-        
-        # Título general y ajustes
-        plt.tight_layout()
-        fig.suptitle(f'Análisis del Algoritmo Round Robin (Quantum = {self.quantum})', 
-                    fontsize=16, fontweight='bold', y=1.02)
-        
-        return fig
-    
-    def plot_metrics(self, fig_size=(12, 6)):
-        """
-        Genera gráficos de barras para visualizar las métricas
-        
-        Args:
-            fig_size (tuple): Tamaño de la figura (ancho, alto)
-        """
-        if self.processes.empty:
-            print("No hay datos de procesos. Ejecuta la simulación primero.")
-            return
-        
-        fig, axes = plt.subplots(1, 2, figsize=fig_size)
-        
-        # Configurar estilo y fuentes en español
-        plt.rcParams['axes.titlesize'] = 12
-        plt.rcParams['axes.labelsize'] = 10
-        
-        # Filtrar datos excluyendo el promedio si existe
-        process_data = self.processes[self.processes['process_id'] != 'PROMEDIO'].copy()
-        
-        # Ordenar los procesos para mejor visualización
-        process_data = process_data.sort_values('process_id')
-        
-        # Colores para los gráficos
-        colors_waiting = plt.cm.Blues(np.linspace(0.6, 0.9, len(process_data)))
-        colors_turnaround = plt.cm.Greens(np.linspace(0.6, 0.9, len(process_data)))
-        
-        # Gráfico de tiempos de espera
-        bars_wait = axes[0].bar(process_data['process_id'], process_data['waiting_time'], 
-                         color=colors_waiting, edgecolor='black', linewidth=1.5)
-        
-        axes[0].set_title('Tiempo de Espera por Proceso', fontsize=12, fontweight='bold')
-        axes[0].set_xlabel('Proceso', fontsize=10)
-        axes[0].set_ylabel('Tiempo de Espera (unidades)', fontsize=10)
-        axes[0].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Añadir etiquetas de valor en las barras
-        for bar in bars_wait:
-            height = bar.get_height()
-            axes[0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        # Gráfico de tiempos de retorno
-        bars_turn = axes[1].bar(process_data['process_id'], process_data['turnaround_time'], 
-                         color=colors_turnaround, edgecolor='black', linewidth=1.5)
-        
-        axes[1].set_title('Tiempo de Retorno por Proceso', fontsize=12, fontweight='bold')
-        axes[1].set_xlabel('Proceso', fontsize=10)
-        axes[1].set_ylabel('Tiempo de Retorno (unidades)', fontsize=10)
-        axes[1].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Añadir etiquetas de valor en las barras
-        for bar in bars_turn:
-            height = bar.get_height()
-            axes[1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
-        
-        # Añadir línea horizontal para el promedio
-        if len(self.processes) > 1:
-            avg_waiting = self.processes['waiting_time'].mean()
-            avg_turnaround = self.processes['turnaround_time'].mean()
-            
-            axes[0].axhline(y=avg_waiting, color='red', linestyle='--', linewidth=2)
-            axes[0].text(len(process_data) * 0.5, avg_waiting + 0.2, 
-                  f'Promedio: {avg_waiting:.2f}', ha='center', va='bottom', 
-                  color='red', fontweight='bold')
-            
-            axes[1].axhline(y=avg_turnaround, color='red', linestyle='--', linewidth=2)
-            axes[1].text(len(process_data) * 0.5, avg_turnaround + 0.2, 
-                  f'Promedio: {avg_turnaround:.2f}', ha='center', va='bottom', 
-                  color='red', fontweight='bold')
-        
-        # Ajustar márgenes y espaciado
-        plt.tight_layout()
-        fig.suptitle('Métricas del Algoritmo Round Robin', fontsize=14, fontweight='bold', y=1.05)
-        
-        return fig
-
-
-# Función para generar un conjunto de ejemplo de procesos
-def generate_example_processes(n=5):
-    """
-    Genera un conjunto de ejemplo de procesos
-    
-    Args:
-        n (int): Número de procesos a generar
-    
-    Returns:
-        DataFrame: DataFrame con los procesos generados
-    """
-    # Generar datos aleatorios para los procesos
-    np.random.seed(42)  # Para reproducibilidad
-    
-    process_ids = [f'P{i+1}' for i in range(n)]
-    arrival_times = np.sort(np.random.randint(0, 10, n))  # Tiempos de llegada ordenados
-    burst_times = np.random.randint(1, 10, n)  # Tiempos de ráfaga entre 1 y 10
-    
-    # Crear DataFrame
-    processes = pd.DataFrame({
-        'process_id': process_ids,        # ID del proceso
-        'arrival_time': arrival_times,    # Tiempo de llegada
-        'burst_time': burst_times         # Tiempo de ráfaga (tiempo total de CPU requerido)
-    })
-    
-    # Renombrar las columnas a español para mostrarlas
-    processes_display = processes.rename(columns={
-        'process_id': 'ID Proceso',
-        'arrival_time': 'Tiempo Llegada',
-        'burst_time': 'Tiempo Ráfaga'
-    })
-    
-    # Mostrar la explicación de las columnas
-    print("\nExplicación de las columnas:")
-    print("- ID Proceso: Identificador único del proceso")
-    print("- Tiempo Llegada: Momento en que el proceso llega al sistema")
-    print("- Tiempo Ráfaga: Tiempo total que necesita el proceso para completar su ejecución")
-    
-    return processes
-
-# Función para obtener procesos del usuario
-def get_user_processes():
-    """
-    Permite al usuario ingresar los procesos manualmente
-    
-    Returns:
-        DataFrame: DataFrame con los procesos ingresados por el usuario
-    """
-    processes_data = []
-    
-    try:
-        num_processes = int(input("Ingrese el número de procesos: "))
-        
-        for i in range(num_processes):
-            print(f"\n--- Proceso {i+1} ---")
-            process_id = input(f"Identificador del proceso (por defecto P{i+1}): ")
-            if not process_id:
-                process_id = f"P{i+1}"
-                
-            arrival_time = int(input("Tiempo de llegada: "))
-            burst_time = int(input("Tiempo de ejecución (burst time): "))
-            
-            processes_data.append({
-                'process_id': process_id,
-                'arrival_time': arrival_time,
-                'burst_time': burst_time
-            })
-        
-        return pd.DataFrame(processes_data)
-    
-    except ValueError as e:
-        print(f"Error: Debe ingresar valores numéricos para tiempos. {e}")
-        return None
-
-# Ejemplo de uso de la simulación
-if __name__ == "__main__":
-    try:
-        print("=" * 60)
-        print("      SIMULADOR DE ALGORITMO ROUND ROBIN")
-        print("=" * 60)
-        
-        # Preguntar si desea ingresar procesos manualmente o usar ejemplos
-        choice = input("¿Desea ingresar procesos manualmente? (s/n): ").lower()
-        
-        if choice.startswith('s'):
-            # Obtener procesos del usuario
-            processes = get_user_processes()
-            if processes is None or processes.empty:
-                print("No se ingresaron procesos válidos. Usando procesos de ejemplo.")
-                processes = generate_example_processes(5)
-        else:
-            # Usar procesos generados aleatoriamente
-            num_processes = int(input("¿Cuántos procesos aleatorios desea generar? (por defecto: 5): ") or 5)
-            processes = generate_example_processes(num_processes)
-        
-        print("\nProcesos a simular:")
-        print(processes)
-        
-        # Obtener quantum del usuario
-        quantum = int(input("\nIngrese el quantum de tiempo (por defecto: 2): ") or 2)
-        
-        print(f"\nIniciando simulación de Round Robin con quantum = {quantum}...")
-        
-        # Crear y ejecutar el simulador
-        simulator = RoundRobinSimulator(quantum=quantum)
-        simulator.add_processes_from_dataframe(processes)
-        
-        # Preguntar si desea visualización paso a paso
-        visualize = input("¿Desea ver la simulación paso a paso? (s/n): ").lower().startswith('s')
-        
-        # Ejecutar la simulación
-        results = simulator.run_simulation(visualize=visualize, step_by_step=visualize)
-        
-        # Mostrar resultados
-        print("\nResultados de la simulación:")
-        print(f"Tiempo promedio de espera: {results['avg_waiting_time']:.2f}")
-        print(f"Tiempo promedio de retorno: {results['avg_turnaround_time']:.2f}")
-        
-        # Mostrar tabla de métricas
-        print("\nMétricas por proceso:")
-        metrics = simulator.generate_metrics_summary()
-        print(metrics.to_string(index=False))
-        
-        # Mostrar explicación de las métricas
-        print("\nExplicación de las métricas:")
-        print("- ID Proceso: Identificador único de cada proceso")
-        print("- Tiempo Llegada: Momento en que el proceso llega al sistema")
-        print("- Tiempo Ráfaga: Tiempo total que el proceso necesita para completar su ejecución")
-        print("- Tiempo Finalización: Momento en que el proceso termina su ejecución")
-        print("- Tiempo Retorno: Tiempo total que el proceso pasa en el sistema (Finalización - Llegada)")
-        print("- Tiempo Espera: Tiempo que el proceso pasa esperando en cola (Retorno - Ráfaga)")
-        
-        print("\nSecuencia de ejecución:")
-        for proc, start, end in simulator.execution_sequence:
-            print(f"Proceso {proc}: {start} -> {end}")
-        
-        # Guardar resultados en archivo
-        with open("d:\\cloud computing\\resultados_round_robin.txt", "w") as f:
-            f.write("Procesos simulados:\n")
-            f.write(str(processes) + "\n\n")
-            
-            f.write(f"Quantum utilizado: {quantum}\n\n")
-            
-            f.write("Resultados de la simulación:\n")
-            f.write(f"Tiempo promedio de espera: {results['avg_waiting_time']:.2f}\n")
-            f.write(f"Tiempo promedio de retorno: {results['avg_turnaround_time']:.2f}\n\n")
-            
-            f.write("Métricas por proceso:\n")
-            f.write(metrics.to_string(index=False) + "\n\n")
-            
-            f.write("Secuencia de ejecución:\n")
-            for proc, start, end in simulator.execution_sequence:
-                f.write(f"Proceso {proc}: {start} -> {end}\n")
-        
-        print("\n¡Resultados guardados en d:\\cloud computing\\resultados_round_robin.txt!")
-        
-        # Generar y mostrar gráficos
-        print("\nGenerando gráficos...")
-        
-        # Preguntamos qué gráficos quiere ver
-        print("\n¿Qué gráficos desea visualizar?")
-        print("1. Diagrama de Gantt")
-        print("2. Gráficos de barras con métricas")
-        print("3. Gráfico completo con todas las métricas")
-        print("4. Todos los gráficos")
-        
-        try:
-            choice = int(input("\nIngrese su elección (1-4): "))
-        except ValueError:
-            choice = 2  # Por defecto mostramos los gráficos de barras
-        
-        # Según la elección, mostramos diferentes gráficos
-        if choice == 1 or choice == 4:
-            try:
-                gantt_fig = simulator.generate_gantt_chart()
-                gantt_fig.savefig("d:\\cloud computing\\gantt_chart.png")
-                print("Diagrama de Gantt guardado como: d:\\cloud computing\\gantt_chart.png")
-                plt.figure(gantt_fig.number)
-                plt.show(block=False if choice == 4 else True)
-            except Exception as e:
-                print(f"No se pudo generar el diagrama de Gantt: {e}")
-        
-        if choice == 2 or choice == 4:
-            try:
-                metrics_fig = simulator.plot_metrics()
-                metrics_fig.savefig("d:\\cloud computing\\metricas_barras.png")
-                print("Gráficos de métricas en barras guardados como: d:\\cloud computing\\metricas_barras.png")
-                plt.figure(metrics_fig.number)
-                plt.show(block=False if choice == 4 else True)
-            except Exception as e:
-                print(f"No se pudo generar el gráfico de métricas en barras: {e}")
-        
-        if choice == 3 or choice == 4:
-            try:
-                comp_fig = simulator.plot_comprehensive_metrics()
-                comp_fig.savefig("d:\\cloud computing\\metricas_completas.png")
-                print("Gráfico completo guardado como: d:\\cloud computing\\metricas_completas.png")
-                plt.figure(comp_fig.number)
-                plt.show()  # Este es el último, así que bloqueamos para mantener las figuras abiertas
-            except Exception as e:
-                print(f"No se pudo generar el gráfico completo: {e}")
-        
-        print("\n¡Simulación completada con éxito!")
-        
-    except Exception as e:
-        print(f"\nError durante la ejecución: {e}")
-        # Guardar el error en un archivo
-        with open("d:\\cloud computing\\error_round_robin.txt", "w") as f:
-            f.write(f"Error durante la ejecución: {e}")
-        print(f"Detalles del error guardados en: d:\\cloud computing\\error_round_robin.txt")
\ No newline at end of file
+import pandas as pd
+import numpy as np
+
+import os
+
+from almacen import save_run, output_directory
+from cargas import read_workload, merge_sorted
+from diario import StatusJournal
+from gantt import GanttRLE
+from graficos import draw_gantt, pyplot, DECIMATE_ABOVE
+from metricas import OnlineMetrics
+from motores import RoundRobinEngine, RoundBatch, IDLE, STATE_NAMES
+from pantalla import StepRenderer
+from perfil import ENGINE_PHASES, profiled, track
+from puntos_control import Checkpointer, DEFAULT_INTERVAL
+
+class RoundRobinSimulator:
+    def __init__(self, quantum, profile=False):
+        """
+        Inicializa el simulador de Round Robin con un quantum especificado
+        
+        Args:
+            quantum (int): Cantidad de tiempo asignado a cada proceso
+            profile (bool): Si es True, run_simulation mide el tiempo de sus
+                            fases y deja el desglose en self.profile_report
+        """
+        self.quantum = quantum
+        self.profile = profile
+        self.profile_report = None
+        self.processes = pd.DataFrame()
+        self.current_time = 0
+        self.execution_sequence = []
+        self.gantt_data = []
+        self.gantt = None
+        self.process_status = []
+        self.waiting_times = {}
+        self.turnaround_times = {}
+        
+        # Métricas en línea de los procesos terminados, legibles durante la simulación
+        self.metrics = OnlineMetrics()
+        
+        # Visualización en la terminal de la simulación en curso
+        self._renderer = None
+    
+    def add_process(self, process_id, arrival_time, burst_time):
+        """
+        Agrega un proceso a la simulación
+        
+        Args:
+            process_id (str): Identificador único del proceso
+            arrival_time (int): Tiempo de llegada del proceso
+            burst_time (int): Tiempo de CPU requerido por el proceso
+        """
+        self.load_processes({
+            'process_id': [process_id],
+            'arrival_time': [arrival_time],
+            'burst_time': [burst_time]
+        })
+    
+    def load_processes(self, data):
+        """
+        Agrega un conjunto de procesos construyendo la tabla en una sola pasada
+        
+        Con una simulación en pausa (ver run_until), los procesos se agregan
+        con inject_processes para que la simulación pueda continuar.
+        
+        Args:
+            data (DataFrame | dict): Columnas 'process_id', 'arrival_time' y 'burst_time'
+                                     como DataFrame o diccionario de arreglos
+        
+        Raises:
+            ValueError: Si faltan columnas o los valores no son válidos, o si
+                        la simulación está en pausa y algún proceso llega
+                        antes del tiempo actual
+        """
+        if self._paused_engine() is not None:
+            self.inject_processes(data)
+            return
+        
+        # Unir con los procesos existentes y ordenar por tiempo de llegada una sola vez
+        self.processes = merge_sorted(self.processes, self._new_process_table(data))
+    
+    def _new_process_table(self, data):
+        """
+        Valida procesos nuevos y construye sus filas con las métricas iniciales
+        
+        Args:
+            data (DataFrame | dict): Columnas 'process_id', 'arrival_time' y 'burst_time'
+        
+        Returns:
+            DataFrame: Filas nuevas, en el orden recibido
+        """
+        columns = read_workload(data)
+        n = len(columns['process_id'])
+        
+        return pd.DataFrame({
+            'process_id': columns['process_id'],            # ID del proceso
+            'arrival_time': columns['arrival_time'],        # Tiempo de llegada al sistema
+            'burst_time': columns['burst_time'],            # Tiempo total de ejecución requerido
+            'remaining_time': columns['burst_time'],        # Tiempo restante de ejecución
+            'completion_time': np.zeros(n, dtype=np.int64), # Tiempo de finalización
+            'waiting_time': np.zeros(n, dtype=np.int64),    # Tiempo de espera en cola
+            'turnaround_time': np.zeros(n, dtype=np.int64), # Tiempo total en el sistema
+            'first_response': np.full(n, -1),               # Tiempo de primera respuesta
+            'state': 'NEW'                                  # Estado del proceso
+        })
+        
+    def add_processes_from_dataframe(self, df):
+        """
+        Agrega múltiples procesos desde un DataFrame
+        
+        Args:
+            df (DataFrame): DataFrame con columnas 'process_id', 'arrival_time', 'burst_time'
+        """
+        self.load_processes(df)
+            
+    def is_arrived(self, process_id, current_time):
+        """Verifica si un proceso ha llegado al sistema"""
+        process = self.processes[self.processes['process_id'] == process_id]
+        return process['arrival_time'].values[0] <= current_time
+            
+    def get_ready_queue(self, current_time):
+        """
+        Obtiene la cola de procesos listos en el tiempo actual
+        
+        Returns:
+            DataFrame: DataFrame con los procesos listos para ejecutar
+        """
+        # Procesos que han llegado y aún no han terminado
+        ready = self.processes[
+            (self.processes['arrival_time'] <= current_time) & 
+            (self.processes['remaining_time'] > 0)
+        ]
+        return ready
+    
+    @profiled
+    def run_simulation(self, visualize=False, step_by_step=False, delay=0.5,
+                       checkpoint=None, checkpoint_interval=DEFAULT_INTERVAL):
+        """
+        Ejecuta la simulación del algoritmo Round Robin
+        
+        Args:
+            visualize (bool): Si es True, muestra la simulación visualmente
+            step_by_step (bool): Si es True, espera entrada del usuario entre pasos
+            delay (float): Intervalo mínimo entre refrescos de la pantalla si
+                           step_by_step es False; la simulación no se detiene
+            checkpoint (str): Directorio donde guardar puntos de control periódicos
+                              (se reanudan con resume)
+            checkpoint_interval (float): Segundos entre puntos de control
+        
+        Returns:
+            dict: 'processes', 'avg_waiting_time', 'avg_turnaround_time',
+                  'metrics', 'gantt' (GanttRLE) y 'execution_sequence' y
+                  'gantt_data' como vistas de solo lectura sobre 'gantt'
+                  (usar list() para obtener listas modificables)
+        """
+        # Sin visualización, las rondas completas sin eventos se aplican de una vez
+        self._create_engine(batch_rounds=not visualize)
+        
+        checkpointer = None
+        if checkpoint is not None:
+            checkpointer = track(self, Checkpointer.create(checkpoint, self.processes, self._engine,
+                                                           journal=self.process_status,
+                                                           meta={'quantum': self.quantum},
+                                                           interval=checkpoint_interval))
+        return self._run_engine(visualize, step_by_step, delay, checkpointer)
+    
+    @profiled
+    def resume(self, checkpoint, visualize=False, step_by_step=False, delay=0.5,
+               checkpoint_interval=DEFAULT_INTERVAL):
+        """
+        Reanuda una simulación desde su último punto de control
+        
+        La tabla de procesos y el quantum se toman del punto de control; el
+        resultado es idéntico al de una ejecución sin interrupciones.
+        
+        Args:
+            checkpoint (str): Directorio de puntos de control de run_simulation
+            visualize (bool): Si es True, muestra la simulación visualmente
+            step_by_step (bool): Si es True, espera entrada del usuario entre pasos
+            delay (float): Tiempo de espera entre pasos si step_by_step es False
+            checkpoint_interval (float): Segundos entre puntos de control al continuar
+        
+        Returns:
+            dict: Los mismos resultados que run_simulation
+        """
+        checkpointer = track(self, Checkpointer.open(checkpoint, interval=checkpoint_interval))
+        self.processes = checkpointer.processes
+        self.quantum = checkpointer.meta['quantum']
+        
+        self._create_engine(batch_rounds=checkpointer.meta['batch_rounds'])
+        checkpointer.restore(self._engine, self.process_status)
+        return self._run_engine(visualize, step_by_step, delay, checkpointer)
+    
+    def run_until(self, time):
+        """
+        Avanza la simulación hasta el tiempo indicado y la deja en pausa
+        
+        Si no hay una simulación en pausa, o la anterior ya terminó, empieza
+        una nueva con la tabla actual. En pausa se pueden agregar procesos
+        (inject_processes, load_processes o add_process) y continuar con
+        run_until o continue_simulation.
+        
+        Args:
+            time: Tiempo hasta el que avanzar; el reloj puede quedar hasta un
+                  quantum después si un proceso estaba en ejecución
+        
+        Returns:
+            bool: True si todavía queda trabajo por simular
+        """
+        if self._paused_engine() is None:
+            self._create_engine(batch_rounds=True)
+        pending = self._engine.run_until(time)
+        self.current_time = self._engine.current_time
+        return pending
+    
+    def inject_processes(self, data):
+        """
+        Agrega procesos a una simulación en pausa sin volver a simular desde cero
+        
+        Los procesos que llegan después del reloj se simulan igual que si
+        hubieran estado en la tabla desde el principio. Los que llegan justo
+        en el tiempo actual entran a la cola detrás de los que ya esperan.
+        
+        Args:
+            data (DataFrame | dict): Columnas 'process_id', 'arrival_time' y 'burst_time'
+        
+        Raises:
+            ValueError: Si algún proceso llega antes del tiempo actual o los
+                        datos no son válidos
+        """
+        engine = self._paused_engine()
+        if engine is None:
+            self.load_processes(data)
+            return
+        
+        new_processes = self._new_process_table(data)
+        if (new_processes['arrival_time'] < engine.current_time).any():
+            raise ValueError(f"Los procesos nuevos deben llegar en t >= {engine.current_time}")
+        
+        # Solo se reordenan las filas que todavía no llegaron
+        cut = int(np.searchsorted(engine.arrival, engine.current_time, side='right'))
+        pending = merge_sorted(self.processes.iloc[cut:], new_processes)
+        engine.replace_pending(pending['arrival_time'].to_numpy(), pending['burst_time'].to_numpy())
+        
+        self.processes = pd.concat([self.processes.iloc[:cut], pending], ignore_index=True)
+        self.process_status.rebase(self.processes)
+        self.current_time = engine.current_time
+    
+    @profiled
+    def continue_simulation(self, visualize=False, step_by_step=False, delay=0.5):
+        """
+        Termina una simulación en pausa (ver run_until)
+        
+        Si no hay una simulación en pausa, simula la tabla actual desde cero.
+        
+        Returns:
+            dict: Los mismos resultados que run_simulation
+        """
+        if self._paused_engine(pending_only=False) is None:
+            return self.run_simulation(visualize, step_by_step, delay)
+        return self._run_engine(visualize, step_by_step, delay)
+    
+    def _paused_engine(self, pending_only=True):
+        """
+        Motor de la simulación en pausa de run_until, o None si no la hay
+        
+        No cuenta como pausa un motor sin diario de estados (iter_simulation)
+        ni uno que ya no corresponde a la tabla, porque se agregaron procesos
+        después de que terminara.
+        
+        Args:
+            pending_only (bool): Si es True, tampoco cuenta un motor que ya no
+                                 tiene trabajo por simular
+        """
+        engine = getattr(self, '_engine', None)
+        if engine is None or engine.journal is None or len(engine.arrival) != len(self.processes):
+            return None
+        if pending_only and not engine.has_pending():
+            return None
+        return engine
+    
+    def profile_phases(self):
+        """Fases medidas con profile=True: (clase, método, fase)"""
+        return ENGINE_PHASES + (
+            (RoundRobinSimulator, '_create_engine', 'preparación'),
+            (RoundRobinSimulator, 'visualize_step', 'visualización'),
+            (RoundRobinSimulator, '_status_frame', 'resultados'),
+            (GanttRLE, 'sequence', 'resultados'),
+            (GanttRLE, 'records', 'resultados')
+        )
+    
+    def _create_engine(self, batch_rounds):
+        """Crea el motor y el diario de estados para la tabla de procesos actual"""
+        self.execution_sequence = []
+        self.gantt_data = []
+        self.current_time = 0
+        
+        # La tabla puede traer los resultados de una simulación anterior
+        self.processes = self._new_process_table(self.processes)
+        
+        arrival_times = self.processes['arrival_time'].to_numpy()
+        burst_times = self.processes['burst_time'].to_numpy()
+        
+        # Diario de cambios por paso: process_status[k] reconstruye la tabla del paso k
+        self.process_status = StatusJournal(self.processes, np.result_type(arrival_times, burst_times))
+        self.metrics = OnlineMetrics()
+        
+        # El bucle trabaja sobre arreglos indexados por slot (fila de la tabla)
+        self._engine = track(self, RoundRobinEngine(arrival_times, burst_times, self.quantum,
+                                                    batch_rounds=batch_rounds,
+                                                    journal=self.process_status,
+                                                    metrics=self.metrics))
+    
+    def _run_engine(self, visualize, step_by_step, delay, checkpointer=None):
+        """
+        Ejecuta el motor hasta el final y calcula los resultados
+        
+        Args:
+            visualize (bool): Si es True, muestra la simulación visualmente
+            step_by_step (bool): Si es True, espera entrada del usuario entre pasos
+            delay (float): Intervalo mínimo entre refrescos de la pantalla
+            checkpointer (Checkpointer): Puntos de control a actualizar, si los hay
+        """
+        process_ids = self.processes['process_id'].to_numpy()
+        self.current_time = self._engine.current_time
+        
+        try:
+            while True:
+                event = self._engine.step()
+                if event is None:
+                    break
+                if checkpointer is not None:
+                    checkpointer.maybe_save()
+                
+                self.current_time = self._engine.current_time
+                if isinstance(event, RoundBatch):
+                    continue
+                
+                slot, start_time, end_time = event
+                
+                # Visualización paso a paso si está activada
+                if visualize and slot != IDLE:
+                    self.visualize_step(process_ids[slot], end_time - start_time, step_by_step,
+                                        delay, slot=slot)
+        finally:
+            # Aunque la simulación se interrumpa (Ctrl+C), la terminal queda
+            # con el cursor visible
+            if self._renderer is not None:
+                self._renderer.close()
+                self._renderer = None
+        
+        if checkpointer is not None:
+            checkpointer.close()
+        
+        # Las salidas son vistas sobre el diagrama de Gantt codificado por tramos
+        self.gantt = self._engine.timeline
+        self.gantt.labels = process_ids
+        self.execution_sequence = self.gantt.sequence()
+        self.gantt_data = self.gantt.records()
+        
+        self.processes = self._status_frame()
+        
+        # Calcular tiempos de espera y retorno de los procesos terminados
+        terminated = self._engine.terminated_mask()
+        finished = self.processes[terminated]
+        self.turnaround_times.update(zip(finished['process_id'], finished['turnaround_time']))
+        self.waiting_times.update(zip(finished['process_id'], finished['waiting_time']))
+        
+        # Calcular métricas finales
+        avg_waiting_time = self.processes['waiting_time'].mean()
+        avg_turnaround_time = self.processes['turnaround_time'].mean()
+        
+        return {
+            'processes': self.processes,
+            'execution_sequence': self.execution_sequence,
+            'gantt_data': self.gantt_data,
+            'gantt': self.gantt,
+            'avg_waiting_time': avg_waiting_time,
+            'avg_turnaround_time': avg_turnaround_time,
+            'metrics': self.metrics.summary()
+        }
+    
+    def iter_simulation(self):
+        """
+        Ejecuta la simulación generando cada intervalo a medida que se decide
+        
+        No guarda la secuencia de ejecución ni el diagrama de Gantt, de modo que
+        la memoria usada no crece con la duración de la simulación. Al agotarse
+        el generador, self.processes contiene las métricas finales.
+        
+        Yields:
+            tuple: (process_id, inicio, fin), con 'IDLE' para el tiempo ocioso
+        """
+        self.current_time = 0
+        process_ids = self.processes['process_id'].to_numpy()
+        self.metrics = OnlineMetrics()
+        self._engine = RoundRobinEngine(self.processes['arrival_time'].to_numpy(),
+                                        self.processes['burst_time'].to_numpy(),
+                                        self.quantum, keep_slices=False,
+                                        metrics=self.metrics)
+        
+        for event in iter(self._engine.step, None):
+            slices = event.iter_slices() if isinstance(event, RoundBatch) else (event,)
+            for slot, start_time, end_time in slices:
+                self.current_time = end_time
+                yield ('IDLE' if slot == IDLE else process_ids[slot], start_time, end_time)
+        
+        self.current_time = self._engine.current_time
+        self.processes = self._status_frame()
+    
+    def _status_frame(self):
+        """
+        Construye la tabla de procesos a partir de los arreglos del motor
+        
+        Returns:
+            DataFrame: Copia de self.processes con el estado actual de la simulación
+        """
+        engine = self._engine
+        terminated = engine.terminated_mask()
+        turnaround = engine.completion - engine.arrival
+        
+        status = self.processes.copy()
+        status['remaining_time'] = engine.remaining
+        status['completion_time'] = np.where(terminated, engine.completion, status['completion_time'])
+        status['waiting_time'] = np.where(terminated, turnaround - engine.burst, status['waiting_time'])
+        status['turnaround_time'] = np.where(terminated, turnaround, status['turnaround_time'])
+        status['first_response'] = engine.first_response
+        status['state'] = STATE_NAMES[engine.state]
+        return status
+    
+    def visualize_step(self, current_process, time_slice, step_by_step, delay, slot=None):
+        """
+        Visualiza un paso de la simulación
+        
+        Solo se redibujan las filas que cambiaron, y la tabla muestra el
+        proceso en ejecución y la cola de listos. Sin step_by_step, los pasos
+        que llegan antes de 'delay' segundos desde el último cuadro se omiten
+        en lugar de esperar.
+        
+        Args:
+            current_process (str): ID del proceso que se ejecutó
+            time_slice: Tiempo que se ejecutó
+            step_by_step (bool): Si es True, dibuja cada paso y espera Enter
+            delay (float): Intervalo mínimo entre cuadros si step_by_step es False
+            slot (int): Fila del proceso en la tabla, si ya se conoce
+        """
+        engine = self._engine
+        if self._renderer is None:
+            self._renderer = StepRenderer(self.processes['process_id'].to_numpy(),
+                                          engine.arrival, engine.burst,
+                                          max_fps=1 / delay if delay > 0 else None)
+        if slot is None:
+            slot = int(np.flatnonzero(self.processes['process_id'].to_numpy() == current_process)[0])
+        
+        self._renderer.render(engine, slot, time_slice, force=step_by_step)
+        if step_by_step:
+            input("\nPresiona Enter para continuar...")
+    
+    def generate_gantt_chart(self, fig_size=(12, 4), decimate_above=DECIMATE_ABOVE):
+        """
+        Genera un diagrama de Gantt de la ejecución
+        
+        Args:
+            fig_size (tuple): Tamaño de la figura (ancho, alto)
+            decimate_above (int): Número de tramos a partir del cual el diagrama
+                                  se dibuja con un tramo por píxel
+        """
+        if not self.gantt_data:
+            print("No hay datos de ejecución. Ejecuta la simulación primero.")
+            return
+        
+        # Crear el diagrama de Gantt (matplotlib se importa recién aquí)
+        plt = pyplot()
+        fig, ax = plt.subplots(figsize=fig_size)
+        
+        # Configurar etiquetas en español
+        plt.rcParams['axes.titlesize'] = 12
+        plt.rcParams['axes.labelsize'] = 10
+        
+        # Dibujar los tramos (una colección por color, IDLE en gris)
+        draw_gantt(ax, self.gantt, xlim=(0, self.current_time), decimate_above=decimate_above)
+        
+        # Configuración de ejes y etiquetas en español
+        ax.set_yticks([])
+        ax.set_xlabel('Tiempo (unidades)')
+        ax.set_title('Diagrama de Gantt - Algoritmo Round Robin')
+        
+        # Añadir cuadrícula
+        ax.grid(axis='x', linestyle='--', alpha=0.7)
+        
+        plt.tight_layout()
+        return fig
+    
+    def generate_metrics_summary(self):
+        """
+        Genera un resumen de métricas de la simulación
+        
+        Returns:
+            DataFrame: DataFrame con las métricas de cada proceso
+        """
+        # Crear una copia del DataFrame original
+        metrics = self.processes[['process_id', 'arrival_time', 'burst_time', 
+                                'completion_time', 'turnaround_time', 'waiting_time']].copy()
+        
+        # Renombrar las columnas a español
+        metrics = metrics.rename(columns={
+            'process_id': 'ID Proceso',
+            'arrival_time': 'Tiempo Llegada',
+            'burst_time': 'Tiempo Ráfaga',
+            'completion_time': 'Tiempo Finalización',
+            'turnaround_time': 'Tiempo Retorno',
+            'waiting_time': 'Tiempo Espera'
+        })
+        
+        # Añadir promedios
+        averages = pd.DataFrame({
+            'ID Proceso': ['PROMEDIO'],
+            'Tiempo Llegada': [None],
+            'Tiempo Ráfaga': [metrics['Tiempo Ráfaga'].mean()],
+            'Tiempo Finalización': [None],
+            'Tiempo Retorno': [metrics['Tiempo Retorno'].mean()],
+            'Tiempo Espera': [metrics['Tiempo Espera'].mean()]
+        })
+        
+        metrics = pd.concat([metrics, averages], ignore_index=True)
+        return metrics
+        
+    def plot_comprehensive_metrics(self, fig_size=(14, 10)):
+        """
+        Genera un gráfico completo con todas las métricas importantes
+        
+        Args:
+            fig_size (tuple): Tamaño de la figura (ancho, alto)
+            
+        Returns:
+            Figure: Figura de matplotlib con el gráfico
+        """
+        if self.processes.empty:
+            print("No hay datos de procesos. Ejecuta la simulación primero.")
+            return
+            
+        # Crear una figura más completa con 4 subplots
+        plt = pyplot()
+        fig, axes = plt.subplots(2, 2, figsize=fig_size)
+        
+        # Configurar estilo y fuentes en español
+        plt.rcParams['axes.titlesize'] = 12
+        plt.rcParams['axes.labelsize'] = 10
+        
+        # Filtrar datos excluyendo el promedio si existe
+        process_data = self.processes[self.processes['process_id'] != 'PROMEDIO'].copy()
+        
+        # Ordenar los procesos para mejor visualización
+        process_data = process_data.sort_values('process_id')
+        
+        # Colores para los gráficos
+        colors_cycle = plt.cm.tab10(np.linspace(0, 1, len(process_data)))
+        
+        # 1. Gráfico de tiempo de espera
+        axes[0, 0].bar(process_data['process_id'], process_data['waiting_time'], 
+                      color=colors_cycle, edgecolor='black', linewidth=1.2)
+        axes[0, 0].set_title('Tiempo de Espera', fontsize=12, fontweight='bold')
+        axes[0, 0].set_xlabel('Proceso')
+        axes[0, 0].set_ylabel('Tiempo (unidades)')
+        axes[0, 0].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Añadir línea de promedio
+        avg_waiting = process_data['waiting_time'].mean()
+        axes[0, 0].axhline(y=avg_waiting, color='red', linestyle='--')
+        axes[0, 0].text(0, avg_waiting * 1.05, f'Promedio: {avg_waiting:.2f}', 
+                      color='red', fontweight='bold')
+                      
+        # 2. Gráfico de tiempo de retorno
+        axes[0, 1].bar(process_data['process_id'], process_data['turnaround_time'], 
+                      color=colors_cycle, edgecolor='black', linewidth=1.2)
+        axes[0, 1].set_title('Tiempo de Retorno', fontsize=12, fontweight='bold')
+        axes[0, 1].set_xlabel('Proceso')
+        axes[0, 1].set_ylabel('Tiempo (unidades)')
+        axes[0, 1].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Añadir línea de promedio
+        avg_turnaround = process_data['turnaround_time'].mean()
+        axes[0, 1].axhline(y=avg_turnaround, color='red', linestyle='--')
+        axes[0, 1].text(0, avg_turnaround * 1.05, f'Promedio: {avg_turnaround:.2f}', 
+                       color='red', fontweight='bold')
+        
+        # 3. Gráfico comparativo de tiempos
+        processes = process_data['process_id'].tolist()
+        burst_times = process_data['burst_time'].tolist()
+        waiting_times = process_data['waiting_time'].tolist()
+        turnaround_times = process_data['turnaround_time'].tolist()
+        
+        x = np.arange(len(processes))  # Posiciones en el eje x
+        width = 0.25  # Ancho de las barras
+        
+        axes[1, 0].bar(x - width, burst_times, width, label='Tiempo de Ráfaga',
+                      color='skyblue', edgecolor='black', linewidth=1.2)
+        axes[1, 0].bar(x, waiting_times, width, label='Tiempo de Espera',
+                      color='lightgreen', edgecolor='black', linewidth=1.2)
+        axes[1, 0].bar(x + width, turnaround_times, width, label='Tiempo de Retorno',
+                      color='salmon', edgecolor='black', linewidth=1.2)
+        
+        axes[1, 0].set_title('Comparación de Tiempos', fontsize=12, fontweight='bold')
+        axes[1, 0].set_xlabel('Proceso')
+        axes[1, 0].set_ylabel('Tiempo (unidades)')
+        axes[1, 0].set_xticks(x)
+        axes[1, 0].set_xticklabels(processes)
+        axes[1, 0].legend()
+        axes[1, 0].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # 4. Diagrama de Gantt simplificado
+        draw_gantt(axes[1, 1], self.gantt, alpha=1.0)
+        
+        axes[1, 1].set_title('Diagrama de Gantt Simplificado', fontsize=12, fontweight='bold')
+        axes[1, 1].set_xlabel('Tiempo (unidades)')
+        axes[1, 1].set_yticks([])
+        axes[1, 1].grid(axis='x', linestyle='--', alpha=0.7)
+        
+        # Título general y ajustes
+        plt.tight_layout()
+        fig.suptitle(f'Análisis del Algoritmo Round Robin (Quantum = {self.quantum})', 
+                    fontsize=16, fontweight='bold', y=1.02)
+        
+        return fig
+    
+    def plot_metrics(self, fig_size=(12, 6)):
+        """
+        Genera gráficos de barras para visualizar las métricas
+        
+        Args:
+            fig_size (tuple): Tamaño de la figura (ancho, alto)
+        """
+        if self.processes.empty:
+            print("No hay datos de procesos. Ejecuta la simulación primero.")
+            return
+        
+        plt = pyplot()
+        fig, axes = plt.subplots(1, 2, figsize=fig_size)
+        
+        # Configurar estilo y fuentes en español
+        plt.rcParams['axes.titlesize'] = 12
+        plt.rcParams['axes.labelsize'] = 10
+        
+        # Filtrar datos excluyendo el promedio si existe
+        process_data = self.processes[self.processes['process_id'] != 'PROMEDIO'].copy()
+        
+        # Ordenar los procesos para mejor visualización
+        process_data = process_data.sort_values('process_id')
+        
+        # Colores para los gráficos
+        colors_waiting = plt.cm.Blues(np.linspace(0.6, 0.9, len(process_data)))
+        colors_turnaround = plt.cm.Greens(np.linspace(0.6, 0.9, len(process_data)))
+        
+        # Gráfico de tiempos de espera
+        bars_wait = axes[0].bar(process_data['process_id'], process_data['waiting_time'], 
+                         color=colors_waiting, edgecolor='black', linewidth=1.5)
+        
+        axes[0].set_title('Tiempo de Espera por Proceso', fontsize=12, fontweight='bold')
+        axes[0].set_xlabel('Proceso', fontsize=10)
+        axes[0].set_ylabel('Tiempo de Espera (unidades)', fontsize=10)
+        axes[0].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Añadir etiquetas de valor en las barras
+        for bar in bars_wait:
+            height = bar.get_height()
+            axes[0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
+        
+        # Gráfico de tiempos de retorno
+        bars_turn = axes[1].bar(process_data['process_id'], process_data['turnaround_time'], 
+                         color=colors_turnaround, edgecolor='black', linewidth=1.5)
+        
+        axes[1].set_title('Tiempo de Retorno por Proceso', fontsize=12, fontweight='bold')
+        axes[1].set_xlabel('Proceso', fontsize=10)
+        axes[1].set_ylabel('Tiempo de Retorno (unidades)', fontsize=10)
+        axes[1].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Añadir etiquetas de valor en las barras
+        for bar in bars_turn:
+            height = bar.get_height()
+            axes[1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
+        
+        # Añadir línea horizontal para el promedio
+        if len(self.processes) > 1:
+            avg_waiting = self.processes['waiting_time'].mean()
+            avg_turnaround = self.processes['turnaround_time'].mean()
+            
+            axes[0].axhline(y=avg_waiting, color='red', linestyle='--', linewidth=2)
+            axes[0].text(len(process_data) * 0.5, avg_waiting + 0.2, 
+                  f'Promedio: {avg_waiting:.2f}', ha='center', va='bottom', 
+                  color='red', fontweight='bold')
+            
+            axes[1].axhline(y=avg_turnaround, color='red', linestyle='--', linewidth=2)
+            axes[1].text(len(process_data) * 0.5, avg_turnaround + 0.2, 
+                  f'Promedio: {avg_turnaround:.2f}', ha='center', va='bottom', 
+                  color='red', fontweight='bold')
+        
+        # Ajustar márgenes y espaciado
+        plt.tight_layout()
+        fig.suptitle('Métricas del Algoritmo Round Robin', fontsize=14, fontweight='bold', y=1.05)
+        
+        return fig
+
+
+# Función para generar un conjunto de ejemplo de procesos
+def generate_example_processes(n=5):
+    """
+    Genera un conjunto de ejemplo de procesos
+    
+    Args:
+        n (int): Número de procesos a generar
+    
+    Returns:
+        DataFrame: DataFrame con los procesos generados
+    """
+    # Generar datos aleatorios para los procesos
+    np.random.seed(42)  # Para reproducibilidad
+    
+    process_ids = [f'P{i+1}' for i in range(n)]
+    arrival_times = np.sort(np.random.randint(0, 10, n))  # Tiempos de llegada ordenados
+    burst_times = np.random.randint(1, 10, n)  # Tiempos de ráfaga entre 1 y 10
+    
+    # Crear DataFrame
+    processes = pd.DataFrame({
+        'process_id': process_ids,        # ID del proceso
+        'arrival_time': arrival_times,    # Tiempo de llegada
+        'burst_time': burst_times         # Tiempo de ráfaga (tiempo total de CPU requerido)
+    })
+    
+    # Renombrar las columnas a español para mostrarlas
+    processes_display = processes.rename(columns={
+        'process_id': 'ID Proceso',
+        'arrival_time': 'Tiempo Llegada',
+        'burst_time': 'Tiempo Ráfaga'
+    })
+    
+    # Mostrar la explicación de las columnas
+    print("\nExplicación de las columnas:")
+    print("- ID Proceso: Identificador único del proceso")
+    print("- Tiempo Llegada: Momento en que el proceso llega al sistema")
+    print("- Tiempo Ráfaga: Tiempo total que necesita el proceso para completar su ejecución")
+    
+    return processes
+
+# Función para obtener procesos del usuario
+def get_user_processes():
+    """
+    Permite al usuario ingresar los procesos manualmente
+    
+    Returns:
+        DataFrame: DataFrame con los procesos ingresados por el usuario
+    """
+    processes_data = []
+    
+    try:
+        num_processes = int(input("Ingrese el número de procesos: "))
+        
+        for i in range(num_processes):
+            print(f"\n--- Proceso {i+1} ---")
+            process_id = input(f"Identificador del proceso (por defecto P{i+1}): ")
+            if not process_id:
+                process_id = f"P{i+1}"
+                
+            arrival_time = int(input("Tiempo de llegada: "))
+            burst_time = int(input("Tiempo de ejecución (burst time): "))
+            
+            processes_data.append({
+                'process_id': process_id,
+                'arrival_time': arrival_time,
+                'burst_time': burst_time
+            })
+        
+        return pd.DataFrame(processes_data)
+    
+    except ValueError as e:
+        print(f"Error: Debe ingresar valores numéricos para tiempos. {e}")
+        return None
+
+# Ejemplo de uso de la simulación
+if __name__ == "__main__":
+    # Directorio de salida: argumento, SIMULADOR_SALIDA o el del script
+    output_dir = output_directory(__file__)
+    
+    try:
+        print("=" * 60)
+        print("      SIMULADOR DE ALGORITMO ROUND ROBIN")
+        print("=" * 60)
+        
+        # Preguntar si desea ingresar procesos manualmente o usar ejemplos
+        choice = input("¿Desea ingresar procesos manualmente? (s/n): ").lower()
+        
+        if choice.startswith('s'):
+            # Obtener procesos del usuario
+            processes = get_user_processes()
+            if processes is None or processes.empty:
+                print("No se ingresaron procesos válidos. Usando procesos de ejemplo.")
+                processes = generate_example_processes(5)
+        else:
+            # Usar procesos generados aleatoriamente
+            num_processes = int(input("¿Cuántos procesos aleatorios desea generar? (por defecto: 5): ") or 5)
+            processes = generate_example_processes(num_processes)
+        
+        print("\nProcesos a simular:")
+        print(processes)
+        
+        # Obtener quantum del usuario
+        quantum = int(input("\nIngrese el quantum de tiempo (por defecto: 2): ") or 2)
+        
+        print(f"\nIniciando simulación de Round Robin con quantum = {quantum}...")
+        
+        # Crear y ejecutar el simulador
+        simulator = RoundRobinSimulator(quantum=quantum)
+        simulator.add_processes_from_dataframe(processes)
+        
+        # Preguntar si desea visualización paso a paso
+        visualize = input("¿Desea ver la simulación paso a paso? (s/n): ").lower().startswith('s')
+        
+        # Ejecutar la simulación
+        results = simulator.run_simulation(visualize=visualize, step_by_step=visualize)
+        
+        # Mostrar resultados
+        print("\nResultados de la simulación:")
+        print(f"Tiempo promedio de espera: {results['avg_waiting_time']:.2f}")
+        print(f"Tiempo promedio de retorno: {results['avg_turnaround_time']:.2f}")
+        for metric, label in (('waiting_time', 'espera'), ('turnaround_time', 'retorno')):
+            summary = results['metrics'][metric]
+            print(f"Percentiles del tiempo de {label}: p50 {summary['p50']:.2f}, "
+                  f"p95 {summary['p95']:.2f}, p99 {summary['p99']:.2f}, p99.9 {summary['p99.9']:.2f}")
+        
+        # Mostrar tabla de métricas
+        print("\nMétricas por proceso:")
+        metrics = simulator.generate_metrics_summary()
+        print(metrics.to_string(index=False))
+        
+        # Mostrar explicación de las métricas
+        print("\nExplicación de las métricas:")
+        print("- ID Proceso: Identificador único de cada proceso")
+        print("- Tiempo Llegada: Momento en que el proceso llega al sistema")
+        print("- Tiempo Ráfaga: Tiempo total que el proceso necesita para completar su ejecución")
+        print("- Tiempo Finalización: Momento en que el proceso termina su ejecución")
+        print("- Tiempo Retorno: Tiempo total que el proceso pasa en el sistema (Finalización - Llegada)")
+        print("- Tiempo Espera: Tiempo que el proceso pasa esperando en cola (Retorno - Ráfaga)")
+        
+        print("\nSecuencia de ejecución:")
+        for proc, start, end in simulator.execution_sequence:
+            print(f"Proceso {proc}: {start} -> {end}")
+        
+        # Guardar resultados en archivo
+        results_path = os.path.join(output_dir, "resultados_round_robin.txt")
+        with open(results_path, "w") as f:
+            f.write("Procesos simulados:\n")
+            f.write(str(processes) + "\n\n")
+            
+            f.write(f"Quantum utilizado: {quantum}\n\n")
+            
+            f.write("Resultados de la simulación:\n")
+            f.write(f"Tiempo promedio de espera: {results['avg_waiting_time']:.2f}\n")
+            f.write(f"Tiempo promedio de retorno: {results['avg_turnaround_time']:.2f}\n\n")
+            
+            f.write("Métricas por proceso:\n")
+            f.write(metrics.to_string(index=False) + "\n\n")
+            
+            f.write("Secuencia de ejecución:\n")
+            f.writelines(f"Proceso {proc}: {start} -> {end}\n"
+                         for proc, start, end in simulator.execution_sequence)
+        
+        print(f"\n¡Resultados guardados en {results_path}!")
+        
+        # Guardar la ejecución en formato columnar (se recarga con almacen.load_run)
+        run_path = os.path.join(output_dir, "ejecucion_round_robin")
+        save_run(run_path, simulator.processes, simulator.gantt, {'quantum': quantum})
+        print(f"Ejecución guardada en formato columnar en: {run_path}")
+        
+        # Generar y mostrar gráficos
+        print("\nGenerando gráficos...")
+        plt = pyplot()
+        
+        # Preguntamos qué gráficos quiere ver
+        print("\n¿Qué gráficos desea visualizar?")
+        print("1. Diagrama de Gantt")
+        print("2. Gráficos de barras con métricas")
+        print("3. Gráfico completo con todas las métricas")
+        print("4. Todos los gráficos")
+        
+        try:
+            choice = int(input("\nIngrese su elección (1-4): "))
+        except ValueError:
+            choice = 2  # Por defecto mostramos los gráficos de barras
+        
+        # Según la elección, mostramos diferentes gráficos
+        if choice == 1 or choice == 4:
+            try:
+                gantt_fig = simulator.generate_gantt_chart()
+                gantt_fig.savefig(os.path.join(output_dir, "gantt_chart.png"))
+                print(f"Diagrama de Gantt guardado como: {os.path.join(output_dir, 'gantt_chart.png')}")
+                plt.figure(gantt_fig.number)
+                plt.show(block=False if choice == 4 else True)
+            except Exception as e:
+                print(f"No se pudo generar el diagrama de Gantt: {e}")
+        
+        if choice == 2 or choice == 4:
+            try:
+                metrics_fig = simulator.plot_metrics()
+                metrics_fig.savefig(os.path.join(output_dir, "metricas_barras.png"))
+                print(f"Gráficos de métricas en barras guardados como: {os.path.join(output_dir, 'metricas_barras.png')}")
+                plt.figure(metrics_fig.number)
+                plt.show(block=False if choice == 4 else True)
+            except Exception as e:
+                print(f"No se pudo generar el gráfico de métricas en barras: {e}")
+        
+        if choice == 3 or choice == 4:
+            try:
+                comp_fig = simulator.plot_comprehensive_metrics()
+                comp_fig.savefig(os.path.join(output_dir, "metricas_completas.png"))
+                print(f"Gráfico completo guardado como: {os.path.join(output_dir, 'metricas_completas.png')}")
+                plt.figure(comp_fig.number)
+                plt.show()  # Este es el último, así que bloqueamos para mantener las figuras abiertas
+            except Exception as e:
+                print(f"No se pudo generar el gráfico completo: {e}")
+        
+        print("\n¡Simulación completada con éxito!")
+        
+    except Exception as e:
+        print(f"\nError durante la ejecución: {e}")
+        # Guardar el error en un archivo
+        error_path = os.path.join(output_dir, "error_round_robin.txt")
+        with open(error_path, "w") as f:
+            f.write(f"Error durante la ejecución: {e}")
+        print(f"Detalles del error guardados en: {error_path}")
\ No newline at end of file
@@ -1,720 +1,923 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import time
-from enum import Enum
-
-class AlgoritmoType(Enum):
-    """Enumeración de tipos de algoritmos de planificación"""
-    FIFO = "FIFO"
-    SJF = "SJF"
-    ROUND_ROBIN = "Round Robin"
-    PRIORIDAD = "Prioridad"
-
-def clear_screen():
-    """Función para limpiar la pantalla"""
-    print("\n" * 50)
-
-class PlanificadorCompleto:
-    def __init__(self, quantum=3):
-        """
-        Inicializa el planificador con soporte para múltiples algoritmos
-        
-        Args:
-            quantum (int): Quantum para Round Robin
-        """
-        self.quantum = quantum
-        self.processes = pd.DataFrame()
-        self.current_time = 0
-        self.execution_sequence = []
-        self.gantt_data = []
-        self.waiting_times = {}
-        self.turnaround_times = {}
-        self.response_times = {}
-        
-    def add_process(self, process_id, arrival_time, burst_time, priority=0):
-        """
-        Agrega un proceso al planificador
-        
-        Args:
-            process_id (str): ID del proceso
-            arrival_time (int): Tiempo de llegada
-            burst_time (int): Tiempo de CPU requerido
-            priority (int): Prioridad (menor número = mayor prioridad)
-        """
-        new_process = pd.DataFrame({
-            'process_id': [process_id],
-            'arrival_time': [arrival_time],
-            'burst_time': [burst_time],
-            'priority': [priority],
-            'remaining_time': [burst_time],
-            'completion_time': [0],
-            'waiting_time': [0],
-            'turnaround_time': [0],
-            'response_time': [0],
-            'first_response': [-1],
-            'state': ['NEW']
-        })
-        
-        self.processes = pd.concat([self.processes, new_process], ignore_index=True)
-        self.processes = self.processes.sort_values(['arrival_time', 'process_id']).reset_index(drop=True)
-    
-    def reset_simulation(self):
-        """Reinicia las variables para una nueva simulación"""
-        self.current_time = 0
-        self.execution_sequence = []
-        self.gantt_data = []
-        self.waiting_times = {}
-        self.turnaround_times = {}
-        self.response_times = {}
-        
-        # Reiniciar estados de procesos
-        self.processes['remaining_time'] = self.processes['burst_time']
-        self.processes['completion_time'] = 0
-        self.processes['waiting_time'] = 0
-        self.processes['turnaround_time'] = 0
-        self.processes['response_time'] = 0
-        self.processes['first_response'] = -1
-        self.processes['state'] = 'NEW'
-    
-    def simulate_fifo(self):
-        """
-        Simula el algoritmo FIFO (First In, First Out)
-        También conocido como FCFS (First Come, First Served)
-        """
-        self.reset_simulation()
-        print("🔄 Ejecutando algoritmo FIFO (First In, First Out)...")
-        
-        # Ordenar procesos por tiempo de llegada
-        processes_sorted = self.processes.sort_values(['arrival_time', 'process_id']).copy()
-        
-        for _, process in processes_sorted.iterrows():
-            process_id = process['process_id']
-            arrival_time = process['arrival_time']
-            burst_time = process['burst_time']
-            
-            # Si el proceso llega después del tiempo actual, esperar
-            if arrival_time > self.current_time:
-                # Tiempo ocioso
-                if arrival_time > self.current_time:
-                    self.gantt_data.append({
-                        'process': 'IDLE',
-                        'start': self.current_time,
-                        'end': arrival_time
-                    })
-                self.current_time = arrival_time
-            
-            # Registrar tiempo de respuesta (primera vez que se ejecuta)
-            idx = self.processes[self.processes['process_id'] == process_id].index[0]
-            response_time = self.current_time - arrival_time
-            self.processes.loc[idx, 'response_time'] = response_time
-            self.processes.loc[idx, 'first_response'] = self.current_time
-            
-            # Ejecutar el proceso completo
-            start_time = self.current_time
-            end_time = self.current_time + burst_time
-            
-            self.execution_sequence.append((process_id, start_time, end_time))
-            self.gantt_data.append({
-                'process': process_id,
-                'start': start_time,
-                'end': end_time
-            })
-            
-            # Actualizar tiempos
-            self.current_time = end_time
-            completion_time = end_time
-            turnaround_time = completion_time - arrival_time
-            waiting_time = turnaround_time - burst_time
-            
-            # Guardar métricas
-            self.processes.loc[idx, 'completion_time'] = completion_time
-            self.processes.loc[idx, 'turnaround_time'] = turnaround_time
-            self.processes.loc[idx, 'waiting_time'] = waiting_time
-            self.processes.loc[idx, 'state'] = 'TERMINATED'
-        
-        return self._calculate_averages()
-    
-    def simulate_sjf(self):
-        """
-        Simula el algoritmo SJF (Shortest Job First)
-        Versión no preemptiva
-        """
-        self.reset_simulation()
-        print("⚡ Ejecutando algoritmo SJF (Shortest Job First)...")
-        
-        completed_processes = set()
-        
-        while len(completed_processes) < len(self.processes):
-            # Obtener procesos disponibles (que han llegado y no están completados)
-            available_processes = self.processes[
-                (self.processes['arrival_time'] <= self.current_time) & 
-                (~self.processes['process_id'].isin(completed_processes))
-            ].copy()
-            
-            if available_processes.empty:
-                # No hay procesos disponibles, avanzar al siguiente arrival_time
-                next_arrival = self.processes[
-                    ~self.processes['process_id'].isin(completed_processes)
-                ]['arrival_time'].min()
-                
-                if next_arrival > self.current_time:
-                    self.gantt_data.append({
-                        'process': 'IDLE',
-                        'start': self.current_time,
-                        'end': next_arrival
-                    })
-                    self.current_time = next_arrival
-                continue
-            
-            # Seleccionar el proceso con menor burst_time (SJF)
-            selected_process = available_processes.loc[available_processes['burst_time'].idxmin()]
-            process_id = selected_process['process_id']
-            arrival_time = selected_process['arrival_time']
-            burst_time = selected_process['burst_time']
-            
-            # Registrar tiempo de respuesta
-            idx = self.processes[self.processes['process_id'] == process_id].index[0]
-            response_time = self.current_time - arrival_time
-            self.processes.loc[idx, 'response_time'] = response_time
-            self.processes.loc[idx, 'first_response'] = self.current_time
-            
-            # Ejecutar el proceso completo
-            start_time = self.current_time
-            end_time = self.current_time + burst_time
-            
-            self.execution_sequence.append((process_id, start_time, end_time))
-            self.gantt_data.append({
-                'process': process_id,
-                'start': start_time,
-                'end': end_time
-            })
-            
-            # Actualizar tiempos
-            self.current_time = end_time
-            completion_time = end_time
-            turnaround_time = completion_time - arrival_time
-            waiting_time = turnaround_time - burst_time
-            
-            # Guardar métricas
-            self.processes.loc[idx, 'completion_time'] = completion_time
-            self.processes.loc[idx, 'turnaround_time'] = turnaround_time
-            self.processes.loc[idx, 'waiting_time'] = waiting_time
-            self.processes.loc[idx, 'state'] = 'TERMINATED'
-            
-            completed_processes.add(process_id)
-        
-        return self._calculate_averages()
-    
-    def simulate_round_robin(self):
-        """
-        Simula el algoritmo Round Robin
-        """
-        self.reset_simulation()
-        print(f"🔄 Ejecutando algoritmo Round Robin (Quantum = {self.quantum})...")
-        
-        ready_queue = []
-        
-        # Función auxiliar para agregar procesos que han llegado
-        def add_arrived_processes():
-            for i, row in self.processes.iterrows():
-                if (row['arrival_time'] <= self.current_time and 
-                    row['remaining_time'] > 0 and 
-                    row['process_id'] not in ready_queue and 
-                    row['state'] != 'TERMINATED'):
-                    
-                    ready_queue.append(row['process_id'])
-                    if self.processes.loc[i, 'state'] == 'NEW':
-                        self.processes.loc[i, 'state'] = 'READY'
-        
-        # Agregar procesos que ya han llegado al tiempo 0
-        add_arrived_processes()
-        
-        while True:
-            # Si la cola está vacía pero hay procesos que no han llegado
-            if not ready_queue and self.processes[self.processes['remaining_time'] > 0].shape[0] > 0:
-                next_arrival = self.processes[
-                    (self.processes['remaining_time'] > 0) & 
-                    (self.processes['arrival_time'] > self.current_time)
-                ]['arrival_time'].min()
-                
-                # Tiempo ocioso
-                if next_arrival > self.current_time:
-                    self.gantt_data.append({
-                        'process': 'IDLE',
-                        'start': self.current_time,
-                        'end': next_arrival
-                    })
-                    self.current_time = next_arrival
-                
-                add_arrived_processes()
-                continue
-            
-            # Si no hay más procesos
-            if not ready_queue:
-                break
-            
-            # Obtener el siguiente proceso (FIFO en la cola)
-            current_process_id = ready_queue.pop(0)
-            current_process_idx = self.processes[self.processes['process_id'] == current_process_id].index[0]
-            
-            # Registrar primera respuesta
-            if self.processes.loc[current_process_idx, 'first_response'] == -1:
-                arrival_time = self.processes.loc[current_process_idx, 'arrival_time']
-                response_time = self.current_time - arrival_time
-                self.processes.loc[current_process_idx, 'first_response'] = self.current_time
-                self.processes.loc[current_process_idx, 'response_time'] = response_time
-            
-            # Determinar tiempo de ejecución
-            remaining = self.processes.loc[current_process_idx, 'remaining_time']
-            execution_time = min(self.quantum, remaining)
-            
-            # Ejecutar
-            start_time = self.current_time
-            end_time = self.current_time + execution_time
-            
-            self.execution_sequence.append((current_process_id, start_time, end_time))
-            self.gantt_data.append({
-                'process': current_process_id,
-                'start': start_time,
-                'end': end_time
-            })
-            
-            # Actualizar tiempo y remaining_time
-            self.current_time = end_time
-            new_remaining = remaining - execution_time
-            self.processes.loc[current_process_idx, 'remaining_time'] = new_remaining
-            
-            # Agregar procesos que llegaron durante la ejecución
-            add_arrived_processes()
-            
-            # Si el proceso terminó
-            if new_remaining == 0:
-                arrival_time = self.processes.loc[current_process_idx, 'arrival_time']
-                burst_time = self.processes.loc[current_process_idx, 'burst_time']
-                completion_time = self.current_time
-                turnaround_time = completion_time - arrival_time
-                waiting_time = turnaround_time - burst_time
-                
-                self.processes.loc[current_process_idx, 'completion_time'] = completion_time
-                self.processes.loc[current_process_idx, 'turnaround_time'] = turnaround_time
-                self.processes.loc[current_process_idx, 'waiting_time'] = waiting_time
-                self.processes.loc[current_process_idx, 'state'] = 'TERMINATED'
-            else:
-                # El proceso vuelve al final de la cola
-                ready_queue.append(current_process_id)
-        
-        return self._calculate_averages()
-    
-    def simulate_priority(self):
-        """
-        Simula el algoritmo de Prioridades (no preemptivo)
-        Menor número = mayor prioridad
-        """
-        self.reset_simulation()
-        print("⭐ Ejecutando algoritmo de Prioridades...")
-        
-        completed_processes = set()
-        
-        while len(completed_processes) < len(self.processes):
-            # Obtener procesos disponibles
-            available_processes = self.processes[
-                (self.processes['arrival_time'] <= self.current_time) & 
-                (~self.processes['process_id'].isin(completed_processes))
-            ].copy()
-            
-            if available_processes.empty:
-                # No hay procesos disponibles
-                next_arrival = self.processes[
-                    ~self.processes['process_id'].isin(completed_processes)
-                ]['arrival_time'].min()
-                
-                if next_arrival > self.current_time:
-                    self.gantt_data.append({
-                        'process': 'IDLE',
-                        'start': self.current_time,
-                        'end': next_arrival
-                    })
-                    self.current_time = next_arrival
-                continue
-            
-            # Seleccionar proceso con mayor prioridad (menor número)
-            # En caso de empate, usar arrival_time como desempate
-            selected_process = available_processes.loc[
-                available_processes.groupby('priority')['arrival_time'].idxmin().loc[
-                    available_processes['priority'].min()
-                ]
-            ]
-            
-            process_id = selected_process['process_id']
-            arrival_time = selected_process['arrival_time']
-            burst_time = selected_process['burst_time']
-            priority = selected_process['priority']
-            
-            # Registrar tiempo de respuesta
-            idx = self.processes[self.processes['process_id'] == process_id].index[0]
-            response_time = self.current_time - arrival_time
-            self.processes.loc[idx, 'response_time'] = response_time
-            self.processes.loc[idx, 'first_response'] = self.current_time
-            
-            # Ejecutar el proceso completo
-            start_time = self.current_time
-            end_time = self.current_time + burst_time
-            
-            self.execution_sequence.append((process_id, start_time, end_time))
-            self.gantt_data.append({
-                'process': process_id,
-                'start': start_time,
-                'end': end_time
-            })
-            
-            # Actualizar tiempos
-            self.current_time = end_time
-            completion_time = end_time
-            turnaround_time = completion_time - arrival_time
-            waiting_time = turnaround_time - burst_time
-            
-            # Guardar métricas
-            self.processes.loc[idx, 'completion_time'] = completion_time
-            self.processes.loc[idx, 'turnaround_time'] = turnaround_time
-            self.processes.loc[idx, 'waiting_time'] = waiting_time
-            self.processes.loc[idx, 'state'] = 'TERMINATED'
-            
-            completed_processes.add(process_id)
-        
-        return self._calculate_averages()
-    
-    def _calculate_averages(self):
-        """Calcula las métricas promedio"""
-        avg_waiting = self.processes['waiting_time'].mean()
-        avg_turnaround = self.processes['turnaround_time'].mean()
-        avg_response = self.processes['response_time'].mean()
-        
-        return {
-            'processes': self.processes.copy(),
-            'execution_sequence': self.execution_sequence.copy(),
-            'gantt_data': self.gantt_data.copy(),
-            'avg_waiting_time': avg_waiting,
-            'avg_turnaround_time': avg_turnaround,
-            'avg_response_time': avg_response
-        }
-    
-    def compare_algorithms(self):
-        """
-        Compara todos los algoritmos y muestra resultados
-        """
-        print("\n" + "="*80)
-        print("              COMPARACIÓN DE ALGORITMOS DE PLANIFICACIÓN")
-        print("="*80)
-        
-        algorithms = [
-            ("FIFO", self.simulate_fifo),
-            ("SJF", self.simulate_sjf),
-            ("Round Robin", self.simulate_round_robin),
-            ("Prioridad", self.simulate_priority)
-        ]
-        
-        results = {}
-        
-        for name, algorithm in algorithms:
-            print(f"\n--- Ejecutando {name} ---")
-            result = algorithm()
-            results[name] = result
-            
-            print(f"Tiempo promedio de espera: {result['avg_waiting_time']:.2f}")
-            print(f"Tiempo promedio de retorno: {result['avg_turnaround_time']:.2f}")
-            print(f"Tiempo promedio de respuesta: {result['avg_response_time']:.2f}")
-        
-        return results
-    
-    def generate_comparison_chart(self, results):
-        """
-        Genera un gráfico comparativo de todos los algoritmos
-        """
-        algorithms = list(results.keys())
-        waiting_times = [results[alg]['avg_waiting_time'] for alg in algorithms]
-        turnaround_times = [results[alg]['avg_turnaround_time'] for alg in algorithms]
-        response_times = [results[alg]['avg_response_time'] for alg in algorithms]
-        
-        # Crear gráfico comparativo
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        
-        # Colores para cada algoritmo
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
-        
-        # 1. Gráfico de tiempos de espera
-        bars1 = axes[0, 0].bar(algorithms, waiting_times, color=colors, edgecolor='black', linewidth=1.5)
-        axes[0, 0].set_title('Tiempo Promedio de Espera', fontsize=14, fontweight='bold')
-        axes[0, 0].set_ylabel('Tiempo (unidades)')
-        axes[0, 0].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Añadir valores en las barras
-        for bar in bars1:
-            height = bar.get_height()
-            axes[0, 0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
-        
-        # 2. Gráfico de tiempos de retorno
-        bars2 = axes[0, 1].bar(algorithms, turnaround_times, color=colors, edgecolor='black', linewidth=1.5)
-        axes[0, 1].set_title('Tiempo Promedio de Retorno', fontsize=14, fontweight='bold')
-        axes[0, 1].set_ylabel('Tiempo (unidades)')
-        axes[0, 1].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        for bar in bars2:
-            height = bar.get_height()
-            axes[0, 1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
-        
-        # 3. Gráfico de tiempos de respuesta
-        bars3 = axes[1, 0].bar(algorithms, response_times, color=colors, edgecolor='black', linewidth=1.5)
-        axes[1, 0].set_title('Tiempo Promedio de Respuesta', fontsize=14, fontweight='bold')
-        axes[1, 0].set_ylabel('Tiempo (unidades)')
-        axes[1, 0].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        for bar in bars3:
-            height = bar.get_height()
-            axes[1, 0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
-        
-        # 4. Gráfico comparativo conjunto
-        x = np.arange(len(algorithms))
-        width = 0.25
-        
-        axes[1, 1].bar(x - width, waiting_times, width, label='Tiempo Espera', 
-                      color='#FF6B6B', edgecolor='black', linewidth=1)
-        axes[1, 1].bar(x, turnaround_times, width, label='Tiempo Retorno', 
-                      color='#4ECDC4', edgecolor='black', linewidth=1)
-        axes[1, 1].bar(x + width, response_times, width, label='Tiempo Respuesta', 
-                      color='#45B7D1', edgecolor='black', linewidth=1)
-        
-        axes[1, 1].set_title('Comparación General', fontsize=14, fontweight='bold')
-        axes[1, 1].set_ylabel('Tiempo (unidades)')
-        axes[1, 1].set_xticks(x)
-        axes[1, 1].set_xticklabels(algorithms)
-        axes[1, 1].legend()
-        axes[1, 1].grid(axis='y', linestyle='--', alpha=0.7)
-        
-        plt.tight_layout()
-        fig.suptitle('Comparación de Algoritmos de Planificación', 
-                    fontsize=16, fontweight='bold', y=1.02)
-        
-        return fig
-    
-    def generate_gantt_charts(self, results):
-        """
-        Genera diagramas de Gantt para todos los algoritmos
-        """
-        fig, axes = plt.subplots(2, 2, figsize=(16, 10))
-        axes = axes.flatten()
-        
-        algorithms = list(results.keys())
-        colors = plt.cm.tab10.colors
-        
-        for i, algorithm in enumerate(algorithms):
-            ax = axes[i]
-            gantt_data = results[algorithm]['gantt_data']
-            
-            # Crear colores para procesos
-            process_colors = {}
-            unique_processes = set([d['process'] for d in gantt_data if d['process'] != 'IDLE'])
-            for j, process in enumerate(unique_processes):
-                process_colors[process] = colors[j % len(colors)]
-            process_colors['IDLE'] = 'lightgrey'
-            
-            # Dibujar barras
-            for data in gantt_data:
-                process = data['process']
-                start = data['start']
-                end = data['end']
-                duration = end - start
-                
-                ax.barh(0, duration, left=start, height=0.5,
-                       color=process_colors[process], edgecolor='black', alpha=0.8)
-                
-                # Añadir etiqueta
-                if duration > 0.5:
-                    ax.text(start + duration/2, 0, process,
-                           ha='center', va='center', fontweight='bold')
-            
-            ax.set_title(f'{algorithm}', fontsize=12, fontweight='bold')
-            ax.set_xlabel('Tiempo (unidades)')
-            ax.set_yticks([])
-            ax.grid(axis='x', linestyle='--', alpha=0.7)
-            
-            if gantt_data:
-                ax.set_xlim(0, max([d['end'] for d in gantt_data]))
-        
-        plt.tight_layout()
-        fig.suptitle('Diagramas de Gantt - Comparación de Algoritmos', 
-                    fontsize=16, fontweight='bold', y=1.02)
-        
-        return fig
-
-def get_user_processes():
-    """Permite al usuario ingresar procesos manualmente"""
-    processes_data = []
-    
-    try:
-        num_processes = int(input("Ingrese el número de procesos: "))
-        
-        for i in range(num_processes):
-            print(f"\n--- Proceso {i+1} ---")
-            process_id = input(f"ID del proceso (por defecto P{i+1}): ") or f"P{i+1}"
-            arrival_time = int(input("Tiempo de llegada: "))
-            burst_time = int(input("Tiempo de ejecución (burst time): "))
-            priority = int(input("Prioridad (menor número = mayor prioridad): "))
-            
-            processes_data.append({
-                'process_id': process_id,
-                'arrival_time': arrival_time,
-                'burst_time': burst_time,
-                'priority': priority
-            })
-        
-        return pd.DataFrame(processes_data)
-    
-    except ValueError as e:
-        print(f"Error: {e}")
-        return None
-
-def generate_example_processes():
-    """Genera procesos de ejemplo"""
-    processes_data = [
-        {'process_id': 'P1', 'arrival_time': 0, 'burst_time': 10, 'priority': 3},
-        {'process_id': 'P2', 'arrival_time': 1, 'burst_time': 4, 'priority': 1},
-        {'process_id': 'P3', 'arrival_time': 3, 'burst_time': 6, 'priority': 2},
-        {'process_id': 'P4', 'arrival_time': 4, 'burst_time': 2, 'priority': 4},
-        {'process_id': 'P5', 'arrival_time': 6, 'burst_time': 8, 'priority': 2}
-    ]
-    
-    return pd.DataFrame(processes_data)
-
-# Programa principal
-if __name__ == "__main__":
-    try:
-        print("=" * 80)
-        print("        SIMULADOR COMPLETO DE ALGORITMOS DE PLANIFICACIÓN")
-        print("=" * 80)
-        print("Algoritmos incluidos:")
-        print("1. FIFO (First In, First Out)")
-        print("2. SJF (Shortest Job First)")
-        print("3. Round Robin")
-        print("4. Prioridades")
-        print("=" * 80)
-        
-        # Obtener procesos
-        choice = input("\n¿Desea ingresar procesos manualmente? (s/n): ").lower()
-        
-        if choice.startswith('s'):
-            processes_df = get_user_processes()
-            if processes_df is None or processes_df.empty:
-                print("Usando procesos de ejemplo...")
-                processes_df = generate_example_processes()
-        else:
-            processes_df = generate_example_processes()
-        
-        print("\nProcesos a simular:")
-        print(processes_df.to_string(index=False))
-        
-        # Configurar quantum para Round Robin
-        quantum = int(input(f"\nQuantum para Round Robin (por defecto 3): ") or 3)
-        
-        # Crear planificador
-        planificador = PlanificadorCompleto(quantum=quantum)
-        
-        # Agregar procesos
-        for _, process in processes_df.iterrows():
-            planificador.add_process(
-                process['process_id'],
-                process['arrival_time'],
-                process['burst_time'],
-                process['priority']
-            )
-        
-        # Ejecutar comparación
-        print("\n🚀 Iniciando simulación de todos los algoritmos...")
-        results = planificador.compare_algorithms()
-        
-        # Mostrar tabla comparativa
-        print("\n" + "="*80)
-        print("                    TABLA COMPARATIVA FINAL")
-        print("="*80)
-        
-        comparison_data = []
-        for algorithm, result in results.items():
-            comparison_data.append({
-                'Algoritmo': algorithm,
-                'Tiempo Espera': f"{result['avg_waiting_time']:.2f}",
-                'Tiempo Retorno': f"{result['avg_turnaround_time']:.2f}",
-                'Tiempo Respuesta': f"{result['avg_response_time']:.2f}"
-            })
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        print(comparison_df.to_string(index=False))
-        
-        # Encontrar el mejor algoritmo para cada métrica
-        best_waiting = min(results.items(), key=lambda x: x[1]['avg_waiting_time'])
-        best_turnaround = min(results.items(), key=lambda x: x[1]['avg_turnaround_time'])
-        best_response = min(results.items(), key=lambda x: x[1]['avg_response_time'])
-        
-        print(f"\n🏆 MEJORES ALGORITMOS:")
-        print(f"Menor tiempo de espera: {best_waiting[0]} ({best_waiting[1]['avg_waiting_time']:.2f})")
-        print(f"Menor tiempo de retorno: {best_turnaround[0]} ({best_turnaround[1]['avg_turnaround_time']:.2f})")
-        print(f"Menor tiempo de respuesta: {best_response[0]} ({best_response[1]['avg_response_time']:.2f})")
-        
-        # Generar gráficos
-        print("\n📊 Generando gráficos comparativos...")
-        
-        # Gráfico de comparación de métricas
-        comparison_fig = planificador.generate_comparison_chart(results)
-        comparison_fig.savefig("d:\\cloud computing\\round robin.py\\comparacion_algoritmos.png", 
-                              dpi=300, bbox_inches='tight')
-        print("✅ Gráfico de comparación guardado: comparacion_algoritmos.png")
-        
-        # Diagramas de Gantt
-        gantt_fig = planificador.generate_gantt_charts(results)
-        gantt_fig.savefig("d:\\cloud computing\\round robin.py\\gantt_comparacion.png", 
-                         dpi=300, bbox_inches='tight')
-        print("✅ Diagramas de Gantt guardados: gantt_comparacion.png")
-        
-        # Guardar resultados detallados
-        with open("d:\\cloud computing\\round robin.py\\resultados_comparacion.txt", "w", encoding='utf-8') as f:
-            f.write("COMPARACIÓN DE ALGORITMOS DE PLANIFICACIÓN\n")
-            f.write("="*50 + "\n\n")
-            
-            f.write("PROCESOS SIMULADOS:\n")
-            f.write(processes_df.to_string(index=False) + "\n\n")
-            
-            f.write(f"QUANTUM ROUND ROBIN: {quantum}\n\n")
-            
-            for algorithm, result in results.items():
-                f.write(f"--- {algorithm.upper()} ---\n")
-                f.write(f"Tiempo promedio de espera: {result['avg_waiting_time']:.2f}\n")
-                f.write(f"Tiempo promedio de retorno: {result['avg_turnaround_time']:.2f}\n")
-                f.write(f"Tiempo promedio de respuesta: {result['avg_response_time']:.2f}\n")
-                
-                f.write("\nSecuencia de ejecución:\n")
-                for proc, start, end in result['execution_sequence']:
-                    f.write(f"{proc}: {start} -> {end}\n")
-                f.write("\n")
-            
-            f.write("MEJORES ALGORITMOS:\n")
-            f.write(f"Menor tiempo de espera: {best_waiting[0]}\n")
-            f.write(f"Menor tiempo de retorno: {best_turnaround[0]}\n")
-            f.write(f"Menor tiempo de respuesta: {best_response[0]}\n")
-        
-        print("✅ Resultados detallados guardados: resultados_comparacion.txt")
-        
-        # Mostrar gráficos
-        plt.show()
-        
-        print("\n🎉 ¡Simulación completada exitosamente!")
-        print("Archivos generados:")
-        print("- comparacion_algoritmos.png")
-        print("- gantt_comparacion.png") 
-        print("- resultados_comparacion.txt")
-        
-    except Exception as e:
-        print(f"\n❌ Error durante la ejecución: {e}")
-        import traceback
-        traceback.print_exc()
+import pandas as pd
+import numpy as np
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+
+from almacen import save_run, output_directory
+from barrido import share_arrays, attach_arrays, shared_workload, release_arrays
+from cargas import read_workload, merge_sorted
+from gantt import GanttRLE
+from graficos import draw_gantt, pyplot, DECIMATE_ABOVE
+from metricas import OnlineMetrics
+from motores import (RoundRobinEngine, NonPreemptiveEngine, PreemptiveEngine, SRTFEngine,
+                     AgingPriorityEngine, RoundBatch, IDLE, STATE_NAMES)
+from perfil import ENGINE_PHASES, profiled, track
+from puntos_control import Checkpointer, DEFAULT_INTERVAL
+
+class AlgoritmoType(Enum):
+    """Enumeración de tipos de algoritmos de planificación"""
+    FIFO = "FIFO"
+    SJF = "SJF"
+    ROUND_ROBIN = "Round Robin"
+    PRIORIDAD = "Prioridad"
+    SRTF = "SRTF"
+    PRIORIDAD_ENVEJECIMIENTO = "Prioridad con envejecimiento"
+
+# Método de PlanificadorCompleto que simula cada algoritmo, en el orden de la comparación
+SIMULATORS = {
+    AlgoritmoType.FIFO: 'simulate_fifo',
+    AlgoritmoType.SJF: 'simulate_sjf',
+    AlgoritmoType.ROUND_ROBIN: 'simulate_round_robin',
+    AlgoritmoType.PRIORIDAD: 'simulate_priority',
+    AlgoritmoType.SRTF: 'simulate_srtf',
+    AlgoritmoType.PRIORIDAD_ENVEJECIMIENTO: 'simulate_priority_aging'
+}
+
+# Mejora de prioridad por unidad de tiempo de espera en simulate_priority_aging
+DEFAULT_AGING_RATE = 0.1
+
+# Columnas de entrada que se publican en memoria compartida para compararlos en paralelo
+SHARED_COLUMNS = ('arrival_time', 'burst_time', 'priority')
+
+def clear_screen():
+    """Función para limpiar la pantalla"""
+    print("\n" * 50)
+
+class PlanificadorCompleto:
+    def __init__(self, quantum=3, profile=False, aging_rate=DEFAULT_AGING_RATE):
+        """
+        Inicializa el planificador con soporte para múltiples algoritmos
+        
+        Args:
+            quantum (int): Quantum para Round Robin
+            aging_rate (float): Tasa de envejecimiento de simulate_priority_aging
+            profile (bool): Si es True, cada simulate_* mide el tiempo de sus
+                            fases y deja el desglose en self.profile_report
+        """
+        self.quantum = quantum
+        self.aging_rate = aging_rate
+        self.profile = profile
+        self.profile_report = None
+        self.processes = pd.DataFrame()
+        self.current_time = 0
+        self.execution_sequence = []
+        self.gantt_data = []
+        self.gantt = None
+        self.waiting_times = {}
+        self.turnaround_times = {}
+        self.response_times = {}
+        self.metrics = OnlineMetrics()
+        
+    def add_process(self, process_id, arrival_time, burst_time, priority=0):
+        """
+        Agrega un proceso al planificador
+        
+        Args:
+            process_id (str): ID del proceso
+            arrival_time (int): Tiempo de llegada
+            burst_time (int): Tiempo de CPU requerido
+            priority (int): Prioridad (menor número = mayor prioridad)
+        """
+        self.load_processes({
+            'process_id': [process_id],
+            'arrival_time': [arrival_time],
+            'burst_time': [burst_time],
+            'priority': [priority]
+        })
+    
+    def load_processes(self, data):
+        """
+        Agrega un conjunto de procesos construyendo la tabla en una sola pasada
+        
+        Args:
+            data (DataFrame | dict): Columnas 'process_id', 'arrival_time', 'burst_time'
+                                     y opcionalmente 'priority' (por defecto 0)
+        
+        Raises:
+            ValueError: Si faltan columnas o los valores no son válidos
+        """
+        columns = read_workload(data, optional={'priority': 0})
+        n = len(columns['process_id'])
+        
+        new_processes = pd.DataFrame({
+            'process_id': columns['process_id'],
+            'arrival_time': columns['arrival_time'],
+            'burst_time': columns['burst_time'],
+            'priority': columns['priority'],
+            'remaining_time': columns['burst_time'],
+            'completion_time': np.zeros(n, dtype=np.int64),
+            'waiting_time': np.zeros(n, dtype=np.int64),
+            'turnaround_time': np.zeros(n, dtype=np.int64),
+            'response_time': np.zeros(n, dtype=np.int64),
+            'first_response': np.full(n, -1),
+            'state': 'NEW'
+        })
+        
+        self.processes = merge_sorted(self.processes, new_processes)
+    
+    def reset_simulation(self):
+        """Reinicia las variables para una nueva simulación"""
+        self.current_time = 0
+        self.execution_sequence = []
+        self.gantt_data = []
+        self.gantt = None
+        self.waiting_times = {}
+        self.turnaround_times = {}
+        self.response_times = {}
+        
+        # Métricas en línea: se actualizan al terminar cada proceso
+        self.metrics = track(self, OnlineMetrics())
+        
+        # Reiniciar estados de procesos
+        self.processes['remaining_time'] = self.processes['burst_time']
+        self.processes['completion_time'] = 0
+        self.processes['waiting_time'] = 0
+        self.processes['turnaround_time'] = 0
+        self.processes['response_time'] = 0
+        self.processes['first_response'] = -1
+        self.processes['state'] = 'NEW'
+    
+    @profiled
+    def simulate_fifo(self):
+        """
+        Simula el algoritmo FIFO (First In, First Out)
+        También conocido como FCFS (First Come, First Served)
+        """
+        self.reset_simulation()
+        print("🔄 Ejecutando algoritmo FIFO (First In, First Out)...")
+        
+        self.gantt = track(self, self._fifo_schedule())
+        self.execution_sequence = self.gantt.sequence(include_idle=False)
+        self.gantt_data = self.gantt.records()
+        if len(self.processes):
+            self.current_time = self.processes['completion_time'].iloc[-1]
+        return self._calculate_averages()
+    
+    def _iter_fifo(self):
+        """Genera los intervalos de FIFO (calculados de una vez) uno a uno"""
+        for process_id, start_time, end_time in self._fifo_schedule().sequence():
+            self.current_time = end_time
+            yield (process_id, start_time, end_time)
+    
+    def _fifo_schedule(self):
+        """
+        Calcula FIFO de forma vectorizada y registra las métricas de los procesos
+        
+        La tabla ya está ordenada por (arrival_time, process_id), que es el
+        orden de ejecución. La recurrencia fin_i = max(llegada_i, fin_(i-1)) +
+        ráfaga_i se resuelve con una suma acumulada y un máximo acumulado, y
+        hay tiempo ocioso antes de cada proceso que llega después de que
+        terminó el anterior.
+        
+        Returns:
+            GanttRLE: Diagrama con los procesos y el tiempo ocioso entre ellos
+        """
+        arrival = self.processes['arrival_time'].to_numpy()
+        burst = self.processes['burst_time'].to_numpy()
+        dtype = np.result_type(arrival, burst)
+        n = len(arrival)
+        
+        # fin_i = total_i + max(0, max_(j<=i)(llegada_j - total_(j-1))), con
+        # total = ráfagas acumuladas: el máximo es el retraso acumulado por
+        # las llegadas tardías (la CPU parte en 0). Se opera en el lugar para
+        # no crear temporales del tamaño de la tabla.
+        total = np.cumsum(burst, dtype=dtype)
+        end = arrival - total
+        end += burst
+        np.maximum.accumulate(end, out=end)
+        np.maximum(end, 0, out=end)
+        end += total
+        start = end - burst
+        
+        # Hay tiempo ocioso antes de cada proceso que encuentra la CPU libre
+        idle = np.empty(n, dtype=bool)
+        idle[:1] = start[:1] > 0
+        np.greater(start[1:], end[:-1], out=idle[1:])
+        waiting = np.flatnonzero(idle)
+        gap_start = end[waiting - 1]
+        if len(waiting) and waiting[0] == 0:
+            gap_start[0] = 0
+        
+        # Intercalar los tramos IDLE: el k-ésimo queda k posiciones más adelante
+        gaps = waiting + np.arange(len(waiting))
+        size = n + len(gaps)
+        busy = np.ones(size, dtype=bool)
+        busy[gaps] = False
+        owners = np.full(size, IDLE, dtype=np.int64)
+        starts = np.empty(size, dtype=dtype)
+        ends = np.empty(size, dtype=dtype)
+        owners[busy] = np.arange(n)
+        starts[busy] = start
+        ends[busy] = end
+        starts[gaps] = gap_start
+        ends[gaps] = start[waiting]
+        
+        # FIFO nunca actualizó remaining_time: se conserva la tabla de siempre
+        turnaround = end - arrival
+        waiting_time = turnaround - burst
+        response_time = start - arrival
+        self.processes['completion_time'] = end
+        self.processes['turnaround_time'] = turnaround
+        self.processes['waiting_time'] = waiting_time
+        self.processes['first_response'] = start
+        self.processes['response_time'] = response_time
+        self.processes['state'] = 'TERMINATED'
+        self.metrics.record_many(waiting_time, turnaround, response_time)
+        
+        return GanttRLE.from_runs(owners, starts, ends, np.ones(size, dtype=np.int64),
+                                  labels=self.processes['process_id'].to_numpy())
+    
+    def profile_phases(self):
+        """Fases medidas con profile=True: (clase, método, fase)"""
+        return ENGINE_PHASES + (
+            (NonPreemptiveEngine, 'step', 'despacho'),
+            (NonPreemptiveEngine, '_admit', 'admisión'),
+            (PreemptiveEngine, 'step', 'despacho'),
+            (PreemptiveEngine, '_admit', 'admisión'),
+            (PlanificadorCompleto, '_fifo_schedule', 'selección'),
+            (OnlineMetrics, 'record_many', 'métricas'),
+            (PlanificadorCompleto, 'reset_simulation', 'reinicio'),
+            (PlanificadorCompleto, '_apply_engine_state', 'resultados'),
+            (PlanificadorCompleto, '_calculate_averages', 'resultados'),
+            (GanttRLE, 'sequence', 'resultados'),
+            (GanttRLE, 'records', 'resultados')
+        )
+    
+    @profiled
+    def simulate_sjf(self):
+        """
+        Simula el algoritmo SJF (Shortest Job First)
+        Versión no preemptiva
+        """
+        self.reset_simulation()
+        print("⚡ Ejecutando algoritmo SJF (Shortest Job First)...")
+        
+        engine = self._keyed_engine('burst_time')
+        engine.run()
+        
+        # SJF nunca actualizó remaining_time: se conserva la tabla de siempre
+        self._record_engine(engine, update_remaining=False)
+        return self._calculate_averages()
+    
+    def _iter_sjf(self):
+        """Genera los intervalos de SJF a medida que se deciden"""
+        yield from self._iter_engine(self._keyed_engine('burst_time', keep_slices=False),
+                                     update_remaining=False)
+    
+    def _keyed_engine(self, column, keep_slices=True):
+        """
+        Motor no expropiativo que elige el menor valor de una columna
+        
+        El montículo ordena por (valor, slot). Como los slots siguen el orden
+        (arrival_time, process_id), los empates se resuelven igual que antes:
+        primero el que llegó antes, luego por ID.
+        
+        Args:
+            column (str): 'burst_time' para SJF, 'priority' para Prioridades
+            keep_slices (bool): Ver NonPreemptiveEngine
+        """
+        return track(self, NonPreemptiveEngine(self.processes['arrival_time'].to_numpy(),
+                                               self.processes['burst_time'].to_numpy(),
+                                               self.processes[column].to_numpy(),
+                                               keep_slices=keep_slices, metrics=self.metrics))
+    
+    @profiled
+    def simulate_srtf(self):
+        """
+        Simula el algoritmo SRTF (Shortest Remaining Time First)
+        Versión preemptiva de SJF: un proceso que llega con menos tiempo
+        restante que el que está en ejecución lo desplaza
+        """
+        self.reset_simulation()
+        print("⏱️ Ejecutando algoritmo SRTF (Shortest Remaining Time First)...")
+        
+        engine = self._srtf_engine()
+        engine.run()
+        
+        self._record_engine(engine)
+        return self._calculate_averages()
+    
+    def _iter_srtf(self):
+        """Genera los intervalos de SRTF a medida que se deciden"""
+        yield from self._iter_engine(self._srtf_engine(keep_slices=False))
+    
+    def _srtf_engine(self, keep_slices=True):
+        """Motor SRTF por eventos sobre la tabla de procesos (ver SRTFEngine)"""
+        return track(self, SRTFEngine(self.processes['arrival_time'].to_numpy(),
+                                      self.processes['burst_time'].to_numpy(),
+                                      keep_slices=keep_slices, metrics=self.metrics))
+    
+    @profiled
+    def simulate_round_robin(self, checkpoint=None, checkpoint_interval=DEFAULT_INTERVAL):
+        """
+        Simula el algoritmo Round Robin
+        
+        Args:
+            checkpoint (str): Directorio donde guardar puntos de control periódicos
+                              (se reanudan con resume)
+            checkpoint_interval (float): Segundos entre puntos de control
+        """
+        self.reset_simulation()
+        print(f"🔄 Ejecutando algoritmo Round Robin (Quantum = {self.quantum})...")
+        
+        # La cola de listos y la admisión de llegadas viven en el motor
+        engine = track(self, RoundRobinEngine(self.processes['arrival_time'].to_numpy(),
+                                              self.processes['burst_time'].to_numpy(),
+                                              self.quantum, metrics=self.metrics))
+        checkpointer = None
+        if checkpoint is not None:
+            checkpointer = track(self, Checkpointer.create(checkpoint, self.processes, engine,
+                                                           meta={'quantum': self.quantum},
+                                                           interval=checkpoint_interval))
+        return self._finish_round_robin(engine, checkpointer)
+    
+    @profiled
+    def resume(self, checkpoint, checkpoint_interval=DEFAULT_INTERVAL):
+        """
+        Reanuda una simulación Round Robin desde su último punto de control
+        
+        La tabla de procesos y el quantum se toman del punto de control; el
+        resultado es idéntico al de una ejecución sin interrupciones.
+        
+        Args:
+            checkpoint (str): Directorio de puntos de control de simulate_round_robin
+            checkpoint_interval (float): Segundos entre puntos de control al continuar
+        
+        Returns:
+            dict: Los mismos resultados que simulate_round_robin
+        """
+        checkpointer = track(self, Checkpointer.open(checkpoint, interval=checkpoint_interval))
+        self.processes = checkpointer.processes
+        self.quantum = checkpointer.meta['quantum']
+        self.reset_simulation()
+        print(f"🔄 Reanudando algoritmo Round Robin (Quantum = {self.quantum})...")
+        
+        engine = track(self, RoundRobinEngine(self.processes['arrival_time'].to_numpy(),
+                                              self.processes['burst_time'].to_numpy(),
+                                              self.quantum,
+                                              batch_rounds=checkpointer.meta['batch_rounds'],
+                                              metrics=self.metrics))
+        checkpointer.restore(engine)
+        return self._finish_round_robin(engine, checkpointer)
+    
+    def _finish_round_robin(self, engine, checkpointer=None):
+        """Ejecuta el motor Round Robin hasta el final y registra los resultados"""
+        engine.run(checkpointer)
+        if checkpointer is not None:
+            checkpointer.close()
+        
+        self._record_engine(engine)
+        return self._calculate_averages()
+    
+    def _record_engine(self, engine, update_remaining=True):
+        """
+        Registra la ejecución de un motor que ya terminó
+        
+        Args:
+            engine: Motor con timeline, current_time y los arreglos de _apply_engine_state
+            update_remaining (bool): Si es False, remaining_time no se modifica
+        """
+        # Registrar la ejecución (IDLE solo aparece en el diagrama de Gantt)
+        self.gantt = engine.timeline
+        self.gantt.labels = self.processes['process_id'].to_numpy()
+        self.execution_sequence = self.gantt.sequence(include_idle=False)
+        self.gantt_data = self.gantt.records()
+        self.current_time = engine.current_time
+        
+        self._apply_engine_state(engine, update_remaining)
+    
+    def _apply_engine_state(self, engine, update_remaining=True):
+        """
+        Copia a self.processes el estado final de un motor de simulación
+        
+        Args:
+            engine: Motor con arreglos arrival, burst, completion, first_response,
+                    state y (si update_remaining) remaining, indexados por fila
+            update_remaining (bool): Si es False, remaining_time no se modifica
+        """
+        terminated = engine.terminated_mask()
+        started = engine.first_response != -1
+        turnaround = engine.completion - engine.arrival
+        
+        if update_remaining:
+            self.processes['remaining_time'] = engine.remaining
+        self.processes['completion_time'] = np.where(terminated, engine.completion, 0)
+        self.processes['turnaround_time'] = np.where(terminated, turnaround, 0)
+        self.processes['waiting_time'] = np.where(terminated, turnaround - engine.burst, 0)
+        self.processes['first_response'] = engine.first_response
+        self.processes['response_time'] = np.where(started, engine.first_response - engine.arrival, 0)
+        self.processes['state'] = STATE_NAMES[engine.state]
+    
+    @profiled
+    def simulate_priority(self):
+        """
+        Simula el algoritmo de Prioridades (no preemptivo)
+        Menor número = mayor prioridad
+        """
+        self.reset_simulation()
+        print("⭐ Ejecutando algoritmo de Prioridades...")
+        
+        engine = self._keyed_engine('priority')
+        engine.run()
+        
+        # Prioridades nunca actualizó remaining_time: se conserva la tabla de siempre
+        self._record_engine(engine, update_remaining=False)
+        return self._calculate_averages()
+    
+    def _iter_priority(self):
+        """Genera los intervalos de Prioridades a medida que se deciden"""
+        yield from self._iter_engine(self._keyed_engine('priority', keep_slices=False),
+                                     update_remaining=False)
+    
+    @profiled
+    def simulate_priority_aging(self, aging_rate=None):
+        """
+        Simula Prioridades preemptivo con envejecimiento lineal
+        Menor número = mayor prioridad. La prioridad efectiva de un proceso es
+        priority - aging_rate × (tiempo que lleva esperando), de modo que los
+        procesos de baja prioridad no esperan indefinidamente
+        
+        Args:
+            aging_rate (float): Tasa de envejecimiento; por defecto, self.aging_rate
+        """
+        self.reset_simulation()
+        print("⭐ Ejecutando algoritmo de Prioridades con envejecimiento...")
+        
+        engine = self._aging_engine(aging_rate)
+        engine.run()
+        
+        self._record_engine(engine)
+        return self._calculate_averages()
+    
+    def _iter_priority_aging(self):
+        """Genera los intervalos de Prioridades con envejecimiento a medida que se deciden"""
+        yield from self._iter_engine(self._aging_engine(keep_slices=False))
+    
+    def _aging_engine(self, aging_rate=None, keep_slices=True):
+        """Motor de prioridades con envejecimiento sobre la tabla de procesos (ver AgingPriorityEngine)"""
+        return track(self, AgingPriorityEngine(self.processes['arrival_time'].to_numpy(),
+                                               self.processes['burst_time'].to_numpy(),
+                                               self.processes['priority'].to_numpy(),
+                                               self.aging_rate if aging_rate is None else aging_rate,
+                                               keep_slices=keep_slices, metrics=self.metrics))
+    
+    def _iter_round_robin(self):
+        """Genera los intervalos de Round Robin a medida que se deciden"""
+        engine = RoundRobinEngine(self.processes['arrival_time'].to_numpy(),
+                                  self.processes['burst_time'].to_numpy(),
+                                  self.quantum, keep_slices=False, metrics=self.metrics)
+        yield from self._iter_engine(engine)
+    
+    def _iter_engine(self, engine, update_remaining=True):
+        """
+        Genera los intervalos de un motor a medida que los decide
+        
+        Args:
+            engine: Motor sin registro de intervalos (keep_slices=False)
+            update_remaining (bool): Ver _apply_engine_state
+        """
+        process_ids = self.processes['process_id'].to_numpy()
+        for event in iter(engine.step, None):
+            slices = event.iter_slices() if isinstance(event, RoundBatch) else (event,)
+            for slot, start_time, end_time in slices:
+                self.current_time = end_time
+                yield ('IDLE' if slot == IDLE else process_ids[slot], start_time, end_time)
+        
+        self.current_time = engine.current_time
+        self._apply_engine_state(engine, update_remaining)
+    
+    def iter_simulation(self, algorithm=AlgoritmoType.ROUND_ROBIN):
+        """
+        Ejecuta un algoritmo generando cada intervalo a medida que se decide
+        
+        No guarda la secuencia de ejecución ni el diagrama de Gantt, de modo que
+        la memoria usada no crece con la duración de la simulación. Al agotarse
+        el generador, self.processes contiene las métricas finales.
+        
+        Args:
+            algorithm (AlgoritmoType | str): Algoritmo a simular
+        
+        Yields:
+            tuple: (process_id, inicio, fin), con 'IDLE' para el tiempo ocioso
+        """
+        runners = {
+            AlgoritmoType.FIFO: self._iter_fifo,
+            AlgoritmoType.SJF: self._iter_sjf,
+            AlgoritmoType.ROUND_ROBIN: self._iter_round_robin,
+            AlgoritmoType.PRIORIDAD: self._iter_priority,
+            AlgoritmoType.SRTF: self._iter_srtf,
+            AlgoritmoType.PRIORIDAD_ENVEJECIMIENTO: self._iter_priority_aging
+        }
+        runner = runners[AlgoritmoType(algorithm)]
+        self.reset_simulation()
+        yield from runner()
+    
+    def _calculate_averages(self):
+        """
+        Calcula las métricas promedio
+        
+        Returns:
+            dict: Resultados de la simulación. 'execution_sequence' y
+                  'gantt_data' son vistas de solo lectura sobre 'gantt'
+                  (GanttRLE); list() las convierte en listas modificables
+        """
+        avg_waiting = self.processes['waiting_time'].mean()
+        avg_turnaround = self.processes['turnaround_time'].mean()
+        avg_response = self.processes['response_time'].mean()
+        
+        return {
+            'processes': self.processes.copy(),
+            'execution_sequence': self.execution_sequence,
+            'gantt_data': self.gantt_data,
+            'gantt': self.gantt,
+            'avg_waiting_time': avg_waiting,
+            'avg_turnaround_time': avg_turnaround,
+            'avg_response_time': avg_response,
+            'metrics': self.metrics.summary()
+        }
+    
+    def compare_algorithms(self, workers=1):
+        """
+        Compara todos los algoritmos y muestra resultados
+        
+        Args:
+            workers (int): Procesos trabajadores. Con 1 (por defecto) los
+                           algoritmos se simulan uno tras otro sobre
+                           self.processes; con más, cada uno corre en su
+                           propio proceso sobre la carga publicada una sola
+                           vez en memoria compartida, y self.processes no se
+                           modifica. None usa uno por núcleo
+        
+        Returns:
+            dict: Nombre del algoritmo -> resultado de su simulate_*
+        """
+        print("\n" + "="*80)
+        print("              COMPARACIÓN DE ALGORITMOS DE PLANIFICACIÓN")
+        print("="*80)
+        
+        workers = min(workers or os.cpu_count() or 1, len(SIMULATORS))
+        if workers == 1:
+            results = {}
+            for algorithm, method in SIMULATORS.items():
+                print(f"\n--- Ejecutando {algorithm.value} ---")
+                results[algorithm.value] = getattr(self, method)()
+                self._print_averages(results[algorithm.value])
+            return results
+        
+        results = self._compare_parallel(workers)
+        for name, result in results.items():
+            print(f"\n--- {name} ---")
+            self._print_averages(result)
+        return results
+    
+    def _compare_parallel(self, workers):
+        """
+        Simula cada algoritmo en un proceso trabajador
+        
+        Los trabajadores leen las columnas de entrada desde memoria
+        compartida (de solo lectura) y simulan en un planificador propio, con
+        los slots como IDs; aquí solo se vuelven a poner los IDs reales.
+        
+        Returns:
+            dict: Mismo formato que compare_algorithms
+        """
+        arrays = {column: self.processes[column].to_numpy() for column in SHARED_COLUMNS}
+        process_ids = self.processes['process_id'].to_numpy()
+        
+        blocks, specs = share_arrays(arrays)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=attach_arrays,
+                                     initargs=(specs,)) as executor:
+                futures = {algorithm.value: executor.submit(_run_algorithm, method, self.quantum,
+                                                            self.aging_rate)
+                           for algorithm, method in SIMULATORS.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        finally:
+            release_arrays(blocks)
+        
+        for result in results.values():
+            result['processes']['process_id'] = process_ids
+            # La secuencia y los registros son vistas del mismo diagrama
+            result['gantt'].labels = process_ids
+        return results
+    
+    def _print_averages(self, result):
+        """Muestra los tiempos promedio de un resultado"""
+        print(f"Tiempo promedio de espera: {result['avg_waiting_time']:.2f}")
+        print(f"Tiempo promedio de retorno: {result['avg_turnaround_time']:.2f}")
+        print(f"Tiempo promedio de respuesta: {result['avg_response_time']:.2f}")
+    
+    def generate_comparison_chart(self, results):
+        """
+        Genera un gráfico comparativo de todos los algoritmos
+        """
+        algorithms = list(results.keys())
+        waiting_times = [results[alg]['avg_waiting_time'] for alg in algorithms]
+        turnaround_times = [results[alg]['avg_turnaround_time'] for alg in algorithms]
+        response_times = [results[alg]['avg_response_time'] for alg in algorithms]
+        
+        # Crear gráfico comparativo (matplotlib se importa recién aquí)
+        plt = pyplot()
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        
+        # Colores para cada algoritmo
+        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD']
+        
+        # 1. Gráfico de tiempos de espera
+        bars1 = axes[0, 0].bar(algorithms, waiting_times, color=colors, edgecolor='black', linewidth=1.5)
+        axes[0, 0].set_title('Tiempo Promedio de Espera', fontsize=14, fontweight='bold')
+        axes[0, 0].set_ylabel('Tiempo (unidades)')
+        axes[0, 0].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Añadir valores en las barras
+        for bar in bars1:
+            height = bar.get_height()
+            axes[0, 0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
+        
+        # 2. Gráfico de tiempos de retorno
+        bars2 = axes[0, 1].bar(algorithms, turnaround_times, color=colors, edgecolor='black', linewidth=1.5)
+        axes[0, 1].set_title('Tiempo Promedio de Retorno', fontsize=14, fontweight='bold')
+        axes[0, 1].set_ylabel('Tiempo (unidades)')
+        axes[0, 1].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        for bar in bars2:
+            height = bar.get_height()
+            axes[0, 1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
+        
+        # 3. Gráfico de tiempos de respuesta
+        bars3 = axes[1, 0].bar(algorithms, response_times, color=colors, edgecolor='black', linewidth=1.5)
+        axes[1, 0].set_title('Tiempo Promedio de Respuesta', fontsize=14, fontweight='bold')
+        axes[1, 0].set_ylabel('Tiempo (unidades)')
+        axes[1, 0].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        for bar in bars3:
+            height = bar.get_height()
+            axes[1, 0].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                           f'{height:.2f}', ha='center', va='bottom', fontweight='bold')
+        
+        # 4. Gráfico comparativo conjunto
+        x = np.arange(len(algorithms))
+        width = 0.25
+        
+        axes[1, 1].bar(x - width, waiting_times, width, label='Tiempo Espera', 
+                      color='#FF6B6B', edgecolor='black', linewidth=1)
+        axes[1, 1].bar(x, turnaround_times, width, label='Tiempo Retorno', 
+                      color='#4ECDC4', edgecolor='black', linewidth=1)
+        axes[1, 1].bar(x + width, response_times, width, label='Tiempo Respuesta', 
+                      color='#45B7D1', edgecolor='black', linewidth=1)
+        
+        axes[1, 1].set_title('Comparación General', fontsize=14, fontweight='bold')
+        axes[1, 1].set_ylabel('Tiempo (unidades)')
+        axes[1, 1].set_xticks(x)
+        axes[1, 1].set_xticklabels(algorithms)
+        axes[1, 1].legend()
+        axes[1, 1].grid(axis='y', linestyle='--', alpha=0.7)
+        
+        plt.tight_layout()
+        fig.suptitle('Comparación de Algoritmos de Planificación', 
+                    fontsize=16, fontweight='bold', y=1.02)
+        
+        return fig
+    
+    def generate_gantt_charts(self, results, decimate_above=DECIMATE_ABOVE):
+        """
+        Genera diagramas de Gantt para todos los algoritmos
+        
+        Args:
+            results (dict): Resultados de compare_algorithms
+            decimate_above (int): Número de tramos a partir del cual cada diagrama
+                                  se dibuja con un tramo por píxel
+        """
+        algorithms = list(results.keys())
+        
+        # Dos diagramas por fila
+        plt = pyplot()
+        rows = max((len(algorithms) + 1) // 2, 1)
+        fig, axes = plt.subplots(rows, 2, figsize=(16, 5 * rows), squeeze=False)
+        axes = axes.flatten()
+        for ax in axes[len(algorithms):]:
+            ax.set_visible(False)
+        
+        for i, algorithm in enumerate(algorithms):
+            ax = axes[i]
+            
+            # Dibujar los tramos (una colección por color, IDLE en gris)
+            draw_gantt(ax, results[algorithm]['gantt'], decimate_above=decimate_above)
+            
+            ax.set_title(f'{algorithm}', fontsize=12, fontweight='bold')
+            ax.set_xlabel('Tiempo (unidades)')
+            ax.set_yticks([])
+            ax.grid(axis='x', linestyle='--', alpha=0.7)
+        
+        plt.tight_layout()
+        fig.suptitle('Diagramas de Gantt - Comparación de Algoritmos', 
+                    fontsize=16, fontweight='bold', y=1.02)
+        
+        return fig
+
+def _run_algorithm(method, quantum, aging_rate, workload=None):
+    """
+    Trabajador de compare_algorithms: simula un algoritmo en un planificador propio
+    
+    Args:
+        method (str): Método simulate_* a ejecutar
+        quantum (int): Quantum para Round Robin
+        aging_rate (float): Tasa de envejecimiento de simulate_priority_aging
+        workload (dict): Columnas de SHARED_COLUMNS; por defecto, la carga
+                         adjuntada desde memoria compartida
+    
+    Returns:
+        dict: Resultado del método, con los slots como process_id
+    """
+    workload = shared_workload() if workload is None else workload
+    planner = PlanificadorCompleto(quantum, aging_rate=aging_rate)
+    # La carga ya está ordenada: con los slots como IDs el orden no cambia
+    planner.load_processes({'process_id': np.arange(len(workload['arrival_time'])), **workload})
+    with contextlib.redirect_stdout(io.StringIO()):
+        return getattr(planner, method)()
+
+
+def get_user_processes():
+    """Permite al usuario ingresar procesos manualmente"""
+    processes_data = []
+    
+    try:
+        num_processes = int(input("Ingrese el número de procesos: "))
+        
+        for i in range(num_processes):
+            print(f"\n--- Proceso {i+1} ---")
+            process_id = input(f"ID del proceso (por defecto P{i+1}): ") or f"P{i+1}"
+            arrival_time = int(input("Tiempo de llegada: "))
+            burst_time = int(input("Tiempo de ejecución (burst time): "))
+            priority = int(input("Prioridad (menor número = mayor prioridad): "))
+            
+            processes_data.append({
+                'process_id': process_id,
+                'arrival_time': arrival_time,
+                'burst_time': burst_time,
+                'priority': priority
+            })
+        
+        return pd.DataFrame(processes_data)
+    
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
+def generate_example_processes():
+    """Genera procesos de ejemplo"""
+    processes_data = [
+        {'process_id': 'P1', 'arrival_time': 0, 'burst_time': 10, 'priority': 3},
+        {'process_id': 'P2', 'arrival_time': 1, 'burst_time': 4, 'priority': 1},
+        {'process_id': 'P3', 'arrival_time': 3, 'burst_time': 6, 'priority': 2},
+        {'process_id': 'P4', 'arrival_time': 4, 'burst_time': 2, 'priority': 4},
+        {'process_id': 'P5', 'arrival_time': 6, 'burst_time': 8, 'priority': 2}
+    ]
+    
+    return pd.DataFrame(processes_data)
+
+# Programa principal
+if __name__ == "__main__":
+    # Directorio de salida: argumento, SIMULADOR_SALIDA o el del script
+    output_dir = output_directory(__file__)
+    
+    try:
+        print("=" * 80)
+        print("        SIMULADOR COMPLETO DE ALGORITMOS DE PLANIFICACIÓN")
+        print("=" * 80)
+        print("Algoritmos incluidos:")
+        print("1. FIFO (First In, First Out)")
+        print("2. SJF (Shortest Job First)")
+        print("3. Round Robin")
+        print("4. Prioridades")
+        print("5. SRTF (Shortest Remaining Time First)")
+        print("6. Prioridades con envejecimiento")
+        print("=" * 80)
+        
+        # Obtener procesos
+        choice = input("\n¿Desea ingresar procesos manualmente? (s/n): ").lower()
+        
+        if choice.startswith('s'):
+            processes_df = get_user_processes()
+            if processes_df is None or processes_df.empty:
+                print("Usando procesos de ejemplo...")
+                processes_df = generate_example_processes()
+        else:
+            processes_df = generate_example_processes()
+        
+        print("\nProcesos a simular:")
+        print(processes_df.to_string(index=False))
+        
+        # Configurar quantum para Round Robin
+        quantum = int(input(f"\nQuantum para Round Robin (por defecto 3): ") or 3)
+        aging_rate = float(input(f"Tasa de envejecimiento de prioridades (por defecto {DEFAULT_AGING_RATE}): ")
+                           or DEFAULT_AGING_RATE)
+        
+        # Crear planificador
+        planificador = PlanificadorCompleto(quantum=quantum, aging_rate=aging_rate)
+        
+        # Agregar procesos
+        planificador.load_processes(processes_df)
+        
+        # Ejecutar comparación
+        print("\n🚀 Iniciando simulación de todos los algoritmos...")
+        results = planificador.compare_algorithms()
+        
+        # Mostrar tabla comparativa
+        print("\n" + "="*80)
+        print("                    TABLA COMPARATIVA FINAL")
+        print("="*80)
+        
+        comparison_data = []
+        for algorithm, result in results.items():
+            comparison_data.append({
+                'Algoritmo': algorithm,
+                'Tiempo Espera': f"{result['avg_waiting_time']:.2f}",
+                'Tiempo Retorno': f"{result['avg_turnaround_time']:.2f}",
+                'Tiempo Respuesta': f"{result['avg_response_time']:.2f}"
+            })
+        
+        comparison_df = pd.DataFrame(comparison_data)
+        print(comparison_df.to_string(index=False))
+        
+        # Encontrar el mejor algoritmo para cada métrica
+        best_waiting = min(results.items(), key=lambda x: x[1]['avg_waiting_time'])
+        best_turnaround = min(results.items(), key=lambda x: x[1]['avg_turnaround_time'])
+        best_response = min(results.items(), key=lambda x: x[1]['avg_response_time'])
+        
+        print(f"\n🏆 MEJORES ALGORITMOS:")
+        print(f"Menor tiempo de espera: {best_waiting[0]} ({best_waiting[1]['avg_waiting_time']:.2f})")
+        print(f"Menor tiempo de retorno: {best_turnaround[0]} ({best_turnaround[1]['avg_turnaround_time']:.2f})")
+        print(f"Menor tiempo de respuesta: {best_response[0]} ({best_response[1]['avg_response_time']:.2f})")
+        
+        # Generar gráficos
+        print("\n📊 Generando gráficos comparativos...")
+        
+        # Gráfico de comparación de métricas
+        comparison_fig = planificador.generate_comparison_chart(results)
+        comparison_fig.savefig(os.path.join(output_dir, "comparacion_algoritmos.png"),
+                              dpi=300, bbox_inches='tight')
+        print("✅ Gráfico de comparación guardado: comparacion_algoritmos.png")
+        
+        # Diagramas de Gantt
+        gantt_fig = planificador.generate_gantt_charts(results)
+        gantt_fig.savefig(os.path.join(output_dir, "gantt_comparacion.png"),
+                         dpi=300, bbox_inches='tight')
+        print("✅ Diagramas de Gantt guardados: gantt_comparacion.png")
+        
+        # Guardar resultados detallados
+        with open(os.path.join(output_dir, "resultados_comparacion.txt"), "w", encoding='utf-8') as f:
+            f.write("COMPARACIÓN DE ALGORITMOS DE PLANIFICACIÓN\n")
+            f.write("="*50 + "\n\n")
+            
+            f.write("PROCESOS SIMULADOS:\n")
+            f.write(processes_df.to_string(index=False) + "\n\n")
+            
+            f.write(f"QUANTUM ROUND ROBIN: {quantum}\n")
+            f.write(f"TASA DE ENVEJECIMIENTO: {aging_rate}\n\n")
+            
+            for algorithm, result in results.items():
+                f.write(f"--- {algorithm.upper()} ---\n")
+                f.write(f"Tiempo promedio de espera: {result['avg_waiting_time']:.2f}\n")
+                f.write(f"Tiempo promedio de retorno: {result['avg_turnaround_time']:.2f}\n")
+                f.write(f"Tiempo promedio de respuesta: {result['avg_response_time']:.2f}\n")
+                
+                f.write("\nSecuencia de ejecución:\n")
+                f.writelines(f"{proc}: {start} -> {end}\n"
+                             for proc, start, end in result['execution_sequence'])
+                f.write("\n")
+            
+            f.write("MEJORES ALGORITMOS:\n")
+            f.write(f"Menor tiempo de espera: {best_waiting[0]}\n")
+            f.write(f"Menor tiempo de retorno: {best_turnaround[0]}\n")
+            f.write(f"Menor tiempo de respuesta: {best_response[0]}\n")
+        
+        print("✅ Resultados detallados guardados: resultados_comparacion.txt")
+        
+        # Guardar cada ejecución en formato columnar (se recarga con almacen.load_run)
+        for algorithm, result in results.items():
+            run_name = "ejecucion_" + algorithm.lower().replace(" ", "_")
+            save_run(os.path.join(output_dir, run_name), result['processes'],
+                     result['gantt'], {'algorithm': algorithm, 'quantum': quantum})
+        print("✅ Ejecuciones guardadas en formato columnar: ejecucion_<algoritmo>/")
+        
+        # Mostrar gráficos
+        pyplot().show()
+        
+        print("\n🎉 ¡Simulación completada exitosamente!")
+        print(f"Archivos generados en {output_dir}:")
+        print("- comparacion_algoritmos.png")
+        print("- gantt_comparacion.png") 
+        print("- resultados_comparacion.txt")
+        print("- ejecucion_<algoritmo>/ (formato columnar)")
+        
+    except Exception as e:
+        print(f"\n❌ Error durante la ejecución: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,56 @@
+"""
+Configuración común de las pruebas
+
+Agrega el directorio del simulador a sys.path y expone el módulo
+"round robin.py", cuyo nombre no se puede importar directamente.
+"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _load_round_robin():
+    spec = importlib.util.spec_from_file_location(
+        'round_robin', os.path.join(ROOT, 'round robin.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+round_robin = _load_round_robin()
+
+
+def random_workload(seed, n=60, horizon=200, max_burst=20):
+    """
+    Genera una tabla de procesos aleatoria y reproducible
+    
+    Args:
+        seed (int): Semilla del generador
+        n (int): Número de procesos
+        horizon (int): Tiempo de llegada máximo
+        max_burst (int): Ráfaga máxima (se incluyen ráfagas de 0)
+    
+    Returns:
+        DataFrame: Columnas process_id, arrival_time, burst_time y priority
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'process_id': [f'P{i}' for i in range(n)],
+        'arrival_time': np.sort(rng.integers(0, horizon, n)),
+        'burst_time': rng.integers(0, max_burst, n),
+        'priority': rng.integers(1, 5, n),
+    })
+
+
+@pytest.fixture
+def rr_module():
+    return round_robin
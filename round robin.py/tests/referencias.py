@@ -0,0 +1,183 @@
+"""
+Implementaciones de referencia para las pruebas diferenciales
+
+Reproducen, sobre listas de Python, los bucles originales de los
+simuladores (una decisión por iteración, recorriendo toda la tabla), con
+sus particularidades: en Round Robin, un proceso que no terminó puede
+quedar dos veces en la cola y la copia sobrante produce un intervalo de
+duración cero. SRTF se simula además unidad por unidad de tiempo.
+
+Todas reciben las columnas de la tabla ya ordenada por (llegada, ID) y
+devuelven los intervalos como (fila, inicio, fin), con IDLE para el tiempo
+ocioso.
+"""
+
+from motores import IDLE
+
+
+def reference_round_robin(arrival, burst, quantum):
+    """
+    Bucle original de Round Robin
+
+    Returns:
+        dict: 'slices', 'remaining', 'completion', 'first_response', 'state'
+              (finales) y 'snapshots': por cada intervalo ejecutado,
+              (tiempo, fila en ejecución, restantes, primeras respuestas,
+              estados, finalizaciones) tal como estaban al tomar la copia
+    """
+    n = len(arrival)
+    remaining = list(burst)
+    state = ['NEW'] * n
+    first = [-1] * n
+    completion = [0] * n
+    queue, slices, snapshots = [], [], []
+    time = 0
+
+    def admit():
+        for i in range(n):
+            if (arrival[i] <= time and remaining[i] > 0 and i not in queue
+                    and state[i] != 'TERMINATED'):
+                queue.append(i)
+                if state[i] == 'NEW':
+                    state[i] = 'READY'
+
+    admit()
+    while True:
+        if not queue and any(r > 0 for r in remaining):
+            next_arrival = min(arrival[i] for i in range(n)
+                               if remaining[i] > 0 and arrival[i] > time)
+            slices.append((IDLE, time, next_arrival))
+            time = next_arrival
+            admit()
+            continue
+        if not queue:
+            break
+
+        slot = queue.pop(0)
+        if first[slot] == -1:
+            first[slot] = time
+        state[slot] = 'RUNNING'
+        run = min(quantum, remaining[slot])
+        slices.append((slot, time, time + run))
+        time += run
+        remaining[slot] -= run
+        admit()
+        snapshots.append((time, slot, list(remaining), list(first), list(state),
+                          list(completion)))
+
+        if remaining[slot] == 0:
+            state[slot] = 'TERMINATED'
+            completion[slot] = time
+        else:
+            state[slot] = 'READY'
+            queue.append(slot)
+
+    return {'slices': slices, 'remaining': remaining, 'completion': completion,
+            'first_response': first, 'state': state, 'snapshots': snapshots}
+
+
+def reference_fifo(arrival, burst):
+    """Bucle original de FIFO; devuelve (intervalos, primeras respuestas, finalizaciones)"""
+    time = 0
+    slices, first, completion = [], [], []
+    for slot, (arrives, duration) in enumerate(zip(arrival, burst)):
+        if arrives > time:
+            slices.append((IDLE, time, arrives))
+            time = arrives
+        first.append(time)
+        slices.append((slot, time, time + duration))
+        time += duration
+        completion.append(time)
+    return slices, first, completion
+
+
+def reference_non_preemptive(arrival, burst, choose):
+    """
+    Bucle original de SJF y Prioridad (no expropiativos)
+
+    Args:
+        choose (callable): Recibe las filas disponibles, en orden de la
+                           tabla, y devuelve la que se ejecuta
+
+    Returns:
+        tuple: (intervalos, primeras respuestas, finalizaciones)
+    """
+    n = len(arrival)
+    time = 0
+    done = set()
+    slices = []
+    first = [-1] * n
+    completion = [0] * n
+    while len(done) < n:
+        available = [i for i in range(n) if arrival[i] <= time and i not in done]
+        if not available:
+            next_arrival = min(arrival[i] for i in range(n) if i not in done)
+            slices.append((IDLE, time, next_arrival))
+            time = next_arrival
+            continue
+        slot = choose(available)
+        first[slot] = time
+        slices.append((slot, time, time + burst[slot]))
+        time += burst[slot]
+        completion[slot] = time
+        done.add(slot)
+    return slices, first, completion
+
+
+def reference_sjf(arrival, burst):
+    """SJF: menor ráfaga; en empate, la primera fila de la tabla"""
+    return reference_non_preemptive(arrival, burst,
+                                    lambda available: min(available, key=lambda i: burst[i]))
+
+
+def reference_priority(arrival, burst, priority):
+    """Prioridad: menor número; en empate, la primera llegada y luego la primera fila"""
+    return reference_non_preemptive(
+        arrival, burst, lambda available: min(available, key=lambda i: (priority[i], arrival[i])))
+
+
+def reference_srtf(arrival, burst):
+    """
+    SRTF simulado unidad por unidad de tiempo (ráfagas positivas)
+
+    Returns:
+        tuple: (intervalos con los tramos contiguos unidos, primeras
+               respuestas, finalizaciones)
+    """
+    n = len(arrival)
+    remaining = list(burst)
+    first = [-1] * n
+    completion = [0] * n
+    slices = []
+    waiting = set()
+    running = None
+    time = cursor = done = 0
+    while done < n:
+        while cursor < n and arrival[cursor] <= time:
+            waiting.add(cursor)
+            cursor += 1
+        if running is not None and waiting:
+            best = min(waiting, key=lambda s: (remaining[s], s))
+            if remaining[best] < remaining[running]:
+                waiting.add(running)
+                running = None
+        if running is None:
+            if not waiting:
+                slices.append((IDLE, time, arrival[cursor]))
+                time = arrival[cursor]
+                continue
+            running = min(waiting, key=lambda s: (remaining[s], s))
+            waiting.discard(running)
+            if first[running] == -1:
+                first[running] = time
+        if slices and slices[-1][0] == running and slices[-1][2] == time:
+            slices[-1] = (running, slices[-1][1], time + 1)
+        else:
+            slices.append((running, time, time + 1))
+        remaining[running] -= 1
+        time += 1
+        if remaining[running] == 0:
+            completion[running] = time
+            done += 1
+            running = None
+    return slices, first, completion
@@ -0,0 +1,58 @@
+"""
+Pruebas del almacenamiento columnar: ida y vuelta de una ejecución y
+columnas que siguen mapeadas al recargar.
+"""
+
+import numpy as np
+import pytest
+
+from almacen import load_columns, load_run, save_run
+from conftest import random_workload, round_robin
+
+
+def is_mapped(values):
+    """True si el arreglo es (una vista de) un np.memmap"""
+    while values is not None:
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base
+    return False
+
+
+@pytest.fixture
+def saved_run(tmp_path):
+    simulator = round_robin.RoundRobinSimulator(3)
+    simulator.load_processes(random_workload(5, n=200))
+    simulator.run_simulation()
+    path = str(tmp_path / 'ejecucion')
+    save_run(path, simulator.processes, simulator.gantt, {'quantum': 3})
+    return path, simulator
+
+
+def test_round_trip(saved_run):
+    path, simulator = saved_run
+    run = load_run(path)
+    assert run['processes'].equals(simulator.processes)
+    assert list(run['gantt'].sequence()) == list(simulator.execution_sequence)
+    assert run['metadata'] == {'quantum': 3}
+
+
+def test_load_run_keeps_columns_mapped(saved_run):
+    path, _ = saved_run
+    run = load_run(path)
+    processes = run['processes']
+    for column in ('arrival_time', 'burst_time', 'completion_time', 'waiting_time'):
+        assert is_mapped(processes[column].to_numpy()), column
+    owners, starts, ends, counts = run['gantt'].runs()
+    assert is_mapped(starts) and is_mapped(ends)
+    
+    columns, runs, _ = load_columns(path)
+    assert all(is_mapped(runs[column]) for column in runs)
+    assert is_mapped(columns['burst_time'])
+
+
+def test_load_run_without_mmap_reads_into_memory(saved_run):
+    path, simulator = saved_run
+    processes = load_run(path, mmap_mode=None)['processes']
+    assert not is_mapped(processes['arrival_time'].to_numpy())
+    assert processes.equals(simulator.processes)
@@ -0,0 +1,101 @@
+"""
+Pruebas del barrido de quantums en paralelo y de su memoria compartida
+"""
+
+import contextlib
+import io
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import barrido
+import simulador_completo as sc
+from conftest import random_workload
+
+QUANTA = [1, 2, 3, 5, 8]
+
+
+class BrokenQuantum:
+    """Quantum que pasa la validación pero hace fallar al motor en el trabajador"""
+
+    def __le__(self, other):
+        return False
+
+    def __gt__(self, other):
+        raise RuntimeError("quantum inválido")
+
+
+@pytest.fixture
+def shared_names(monkeypatch):
+    """Nombres de los bloques de memoria compartida creados durante la prueba"""
+    names = []
+    share_arrays = barrido.share_arrays
+
+    def recording(arrays):
+        blocks, specs = share_arrays(arrays)
+        names.extend(block.name for block in blocks)
+        return blocks, specs
+
+    monkeypatch.setattr(barrido, 'share_arrays', recording)
+    return names
+
+
+def assert_released(names):
+    assert names
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_parallel_sweep_matches_sequential_and_planner(seed, shared_names):
+    workload = random_workload(seed, n=120, horizon=300)
+    sequential = barrido.sweep_quantum(workload, QUANTA, workers=1)
+    parallel = barrido.sweep_quantum(workload, QUANTA, workers=2)
+
+    assert sequential['quantum'].tolist() == QUANTA
+    assert parallel.equals(sequential)
+    assert_released(shared_names)
+
+    for row in sequential.itertuples(index=False):
+        planner = sc.PlanificadorCompleto(quantum=row.quantum)
+        planner.load_processes(workload)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = planner.simulate_round_robin()
+        assert row.avg_waiting_time == pytest.approx(result['avg_waiting_time'])
+        assert row.avg_turnaround_time == pytest.approx(result['avg_turnaround_time'])
+        assert row.avg_response_time == pytest.approx(result['avg_response_time'])
+        assert row.context_switches == result['gantt'].context_switches()
+        assert row.total_time == planner.current_time
+
+
+def test_worker_error_releases_shared_memory(shared_names):
+    workload = random_workload(1, n=30)
+    with pytest.raises(RuntimeError):
+        barrido.sweep_quantum(workload, [1, BrokenQuantum(), 2], workers=2)
+    assert_released(shared_names)
+
+
+def test_invalid_quanta_are_rejected_before_sharing(shared_names):
+    with pytest.raises(ValueError):
+        barrido.sweep_quantum(random_workload(2, n=10), [2, 0], workers=2)
+    assert shared_names == []
+
+
+def test_attached_arrays_are_read_only():
+    arrays = {'arrival_time': np.arange(5), 'burst_time': np.arange(5.0)}
+    blocks, specs = barrido.share_arrays(arrays)
+    try:
+        barrido.attach_arrays(specs)
+        attached = barrido.shared_workload()
+        for key, values in arrays.items():
+            np.testing.assert_array_equal(attached[key], values)
+            assert not attached[key].flags.writeable
+    finally:
+        # Cerrar las vistas de este proceso antes de eliminar los bloques
+        barrido._WORKLOAD.clear()
+        while barrido._BLOCKS:
+            barrido._BLOCKS.pop().close()
+        barrido.release_arrays(blocks)
+    assert_released([block.name for block in blocks])
@@ -0,0 +1,90 @@
+"""
+Pruebas de la carga masiva de procesos (load_processes) y su validación
+"""
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import simulador_completo as sc
+from conftest import random_workload, round_robin
+
+
+def planner():
+    return sc.PlanificadorCompleto(quantum=2)
+
+
+def simulator():
+    return round_robin.RoundRobinSimulator(2)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_bulk_load_matches_add_process(seed):
+    workload = random_workload(seed, n=50, horizon=20)
+    rows = list(workload.itertuples(index=False))
+
+    bulk, single = simulator(), simulator()
+    bulk.load_processes(workload)
+    for row in rows:
+        single.add_process(row.process_id, row.arrival_time, row.burst_time)
+    assert bulk.processes.equals(single.processes)
+
+    bulk, single = planner(), planner()
+    bulk.load_processes(workload)
+    for row in rows:
+        single.add_process(row.process_id, row.arrival_time, row.burst_time, row.priority)
+    assert bulk.processes.equals(single.processes)
+
+
+@pytest.mark.parametrize('factory', [simulator, planner])
+def test_loads_are_merged_in_arrival_order(factory):
+    workload = random_workload(7, n=40, horizon=10)
+    target = factory()
+    target.load_processes(workload.iloc[::2])
+    # Un diccionario de arreglos vale igual que un DataFrame
+    target.load_processes({col: workload[col].to_numpy()[1::2] for col in workload})
+
+    table = target.processes
+    expected = workload.sort_values(['arrival_time', 'process_id'])
+    assert table['process_id'].tolist() == expected['process_id'].tolist()
+    assert table['arrival_time'].tolist() == expected['arrival_time'].tolist()
+    assert table['remaining_time'].tolist() == expected['burst_time'].tolist()
+    assert (table['state'] == 'NEW').all()
+
+
+def test_priority_defaults_to_zero():
+    target = planner()
+    target.load_processes({'process_id': ['A', 'B'], 'arrival_time': [0, 1],
+                           'burst_time': [3, 4]})
+    assert target.processes['priority'].tolist() == [0, 0]
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert target.simulate_fifo()['avg_turnaround_time'] == 4.5
+
+
+@pytest.mark.parametrize('data', [
+    [('A', 0, 1)],
+    {'process_id': ['A'], 'arrival_time': [0]},
+    {'process_id': ['A', 'B'], 'arrival_time': [0], 'burst_time': [1, 2]},
+    {'process_id': ['A'], 'arrival_time': ['0'], 'burst_time': [1]},
+    {'process_id': ['A'], 'arrival_time': [True], 'burst_time': [1]},
+    {'process_id': ['A'], 'arrival_time': [np.nan], 'burst_time': [1]},
+    {'process_id': ['A'], 'arrival_time': [-1], 'burst_time': [1]},
+    {'process_id': ['A'], 'arrival_time': [0], 'burst_time': [-2]},
+    {'process_id': ['A'], 'arrival_time': [[0, 1]], 'burst_time': [1]},
+], ids=['lista', 'falta', 'longitud', 'texto', 'booleano', 'vacio',
+        'llegada_negativa', 'rafaga_negativa', 'dimension'])
+@pytest.mark.parametrize('factory', [simulator, planner])
+def test_invalid_workloads_are_rejected(factory, data):
+    target = factory()
+    with pytest.raises(ValueError):
+        target.load_processes(data)
+    assert target.processes.empty
+
+
+def test_invalid_priority_is_rejected():
+    with pytest.raises(ValueError):
+        planner().load_processes(pd.DataFrame({'process_id': ['A'], 'arrival_time': [0],
+                                               'burst_time': [1], 'priority': ['alta']}))
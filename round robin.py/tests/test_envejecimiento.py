@@ -0,0 +1,118 @@
+"""
+Pruebas del motor de prioridades con envejecimiento contra una referencia
+que avanza unidad por unidad de tiempo con aritmética exacta.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from motores import AgingPriorityEngine, PreemptiveEngine, IDLE
+
+
+def reference_aging(arrival, burst, priority, rate):
+    """
+    Simula prioridades con envejecimiento revisando la cola en cada unidad
+
+    Returns:
+        tuple: (intervalos, primera respuesta, finalización)
+    """
+    n = len(arrival)
+    rate = Fraction(str(rate))
+    remaining = list(burst)
+    waited = [0] * n
+    first = [-1] * n
+    completion = [0] * n
+    slices = []
+    waiting = set()
+    running = None
+    time = cursor = done = 0
+    
+    def best():
+        return min(waiting, key=lambda s: (priority[s] - rate * waited[s], s))
+    
+    while done < n:
+        while cursor < n and arrival[cursor] <= time:
+            waiting.add(cursor)
+            cursor += 1
+        if running is not None and waiting:
+            candidate = best()
+            if (priority[candidate] - rate * waited[candidate]
+                    < priority[running] - rate * waited[running]):
+                waiting.add(running)
+                running = None
+        if running is None:
+            if not waiting:
+                slices.append((IDLE, time, arrival[cursor]))
+                time = arrival[cursor]
+                continue
+            running = best()
+            waiting.discard(running)
+            if first[running] == -1:
+                first[running] = time
+        if slices and slices[-1][0] == running and slices[-1][2] == time:
+            slices[-1] = (running, slices[-1][1], time + 1)
+        else:
+            slices.append((running, time, time + 1))
+        for slot in waiting:
+            waited[slot] += 1
+        remaining[running] -= 1
+        time += 1
+        if remaining[running] == 0:
+            completion[running] = time
+            done += 1
+            running = None
+    return slices, first, completion
+
+
+def engine_slices(arrival, burst, priority, rate):
+    engine = AgingPriorityEngine(np.asarray(arrival), np.asarray(burst),
+                                 np.asarray(priority), rate)
+    engine.run()
+    slots, starts, ends = engine.timeline.runs()[:3]
+    slices = [(int(s), int(a), int(b)) for s, a, b in zip(slots, starts, ends)]
+    return slices, engine.first_response.tolist(), engine.completion.tolist()
+
+
+@pytest.mark.parametrize('arrival, burst, priority', [
+    ([0, 1, 3, 5, 11, 12, 15, 15], [4, 9, 9, 9, 6, 2, 2, 8], [1, 0, 1, 4, 4, 1, 3, 4]),
+    ([0, 0], [30, 30], [1, 2]),
+])
+def test_exact_ties_at_decimal_rate(arrival, burst, priority):
+    expected = reference_aging(arrival, burst, priority, 0.1)
+    got = engine_slices(arrival, burst, priority, 0.1)
+    assert got == expected
+    # Un proceso desplazado nunca continúa justo donde lo cortaron
+    slices = got[0]
+    assert all(a[0] != b[0] or a[2] != b[1] for a, b in zip(slices, slices[1:]))
+
+
+@pytest.mark.parametrize('rate', [0, 0.1, 0.125, 0.3, 0.5, 1, 2])
+def test_matches_per_tick_reference(rate):
+    rng = np.random.default_rng(int(rate * 1000))
+    for _ in range(150):
+        n = int(rng.integers(1, 14))
+        arrival = np.sort(rng.integers(0, 30, n)).tolist()
+        burst = rng.integers(1, 10, n).tolist()
+        priority = rng.integers(0, 8, n).tolist()
+        assert (engine_slices(arrival, burst, priority, rate)
+                == reference_aging(arrival, burst, priority, rate)), (arrival, burst, priority)
+
+
+def test_rejects_negative_rate():
+    with pytest.raises(ValueError):
+        AgingPriorityEngine(np.array([0]), np.array([1]), np.array([1]), -0.1)
+
+
+def test_preemptive_base_requires_key_and_preempts():
+    arrival, burst = np.array([0]), np.array([1])
+    with pytest.raises(TypeError):
+        PreemptiveEngine(arrival, burst)
+
+    class KeyOnly(PreemptiveEngine):
+        def _key(self, slot):
+            return slot
+
+    with pytest.raises(TypeError, match='_preempts'):
+        KeyOnly(arrival, burst)
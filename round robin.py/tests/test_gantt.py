@@ -0,0 +1,131 @@
+"""
+Pruebas del diagrama de Gantt por tramos (GanttRLE) y de sus vistas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gantt import GanttRLE, SliceView, IDLE
+from conftest import round_robin
+
+
+def random_slices(rng, quantum, count):
+    """Intervalos contiguos al azar, la mayoría de un quantum completo"""
+    slices = []
+    time = 0
+    for _ in range(count):
+        owner = int(rng.integers(-1, 3))
+        length = quantum if rng.random() < 0.7 else int(rng.integers(0, quantum + 1))
+        slices.append((owner, time, time + length))
+        time += length
+    return slices
+
+
+def merged(slices):
+    """Une los intervalos contiguos de un mismo dueño"""
+    result = []
+    for owner, start, end in slices:
+        if result and result[-1][0] == owner and result[-1][2] == start:
+            result[-1] = (owner, result[-1][1], end)
+        else:
+            result.append((owner, start, end))
+    return result
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_gantt_runs_expand_to_slices(seed):
+    rng = np.random.default_rng(seed)
+    quantum = int(rng.integers(1, 5))
+    slices = random_slices(rng, quantum, int(rng.integers(0, 200)))
+    gantt = GanttRLE(quantum=quantum)
+    for owner, start, end in slices:
+        gantt.append(owner, start, end)
+
+    assert gantt.n_runs <= len(slices)
+    assert gantt.n_slices == len(slices)
+    assert list(gantt.sequence()) == slices
+    assert [gantt.sequence()[i] for i in range(len(slices))] == slices
+    owners, starts, ends = gantt.expand()
+    assert list(zip(owners.tolist(), starts.tolist(), ends.tolist())) == slices
+
+    restored = GanttRLE.from_runs(*gantt.runs(), quantum=quantum)
+    assert list(restored.sequence()) == slices
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_extend_matches_append(seed):
+    rng = np.random.default_rng(seed)
+    quantum = [None, 1, 3][seed % 3]
+    slices = random_slices(rng, quantum or 2, int(rng.integers(1, 150)))
+    appended = GanttRLE(quantum=quantum)
+    for owner, start, end in slices:
+        appended.append(owner, start, end)
+
+    extended = GanttRLE(quantum=quantum)
+    cut = int(rng.integers(0, len(slices)))
+    for owner, start, end in slices[:cut]:
+        extended.append(owner, start, end)
+    extended.extend(*(np.array(column) for column in zip(*slices[cut:])))
+
+    for a, b in zip(appended.runs(), extended.runs()):
+        np.testing.assert_array_equal(a, b)
+    assert appended.n_slices == extended.n_slices
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_runs_merge_without_quantum(seed):
+    # Como en SRTF o FIFO: sin quantum, los intervalos contiguos se unen siempre
+    rng = np.random.default_rng(seed)
+    slices = random_slices(rng, int(rng.integers(1, 6)), int(rng.integers(1, 150)))
+    gantt = GanttRLE()
+    for owner, start, end in slices:
+        gantt.append(owner, start, end)
+
+    expected = merged(slices)
+    assert list(gantt.sequence()) == expected
+    assert gantt.n_runs == gantt.n_slices == len(expected)
+    assert (gantt.runs()[3] == 1).all()
+    owners, starts, ends = gantt.expand()
+    assert list(zip(owners.tolist(), starts.tolist(), ends.tolist())) == expected
+
+
+def test_slice_view_is_a_read_only_sequence():
+    gantt = GanttRLE(quantum=2, labels=np.array(['A', 'B']))
+    for owner, start, end in [(0, 0, 2), (0, 2, 3), (IDLE, 3, 5), (1, 5, 7)]:
+        gantt.append(owner, start, end)
+    sequence = gantt.sequence(include_idle=False)
+    expected = [('A', 0, 2), ('A', 2, 3), ('B', 5, 7)]
+
+    assert sequence == expected
+    assert len(sequence) == 3
+    assert sequence[-1] == ('B', 5, 7)
+    assert sequence[1:] == expected[1:]
+    assert not hasattr(sequence, 'append')
+
+    copy = sequence.copy()
+    copy.append(('C', 7, 8))
+    assert isinstance(copy, list) and sequence == expected
+    assert sequence + [('C', 7, 8)] == expected + [('C', 7, 8)]
+    assert [('C', -1, 0)] + sequence == [('C', -1, 0)] + expected
+    with pytest.raises(TypeError):
+        sequence + 'AB'
+
+    records = gantt.records()
+    assert records[2] == {'process': 'IDLE', 'start': 3, 'end': 5}
+    assert pd.DataFrame(list(records))['end'].tolist() == [2, 3, 5, 7]
+
+
+def test_results_expose_the_timeline():
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.load_processes({'process_id': ['A', 'B'], 'arrival_time': [0, 9],
+                              'burst_time': [5, 1]})
+    result = simulator.run_simulation()
+
+    assert isinstance(result['gantt'], GanttRLE)
+    assert isinstance(result['execution_sequence'], SliceView)
+    assert result['execution_sequence'].gantt is result['gantt']
+    # La copia sobrante de A en la cola deja un intervalo vacío, como siempre
+    assert list(result['execution_sequence']) == [('A', 0, 2), ('A', 2, 4), ('A', 4, 5),
+                                                  ('A', 5, 5), ('IDLE', 5, 9), ('B', 9, 10)]
+    assert result['gantt'].context_switches() == 1
@@ -0,0 +1,158 @@
+"""
+Pruebas del generador de cargas: reproducibilidad por bloques, IDs de
+proceso, validación de parámetros y trayectoria del MMPP con memoria acotada.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from generador import (MMPPArrivals, PoissonArrivals, DiurnalArrivals,
+                       ExponentialBursts, ParetoBursts, BimodalBursts,
+                       WorkloadGenerator, _uniform_times)
+
+
+def reference_mmpp_chunks(rates, switch_rates, seed, chunk_duration, n_chunks):
+    """Llegadas del MMPP generando de una vez toda la trayectoria de la cadena"""
+    generator = WorkloadGenerator(PoissonArrivals(1), ExponentialBursts(1),
+                                  chunk_duration=chunk_duration, seed=seed)
+    rates = np.asarray(rates, dtype=np.float64)
+    switch_rates = np.asarray(switch_rates, dtype=np.float64)
+    control = np.random.default_rng(generator._control)
+    switch_times = np.zeros(1)
+    horizon = n_chunks * chunk_duration
+    while switch_times[-1] <= horizon:
+        done = len(switch_times) - 1
+        states = np.arange(done, done + 1024) % len(rates)
+        holding = control.standard_exponential(1024) / switch_rates[states]
+        switch_times = np.concatenate((switch_times, switch_times[-1] + np.cumsum(holding)))
+    
+    chunks = []
+    for index in range(n_chunks):
+        rng = np.random.default_rng(generator._child(0, index))
+        start, end = index * chunk_duration, (index + 1) * chunk_duration
+        first = np.searchsorted(switch_times, start, side='right') - 1
+        last = np.searchsorted(switch_times, end, side='left')
+        segment_start = np.maximum(switch_times[first:last], start)
+        segment_end = np.minimum(switch_times[first + 1:last + 1], end)
+        states = np.arange(first, last) % len(rates)
+        chunks.append(_uniform_times(rng, segment_start, segment_end - segment_start,
+                                     rates[states]))
+    return chunks
+
+
+def mmpp_generator(seed, chunk_duration):
+    return WorkloadGenerator(MMPPArrivals([0.5, 20.0, 3.0], [2.0, 0.5, 1.0]),
+                             ExponentialBursts(4), chunk_duration=chunk_duration,
+                             seed=seed, integer=False)
+
+
+@pytest.mark.parametrize('chunk_duration', [0.5, 50, 5000])
+def test_mmpp_matches_full_path(chunk_duration):
+    generator = mmpp_generator(3, chunk_duration)
+    expected = reference_mmpp_chunks([0.5, 20.0, 3.0], [2.0, 0.5, 1.0], 3, chunk_duration, 40)
+    for index, arrivals in enumerate(expected):
+        got = generator.chunk(index)['arrival_time'].to_numpy()
+        np.testing.assert_array_equal(got, arrivals)
+
+
+def test_mmpp_memory_does_not_grow_with_horizon():
+    generator = mmpp_generator(1, 100)
+    arrivals = generator.arrivals
+    for _ in generator.iter_chunks(horizon=200_000):
+        assert len(arrivals._switch_times) <= 2 * 1024 + 1
+
+
+def test_mmpp_chunks_in_any_order():
+    sequential = [mmpp_generator(7, 100).chunk(i) for i in range(10)]
+    generator = mmpp_generator(7, 100)
+    for index in (9, 2, 5, 0, 9):
+        assert generator.chunk(index).equals(sequential[index])
+
+
+@pytest.mark.parametrize('rates, switch_rates', [
+    ([0, 0], [1, 1]),
+    ([0, 5], [1, 1]),
+    ([5, 5], [0, 1]),
+    ([5, -1], [1, 1]),
+    ([5, np.nan], [1, 1]),
+    ([], []),
+    ([5], [1, 1]),
+])
+def test_mmpp_rejects_invalid_rates(rates, switch_rates):
+    with pytest.raises(ValueError):
+        MMPPArrivals(rates, switch_rates)
+
+
+@pytest.mark.parametrize('arrivals', [
+    PoissonArrivals(2.0),
+    MMPPArrivals([0.5, 20.0], [1.0, 0.2]),
+    DiurnalArrivals(2.0, amplitude=0.8, period=100),
+])
+def test_generate_is_reproducible(arrivals):
+    first = WorkloadGenerator(arrivals, ExponentialBursts(3), chunk_duration=25, seed=11)
+    workload = first.generate(n_processes=500)
+    assert len(workload) == 500
+    assert workload['arrival_time'].is_monotonic_increasing
+    assert (workload['burst_time'] >= 1).all()
+    
+    second = WorkloadGenerator(arrivals, ExponentialBursts(3), chunk_duration=25, seed=11)
+    pd.testing.assert_frame_equal(second.generate(n_processes=500), workload)
+
+
+def test_ids_do_not_depend_on_generation_order():
+    generator = WorkloadGenerator(PoissonArrivals(0.5), ExponentialBursts(3),
+                                  chunk_duration=20, seed=5)
+    workload = generator.generate(horizon=200)
+    assert workload['process_id'].is_unique
+
+    # Los bloques generados por separado y en otro orden se unen sin renumerar
+    other = WorkloadGenerator(PoissonArrivals(0.5), ExponentialBursts(3),
+                              chunk_duration=20, seed=5)
+    blocks = {index: other.chunk(index) for index in reversed(range(10))}
+    joined = pd.concat([blocks[index] for index in range(10)], ignore_index=True)
+    pd.testing.assert_frame_equal(joined, workload)
+    assert workload['process_id'].iloc[0].startswith('P0-')
+
+
+@pytest.mark.parametrize('build', [
+    lambda: PoissonArrivals(0),
+    lambda: PoissonArrivals(np.inf),
+    lambda: DiurnalArrivals(1.0, period=0),
+    lambda: DiurnalArrivals(1.0, period=-10),
+    lambda: DiurnalArrivals(1.0, period=np.nan),
+    lambda: DiurnalArrivals(1.0, amplitude=1.5),
+    lambda: ExponentialBursts(0),
+    lambda: ExponentialBursts(-2),
+    lambda: ExponentialBursts(np.inf),
+    lambda: ParetoBursts(0),
+    lambda: ParetoBursts(1.5, scale=0),
+    lambda: ParetoBursts(np.nan),
+    lambda: BimodalBursts(0, 10),
+    lambda: BimodalBursts(2, -10),
+    lambda: BimodalBursts(2, np.inf),
+    lambda: BimodalBursts(2, 10, long_fraction=0),
+    lambda: BimodalBursts(2, 10, long_fraction=1.2),
+    lambda: BimodalBursts(2, 10, spread=0),
+    lambda: BimodalBursts(2, 10, spread=np.nan),
+    lambda: WorkloadGenerator(PoissonArrivals(1), ExponentialBursts(1), priority_levels=0),
+    lambda: WorkloadGenerator(PoissonArrivals(1), ExponentialBursts(1), chunk_duration=0),
+    lambda: WorkloadGenerator(PoissonArrivals(1), ExponentialBursts(1), chunk_duration=np.inf),
+])
+def test_invalid_parameters_are_rejected(build):
+    with pytest.raises(ValueError):
+        build()
+
+
+@pytest.mark.parametrize('bursts', [
+    ExponentialBursts(2.5),
+    ParetoBursts(1.5, scale=2),
+    BimodalBursts(2, 40, long_fraction=0.3),
+])
+def test_bursts_are_positive_integers(bursts):
+    generator = WorkloadGenerator(PoissonArrivals(1), bursts, priority_levels=1,
+                                  chunk_duration=50, seed=2)
+    workload = generator.generate(n_processes=300)
+    assert workload['burst_time'].dtype == np.int64
+    assert (workload['burst_time'] >= 1).all()
+    assert (workload['priority'] == 1).all()
@@ -0,0 +1,103 @@
+"""
+Pruebas del dibujo de diagramas de Gantt con colecciones (backend Agg)
+"""
+
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip('matplotlib')
+matplotlib.use('Agg')
+
+from matplotlib.colors import to_rgba
+
+from gantt import GanttRLE, IDLE
+from graficos import DECIMATE_ABOVE, IDLE_COLOR, _decimate, draw_gantt, pyplot
+
+
+@pytest.fixture
+def ax():
+    plt = pyplot()
+    figure, axes = plt.subplots(figsize=(8, 2), dpi=100)
+    yield axes
+    plt.close(figure)
+
+
+def test_small_chart_uses_one_collection_per_color(ax):
+    runs = [(0, 0, 4), (1, 4, 6), (IDLE, 6, 9), (0, 9, 10), (2, 10, 10), (1, 10, 15)]
+    gantt = GanttRLE(labels=np.array(['A', 'B', 'C']))
+    for owner, start, end in runs:
+        gantt.append(owner, start, end)
+
+    collections = draw_gantt(ax, gantt)
+
+    # A, B e IDLE; C solo tiene un intervalo vacío y no se dibuja
+    assert len(collections) == 3
+    assert list(ax.collections) == collections
+    paths = {to_rgba(c.get_facecolor()[0], 1): c.get_paths() for c in collections}
+    assert [len(p) for p in paths.values()] == [2, 2, 1]
+    assert len(paths[to_rgba(IDLE_COLOR)]) == 1
+    for collection in collections:
+        for path in collection.get_paths():
+            # Cuatro esquinas más el cierre del polígono
+            assert len(path.vertices) == 5
+    xs = sorted(tuple(np.unique(path.vertices[:, 0])) for c in collections for path in c.get_paths())
+    assert xs == [(0, 4), (4, 6), (6, 9), (9, 10), (10, 15)]
+    assert ax.get_xlim() == (0, 15)
+
+
+def test_large_chart_is_decimated_per_pixel(ax):
+    n = 4 * DECIMATE_ABOVE
+    owners = np.random.default_rng(0).integers(0, 3, n)
+    starts = np.arange(n)
+    gantt = GanttRLE.from_runs(owners, starts, starts + 1, np.ones(n, dtype=np.int64),
+                               labels=np.array(['A', 'B', 'C']))
+
+    collections = draw_gantt(ax, gantt)
+
+    n_pixels = int(ax.bbox.width)
+    bars = [path for c in collections for path in c.get_paths()]
+    assert len(collections) == 3
+    assert n_pixels // 2 <= len(bars) <= n_pixels
+    edges = np.linspace(0, n, n_pixels + 1)
+    for path in bars:
+        left, right = path.vertices[:, 0].min(), path.vertices[:, 0].max()
+        assert np.isclose(edges, left).any() and np.isclose(edges, right).any()
+    # Sin bordes ni etiquetas ilegibles
+    assert all(len(c.get_edgecolor()) == 0 for c in collections)
+    assert not ax.texts
+
+
+def test_decimation_limit_can_be_disabled(ax):
+    n = DECIMATE_ABOVE + 10
+    starts = np.arange(n)
+    gantt = GanttRLE.from_runs(np.arange(n) % 2, starts, starts + 1, np.ones(n, dtype=np.int64))
+    collections = draw_gantt(ax, gantt, decimate_above=None)
+    assert sum(len(c.get_paths()) for c in collections) == n
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_decimate_keeps_the_owner_of_each_pixel_center(seed):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, 20, 500)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    # Huecos sin dueño entre algunos tramos
+    ends = ends - (rng.random(500) < 0.2)
+    owners = rng.integers(-1, 4, 500)
+    n_pixels = int(rng.integers(10, 300))
+
+    kept, left, right = _decimate(owners, starts, ends, 0, ends[-1], n_pixels)
+
+    edges = np.linspace(0, ends[-1], n_pixels + 1)
+    expected = []
+    for x in (edges[:-1] + edges[1:]) / 2:
+        hit = np.flatnonzero((starts <= x) & (x < ends))
+        expected.append(owners[hit[0]] if len(hit) else None)
+    got = [None] * n_pixels
+    for owner, a, b in zip(kept, left, right):
+        columns = np.flatnonzero((edges[:-1] >= a - 1e-9) & (edges[1:] <= b + 1e-9))
+        for column in columns:
+            got[column] = owner
+    assert got == expected
+    assert len(kept) <= n_pixels
+    assert (kept[1:] != kept[:-1])[right[:-1] == left[1:]].all()
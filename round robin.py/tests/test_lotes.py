@@ -0,0 +1,70 @@
+"""
+Pruebas de la simulación por lotes (Monte Carlo) contra PlanificadorCompleto
+"""
+
+import contextlib
+import io
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import simulador_completo as sc
+from lotes import FIELDS, confidence_interval, simulate_batch, stack_workloads
+
+
+def simulate(workload, quantum, method):
+    planner = sc.PlanificadorCompleto(quantum=quantum)
+    planner.load_processes(workload)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return getattr(planner, method)()
+
+
+@pytest.mark.parametrize('quantum', [1, 3])
+def test_batch_matches_planner(quantum):
+    rng = np.random.default_rng(quantum)
+    frames = []
+    for _ in range(25):
+        n = 12
+        frames.append(pd.DataFrame({
+            # IDs en el orden de las posiciones, que es como desempata lotes
+            'process_id': [f'P{i:02d}' for i in range(n)],
+            'arrival_time': rng.integers(0, 30, n),
+            'burst_time': rng.integers(0, 10, n),
+            'priority': rng.integers(1, 4, n),
+        }))
+    batch = simulate_batch(stack_workloads(frames), quantum=quantum)
+
+    methods = {'FIFO': 'simulate_fifo', 'SJF': 'simulate_sjf',
+               'Round Robin': 'simulate_round_robin', 'Prioridad': 'simulate_priority'}
+    for name, method in methods.items():
+        for index, frame in enumerate(frames):
+            result = simulate(frame, quantum, method)
+            for metric in ('avg_waiting_time', 'avg_turnaround_time', 'avg_response_time'):
+                assert batch[name][metric][index] == pytest.approx(result[metric]), \
+                    (name, index, metric)
+        mean, low, high = batch[name]['intervals']['avg_waiting_time']
+        assert low <= mean <= high
+
+
+def test_confidence_interval():
+    values = np.array([1.0, 2.0, 4.0, 7.0])
+    mean, low, high = confidence_interval(values, 0.9)
+    half_width = NormalDist().inv_cdf(0.95) * np.std(values, ddof=1) / 2
+    assert mean == 3.5
+    assert (low, high) == pytest.approx((3.5 - half_width, 3.5 + half_width))
+    mean, low, high = confidence_interval(np.array([5.0]))
+    assert mean == 5.0 and np.isnan(low) and np.isnan(high)
+
+
+@pytest.mark.parametrize('workloads, quantum', [
+    (np.zeros((2, 3)), 2),
+    (np.zeros((2, 3, len(FIELDS) + 1)), 2),
+    (np.full((1, 2, len(FIELDS)), np.nan), 2),
+    (np.full((1, 2, len(FIELDS)), -1.0), 2),
+    (np.ones((1, 2, len(FIELDS))), 0),
+], ids=['forma', 'campos', 'vacio', 'negativo', 'quantum'])
+def test_invalid_batches_are_rejected(workloads, quantum):
+    with pytest.raises(ValueError):
+        simulate_batch(workloads, quantum=quantum)
@@ -0,0 +1,143 @@
+"""
+Pruebas de precisión y memoria de las métricas en línea (Welford/Chan y
+resumen de cuantiles) contra NumPy
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from metricas import QUANTILES, SUMMARIZE_ABOVE, OnlineMetrics, OnlineStats, QuantileSketch
+
+# Error de rango admitido para cada cuantil: la estimación debe caer entre
+# los percentiles q - eps y q + eps de los datos (más un valor de margen,
+# que importa en las muestras pequeñas)
+RANK_TOLERANCE = {'p50': 0.01, 'p95': 0.005, 'p99': 0.002, 'p99.9': 0.0005}
+
+DISTRIBUTIONS = {
+    'uniforme': lambda rng, n: rng.random(n) * 100,
+    'exponencial': lambda rng, n: rng.exponential(5, n),
+    'lognormal': lambda rng, n: rng.lognormal(1, 1.5, n),
+    'pareto': lambda rng, n: rng.pareto(1.1, n),
+}
+
+
+def assert_matches_numpy(stats, data):
+    summary = stats.summary()
+    assert summary['count'] == len(data)
+    assert summary['mean'] == pytest.approx(np.mean(data), rel=1e-9)
+    assert summary['min'] == data.min() and summary['max'] == data.max()
+    if len(data) > 1:
+        assert stats.variance == pytest.approx(np.var(data, ddof=1), rel=1e-9)
+        assert summary['std'] == pytest.approx(np.std(data, ddof=1), rel=1e-9)
+    for name, q in QUANTILES.items():
+        eps = RANK_TOLERANCE[name] + 1 / len(data)
+        low, high = np.percentile(data, [100 * max(q - eps, 0), 100 * min(q + eps, 1)])
+        assert low <= summary[name] <= high, (name, summary[name], np.percentile(data, 100 * q))
+
+
+@pytest.mark.parametrize('n', [1, 2, 37, 600, 5000])
+@pytest.mark.parametrize('distribution', DISTRIBUTIONS)
+def test_small_streams_one_value_at_a_time(distribution, n):
+    data = DISTRIBUTIONS[distribution](np.random.default_rng(n), n)
+    stats = OnlineStats()
+    for value in data:
+        stats.add(value)
+    assert_matches_numpy(stats, data)
+
+
+@pytest.mark.parametrize('n', [1, 2, 10, 37])
+def test_tiny_streams_are_exact(n):
+    # Cada valor es su propio centroide: la interpolación entre centros
+    # coincide con el método 'hazen' de NumPy
+    data = np.random.default_rng(n).lognormal(1, 1.5, n)
+    stats = OnlineStats()
+    stats.add_many(data)
+    q = list(QUANTILES.values())
+    np.testing.assert_allclose(stats.quantile(q), np.percentile(data, np.multiply(q, 100),
+                                                                method='hazen'))
+
+
+@pytest.mark.parametrize('distribution', DISTRIBUTIONS)
+def test_large_batches_use_rank_grouping(distribution):
+    n = 3 * SUMMARIZE_ABOVE // 2
+    data = DISTRIBUTIONS[distribution](np.random.default_rng(1), n)
+    stats = OnlineStats()
+    stats.add_many(data[:1000])
+    stats.add_many(data[1000:])
+    assert_matches_numpy(stats, data)
+
+
+@pytest.mark.parametrize('distribution', DISTRIBUTIONS)
+def test_merged_accumulators_match_single_pass(distribution):
+    rng = np.random.default_rng(2)
+    data = DISTRIBUTIONS[distribution](rng, 250_000)
+    cuts = np.sort(rng.choice(len(data), 7, replace=False))
+    parts = []
+    for chunk in np.split(data, cuts) + [data[:0]]:
+        part = OnlineStats()
+        if len(chunk) < 1000:
+            for value in chunk:
+                part.add(value)
+        else:
+            part.add_many(chunk)
+        parts.append(part)
+
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert_matches_numpy(merged, data)
+
+
+def test_heavy_tail_extremes_are_exact():
+    # Con cola pesada, p99.9 depende de muy pocos valores: el máximo
+    # y el mínimo exactos anclan la interpolación en los extremos
+    data = np.random.default_rng(3).pareto(0.8, 20_000)
+    stats = OnlineStats()
+    stats.add_many(data)
+    assert stats.quantile(0) == data.min()
+    assert stats.quantile(1) == data.max()
+    assert_matches_numpy(stats, data)
+
+
+@pytest.mark.parametrize('compression', [50, 200])
+def test_centroids_stay_bounded(compression):
+    rng = np.random.default_rng(4)
+    stats = OnlineStats(compression)
+    largest = 0
+    for _ in range(400):
+        for value in rng.exponential(10, 2500):
+            stats.add(value)
+        largest = max(largest, len(stats.sketch.means))
+    stats.add_many(rng.exponential(10, 2 * SUMMARIZE_ABOVE))
+
+    assert stats.count == 400 * 2500 + 2 * SUMMARIZE_ABOVE
+    assert max(largest, len(stats.sketch.means)) <= compression
+    assert len(stats._buffer) == 0
+
+
+def test_online_metrics_records_and_merges():
+    rng = np.random.default_rng(5)
+    waiting, turnaround, response = (rng.exponential(scale, 3000) for scale in (4, 9, 2))
+    first, second = OnlineMetrics(), OnlineMetrics()
+    for values in zip(waiting[:1000], turnaround[:1000], response[:1000]):
+        first.record(*values)
+    assert first.count == 1000
+    second.record_many(waiting[1000:], turnaround[1000:], response[1000:])
+    first.merge(second)
+
+    summary = first.summary()
+    for metric, data in zip(('waiting_time', 'turnaround_time', 'response_time'),
+                            (waiting, turnaround, response)):
+        assert_matches_numpy(first[metric], data)
+        assert summary[metric] == first[metric].summary()
+
+
+def test_empty_summaries():
+    summary = OnlineStats().summary()
+    assert summary['count'] == 0
+    assert all(math.isnan(summary[key]) for key in summary if key != 'count')
+    assert math.isnan(QuantileSketch().quantile(0.5))
+    with pytest.raises(ValueError):
+        QuantileSketch(0)
@@ -0,0 +1,149 @@
+"""
+Pruebas de la visualización incremental en la terminal (StepRenderer)
+"""
+
+import builtins
+import contextlib
+import io
+import re
+
+import numpy as np
+import pytest
+
+import pantalla
+from motores import RoundRobinEngine, IDLE
+from pantalla import (CLEAR_BELOW, CLEAR_LINE, CLEAR_SCREEN, HIDE_CURSOR, SHOW_CURSOR,
+                      StepRenderer)
+from conftest import random_workload, round_robin
+
+ESCAPE = re.compile(r'(\x1b\[[0-9;?]*[A-Za-z])')
+
+
+def screen(output):
+    """Líneas visibles después de aplicar las secuencias ANSI de 'output'"""
+    rows = {}
+    row = column = 0
+    for token in ESCAPE.split(output):
+        if not token:
+            continue
+        move = re.fullmatch(r'\x1b\[(\d+);1H', token)
+        if move:
+            row, column = int(move.group(1)) - 1, 0
+        elif token == CLEAR_SCREEN:
+            rows.clear()
+        elif token == CLEAR_LINE:
+            rows[row] = rows.get(row, '')[:column]
+        elif token == CLEAR_BELOW:
+            rows = {r: line for r, line in rows.items() if r < row}
+        elif not token.startswith('\x1b['):
+            line = rows.get(row, '')
+            rows[row] = line[:column] + token + line[column + len(token):]
+            column += len(token)
+    return [rows.get(r, '') for r in range(max(rows, default=-1) + 1)]
+
+
+def steps(engine):
+    """Pasos con proceso del motor: (slot, tiempo ejecutado)"""
+    for slot, start, end in iter(engine.step, None):
+        if slot != IDLE:
+            yield slot, end - start
+
+
+def make_engine(seed, n=12):
+    workload = random_workload(seed, n=n, horizon=20, max_burst=9)
+    workload = workload.sort_values(['arrival_time', 'process_id']).reset_index(drop=True)
+    engine = RoundRobinEngine(workload['arrival_time'].to_numpy(),
+                              workload['burst_time'].to_numpy(), 2, batch_rounds=False)
+    return workload, engine
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_only_changed_rows_are_rewritten(seed):
+    workload, engine = make_engine(seed)
+    stream = io.StringIO()
+    renderer = StepRenderer(workload['process_id'], workload['arrival_time'],
+                            workload['burst_time'], max_fps=None, max_rows=50, stream=stream)
+
+    previous = []
+    for slot, time_slice in steps(engine):
+        start = stream.tell()
+        assert renderer.render(engine, slot, time_slice)
+        written = stream.getvalue()[start:]
+        lines = renderer._lines
+
+        # La pantalla muestra el cuadro completo, pero solo se escribieron
+        # las filas distintas de las del cuadro anterior
+        assert screen(stream.getvalue()) == lines
+        changed = sum(row >= len(previous) or previous[row] != line
+                      for row, line in enumerate(lines))
+        assert written.count(CLEAR_LINE) == changed
+        assert (CLEAR_SCREEN in written) == (not previous)
+        assert lines[1] == f"Tiempo actual: {engine.current_time}"
+        assert lines[6].startswith(str(workload['process_id'][slot]))
+        previous = lines
+
+    renderer.close()
+    assert stream.getvalue().startswith(HIDE_CURSOR + CLEAR_SCREEN)
+    assert stream.getvalue().endswith(SHOW_CURSOR)
+
+
+def test_table_is_windowed_with_a_footer():
+    n = 8
+    ids = [f'P{i}' for i in range(n)]
+    engine = RoundRobinEngine(np.zeros(n, dtype=np.int64), np.full(n, 5), 2, batch_rounds=False)
+    stream = io.StringIO()
+    renderer = StepRenderer(ids, engine.arrival, engine.burst, max_fps=None, max_rows=3,
+                            stream=stream)
+    slot, time_slice = next(steps(engine))
+    renderer.render(engine, slot, time_slice)
+
+    lines = screen(stream.getvalue())
+    table = lines[6:-2]
+    assert [line.split()[0] for line in table] == ['P0', 'P1', 'P2']
+    assert table[0].split()[3:] == ['3', '40.0', 'READY']
+    assert lines[-2] == ''
+    assert lines[-1] == f"Listos: {n} ({n - 3} sin mostrar) | Terminados: 0/{n}"
+
+
+def test_throttled_steps_are_skipped_and_last_is_drawn(monkeypatch):
+    clock = iter([0.0, 0.02, 0.05, 0.08, 0.3, 0.31, 0.32])
+    monkeypatch.setattr(pantalla.time, 'monotonic', lambda: next(clock))
+    workload, engine = make_engine(3, n=4)
+    stream = io.StringIO()
+    renderer = StepRenderer(workload['process_id'], workload['arrival_time'],
+                            workload['burst_time'], max_fps=10, stream=stream)
+
+    drawn = []
+    for slot, time_slice in list(steps(engine))[:6]:
+        drawn.append(renderer.render(engine, slot, time_slice))
+        if drawn[-1]:
+            frame = list(renderer._lines)
+    assert drawn == [True, False, False, False, True, False]
+    assert screen(stream.getvalue()) == frame
+
+    # El paso omitido al final se dibuja al cerrar
+    renderer.close()
+    assert renderer._lines != frame
+    assert screen(stream.getvalue()) == renderer._lines
+    assert renderer._lines[1] == f"Tiempo actual: {engine.current_time}"
+    assert stream.getvalue().endswith(SHOW_CURSOR)
+
+
+def test_interrupted_run_restores_the_cursor(monkeypatch):
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.load_processes(random_workload(1, n=10, horizon=10, max_burst=8))
+    prompts = []
+
+    def interrupt(prompt=''):
+        prompts.append(prompt)
+        if len(prompts) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(builtins, 'input', interrupt)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), pytest.raises(KeyboardInterrupt):
+        simulator.run_simulation(visualize=True, step_by_step=True)
+
+    assert len(prompts) == 3
+    assert output.getvalue().endswith(SHOW_CURSOR)
+    assert simulator._renderer is None
@@ -0,0 +1,115 @@
+"""
+Pruebas de run_until / continue_simulation con procesos inyectados o
+agregados en pausa, o después de terminar una simulación.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import random_workload, round_robin
+
+
+def simulate(processes, quantum=2):
+    simulator = round_robin.RoundRobinSimulator(quantum)
+    simulator.load_processes(processes)
+    return simulator.run_simulation()
+
+
+def assert_same_result(actual, expected):
+    assert list(actual['execution_sequence']) == list(expected['execution_sequence'])
+    assert actual['processes'].equals(expected['processes'])
+    assert actual['metrics'] == expected['metrics']
+
+
+def test_add_process_while_paused():
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.add_process('A', 0, 5)
+    simulator.add_process('B', 1, 3)
+    assert simulator.run_until(3)
+    simulator.add_process('C', 10, 4)
+    result = simulator.continue_simulation()
+    
+    expected = simulate({'process_id': ['A', 'B', 'C'],
+                         'arrival_time': [0, 1, 10],
+                         'burst_time': [5, 3, 4]})
+    assert_same_result(result, expected)
+
+
+def test_load_processes_while_paused_matches_full_run():
+    workload = random_workload(7, n=40)
+    late = workload['arrival_time'] > 60
+    simulator = round_robin.RoundRobinSimulator(3)
+    simulator.load_processes(workload[~late])
+    simulator.run_until(60)
+    simulator.load_processes(workload[late])
+    simulator.run_until(120)
+    result = simulator.continue_simulation()
+    assert_same_result(result, simulate(workload, quantum=3))
+
+
+def test_add_process_after_finished_run():
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.add_process('A', 0, 5)
+    simulator.add_process('B', 1, 3)
+    simulator.run_simulation()
+    simulator.add_process('C', 10, 4)
+    assert not simulator.run_until(100)
+    result = simulator.continue_simulation()
+    
+    expected = simulate({'process_id': ['A', 'B', 'C'],
+                         'arrival_time': [0, 1, 10],
+                         'burst_time': [5, 3, 4]})
+    assert_same_result(result, expected)
+
+
+def test_paused_table_is_not_stale_after_finished_run():
+    workload = random_workload(3, n=30)
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.load_processes(workload.iloc[:-1])
+    simulator.run_simulation()
+    simulator.load_processes(workload.iloc[-1:])
+    simulator.run_until(50)
+    
+    fresh = round_robin.RoundRobinSimulator(2)
+    fresh.load_processes(workload)
+    fresh.run_until(50)
+    assert simulator.process_status[-1].equals(fresh.process_status[-1])
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_inject_matches_full_run(seed):
+    rng = np.random.default_rng(seed)
+    quantum = int(rng.integers(1, 5))
+    first = random_workload(seed, n=int(rng.integers(1, 30)), horizon=40, max_burst=12)
+    simulator = round_robin.RoundRobinSimulator(quantum)
+    simulator.load_processes(first)
+    pause = int(rng.integers(0, 60))
+    simulator.run_until(pause)
+
+    # Los que llegan después del reloj se simulan como si siempre hubieran estado
+    m = int(rng.integers(1, 20))
+    later = pd.DataFrame({'process_id': [f'B{i}' for i in range(m)],
+                          'arrival_time': simulator.current_time + 1 + rng.integers(0, 40, m),
+                          'burst_time': rng.integers(0, 12, m)})
+    simulator.inject_processes(later)
+    if rng.random() < 0.5:
+        simulator.run_until(pause + 20)
+    result = simulator.continue_simulation()
+
+    full = round_robin.RoundRobinSimulator(quantum)
+    full.load_processes(pd.concat([first.drop(columns='priority'), later]))
+    expected = full.run_simulation()
+    assert list(result['execution_sequence']) == list(expected['execution_sequence'])
+    assert result['processes'].equals(expected['processes'])
+    assert len(simulator.process_status) == len(full.process_status)
+    for step in range(0, len(full.process_status), 7):
+        assert simulator.process_status[step].equals(full.process_status[step])
+
+
+def test_inject_rejects_past_arrivals():
+    simulator = round_robin.RoundRobinSimulator(2)
+    simulator.load_processes({'process_id': ['A'], 'arrival_time': [0], 'burst_time': [10]})
+    simulator.run_until(5)
+    with pytest.raises(ValueError):
+        simulator.inject_processes({'process_id': ['B'], 'arrival_time': [1], 'burst_time': [1]})
@@ -0,0 +1,104 @@
+"""
+Pruebas de la medición por fases: desglose del resultado y restauración
+de los métodos al terminar
+"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+import simulador_completo as sc
+from motores import RoundRobinEngine
+from perfil import ENGINE_PHASES, PhaseProfiler
+from conftest import random_workload, round_robin
+
+
+def class_methods(phases):
+    """Atributos de clase de todas las fases, para comprobar que no cambian"""
+    return {(owner, name): owner.__dict__.get(name) for owner, name, _ in phases}
+
+
+def assert_unpatched(*objects):
+    for obj in objects:
+        assert not any(callable(value) and hasattr(value, '__wrapped__')
+                       for value in vars(obj).values()), type(obj).__name__
+
+
+def make_engine(seed):
+    workload = random_workload(seed, n=40, horizon=60, max_burst=9)
+    workload = workload.sort_values(['arrival_time', 'process_id']).reset_index(drop=True)
+    return RoundRobinEngine(workload['arrival_time'].to_numpy(),
+                            workload['burst_time'].to_numpy(), 3)
+
+
+def test_simulator_profile_report():
+    workload = random_workload(1, n=50)[['process_id', 'arrival_time', 'burst_time']]
+    simulator = round_robin.RoundRobinSimulator(3, profile=True)
+    simulator.load_processes(workload)
+    before = class_methods(simulator.profile_phases())
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        results = simulator.run_simulation()
+
+    report = results['profile']
+    assert report is simulator.profile_report
+    assert report['events'] == simulator.gantt.n_slices
+    assert {'despacho', 'admisión', 'gantt', 'diario', 'métricas', 'preparación',
+            'resultados', 'otros'} <= set(report['phases'])
+    assert report['phases']['despacho']['calls'] > 0
+    assert sum(row['time_ns'] for row in report['phases'].values()) == report['total_ns']
+    assert "Tiempo por fase (run_simulation)" in output.getvalue()
+
+    assert class_methods(simulator.profile_phases()) == before
+    assert_unpatched(simulator, simulator._engine, simulator.process_status,
+                     simulator.metrics, simulator.gantt)
+
+    # La medición no cambia los resultados
+    plain = round_robin.RoundRobinSimulator(3)
+    plain.load_processes(workload)
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = plain.run_simulation()
+    assert 'profile' not in expected
+    assert results['avg_waiting_time'] == expected['avg_waiting_time']
+    assert list(results['execution_sequence']) == list(expected['execution_sequence'])
+
+
+@pytest.mark.parametrize('method', ['simulate_fifo', 'simulate_sjf', 'simulate_srtf',
+                                    'simulate_round_robin', 'simulate_priority_aging'])
+def test_planner_profile_report(method):
+    planner = sc.PlanificadorCompleto(3, profile=True)
+    planner.load_processes(random_workload(2, n=50))
+    before = class_methods(planner.profile_phases())
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = getattr(planner, method)()
+
+    phases = results['profile']['phases']
+    assert {'reinicio', 'resultados', 'métricas'} <= set(phases)
+    if method != 'simulate_fifo':
+        assert phases['despacho']['calls'] > 0
+    assert class_methods(planner.profile_phases()) == before
+    assert_unpatched(planner, planner.metrics, planner.gantt)
+
+
+def test_only_instrumented_objects_are_measured():
+    measured, other = make_engine(3), make_engine(3)
+    before = class_methods(ENGINE_PHASES)
+    with PhaseProfiler(ENGINE_PHASES, [measured]) as profiler:
+        other.run()
+        assert profiler.calls['despacho'] == 0
+        measured.run()
+    assert profiler.calls['despacho'] > 0
+    assert class_methods(ENGINE_PHASES) == before
+    assert_unpatched(measured, measured.timeline)
+    np.testing.assert_array_equal(measured.completion, other.completion)
+
+
+def test_partial_instrumentation_is_undone():
+    engine = make_engine(4)
+    phases = ENGINE_PHASES + ((RoundRobinEngine, 'missing', 'falla'),)
+    with pytest.raises(AttributeError):
+        with PhaseProfiler(phases, [engine]):
+            pass
+    assert_unpatched(engine, engine.timeline)
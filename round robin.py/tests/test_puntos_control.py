@@ -0,0 +1,85 @@
+"""
+Pruebas de puntos de control: una simulación interrumpida y reanudada debe
+dar el mismo resultado que una ejecución sin interrupciones.
+"""
+
+import contextlib
+import io
+
+import pytest
+
+import puntos_control
+import simulador_completo as sc
+from conftest import random_workload, round_robin
+
+
+class Crash(Exception):
+    pass
+
+
+def assert_same_summary(actual, expected):
+    """Los conteos deben coincidir exactamente; el resto salvo redondeo."""
+    assert actual.keys() == expected.keys()
+    for name, stats in expected.items():
+        assert actual[name]['count'] == stats['count'], name
+        assert actual[name] == pytest.approx(stats), name
+
+
+@pytest.fixture
+def crash_after(monkeypatch):
+    """Hace que maybe_save guarde siempre y aborte en la llamada número k."""
+    def install(k):
+        calls = {'n': 0}
+        
+        def maybe_save(self):
+            calls['n'] += 1
+            self.save()
+            if calls['n'] >= k:
+                raise Crash()
+        monkeypatch.setattr(puntos_control.Checkpointer, 'maybe_save', maybe_save)
+        return lambda: monkeypatch.undo()
+    return install
+
+
+@pytest.mark.parametrize('kill_at', [3, 25, 60])
+@pytest.mark.parametrize('quantum', [1, 3])
+def test_resume_round_robin_simulator(tmp_path, crash_after, kill_at, quantum):
+    workload = random_workload(kill_at, n=36)
+    reference = round_robin.RoundRobinSimulator(quantum)
+    reference.load_processes(workload)
+    expected = reference.run_simulation()
+    
+    interrupted = round_robin.RoundRobinSimulator(quantum)
+    interrupted.load_processes(workload)
+    release = crash_after(kill_at)
+    with pytest.raises(Crash):
+        interrupted.run_simulation(checkpoint=str(tmp_path), checkpoint_interval=1e9)
+    release()
+    
+    resumed = round_robin.RoundRobinSimulator(99).resume(str(tmp_path))
+    assert list(resumed['execution_sequence']) == list(expected['execution_sequence'])
+    assert resumed['processes'].equals(expected['processes'])
+    assert_same_summary(resumed['metrics'], expected['metrics'])
+    assert resumed['metrics']['turnaround_time']['count'] == (workload['burst_time'] > 0).sum()
+
+
+@pytest.mark.parametrize('kill_at', [3, 25, 60])
+def test_resume_planificador_completo(tmp_path, crash_after, kill_at):
+    workload = random_workload(kill_at, n=36)
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference = sc.PlanificadorCompleto(quantum=2)
+        reference.load_processes(workload)
+        expected = reference.simulate_round_robin()
+        
+        interrupted = sc.PlanificadorCompleto(quantum=2)
+        interrupted.load_processes(workload)
+        release = crash_after(kill_at)
+        with pytest.raises(Crash):
+            interrupted.simulate_round_robin(checkpoint=str(tmp_path),
+                                             checkpoint_interval=1e9)
+        release()
+        resumed = sc.PlanificadorCompleto().resume(str(tmp_path))
+    
+    assert list(resumed['execution_sequence']) == list(expected['execution_sequence'])
+    assert resumed['processes'].equals(expected['processes'])
+    assert_same_summary(resumed['metrics'], expected['metrics'])
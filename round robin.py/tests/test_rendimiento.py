@@ -0,0 +1,93 @@
+"""
+Pruebas de la comparación de resultados de rendimiento: exponente de
+crecimiento, tolerancia respecto a la referencia y código de salida
+"""
+
+import json
+import math
+
+import pytest
+
+import rendimiento
+
+
+def result(size, wall_time, implementation='fifo', density='baja', quantum=2, status='ok'):
+    """Resultado sintético de un caso"""
+    case = {'implementation': implementation, 'size': size, 'density': density,
+            'quantum': quantum, 'seed': 0, 'status': status}
+    if status == 'ok':
+        case['wall_time'] = wall_time
+    return case
+
+
+def series(times, **kwargs):
+    """Resultados con exponentes de una serie de tamaños 10, 100, 1000..."""
+    results = [result(10 ** (i + 1), wall_time, **kwargs) for i, wall_time in enumerate(times)]
+    rendimiento.add_exponents(results)
+    return results
+
+
+def test_exponents_between_consecutive_sizes():
+    linear = series([0.01, 0.1, 1.0])
+    quadratic = series([0.01, 1.0, 100.0], implementation='sjf')
+    assert linear[0]['exponent'] is None
+    assert [r['exponent'] for r in linear[1:]] == pytest.approx([1, 1])
+    assert [r['exponent'] for r in quadratic[1:]] == pytest.approx([2, 2])
+
+
+def test_exponents_skip_failed_cases_and_separate_series():
+    results = [result(10, 0.01), result(100, None, status='timeout'), result(1000, 1.0),
+               result(100, 0.04, quantum=8), result(10, 0.02, density='alta')]
+    rendimiento.add_exponents(results)
+    exponents = [r['exponent'] for r in results]
+    # n=1000 se compara con n=10, el último caso terminado de su serie
+    assert exponents[2] == pytest.approx(math.log(100) / math.log(100))
+    assert exponents[:2] == [None, None]
+    assert exponents[3:] == [None, None]
+
+
+def test_time_regressions_respect_tolerance_and_noise_floor():
+    baseline = series([0.1, 1.0, 10.0])
+    current = series([0.1 * 1.2, 1.0 * 1.3, 10.0 + rendimiento.NOISE_FLOOR / 2])
+    regressions = rendimiento.compare(current, baseline, tolerance=0.25)
+    assert [r['size'] for r in regressions] == [100]
+    assert [r['flags'] for r in current] == [[], ['tiempo'], []]
+    assert [r['baseline_wall_time'] for r in current] == [0.1, 1.0, 10.0]
+
+    # Un aumento mayor que la tolerancia pero menor que el umbral de ruido no cuenta
+    tiny = series([0.001, 0.003])
+    rendimiento.compare(tiny, series([0.001, 0.001]), tolerance=0.25)
+    assert 'tiempo' not in tiny[1]['flags']
+
+
+def test_scale_regressions_and_failed_cases():
+    baseline = series([0.01, 0.1, 1.0])
+    current = series([0.01, 0.1, 5.0])
+    current.append(result(10_000, None, status='timeout'))
+    baseline.append(result(10_000, 10.0))
+    regressions = rendimiento.compare(current, baseline, tolerance=10, exponent_tolerance=0.3)
+    assert [(r['size'], r['flags']) for r in regressions] == [(1000, ['escala']),
+                                                               (10_000, ['timeout'])]
+
+    # Los casos sin referencia válida no se comparan
+    missing = series([0.01, 10.0], implementation='srtf')
+    assert rendimiento.compare(missing, baseline) == []
+
+
+@pytest.mark.parametrize('slowdown, status', [(1.0, 0), (1.1, 0), (2.0, 1)])
+def test_exit_status_with_baseline(tmp_path, monkeypatch, capsys, slowdown, status):
+    baseline = series([0.1, 1.0])
+    path = tmp_path / 'base.json'
+    path.write_text(json.dumps({'environment': {}, 'results': baseline}))
+
+    def run_benchmarks(*args):
+        return series([0.1, 1.0 * slowdown])
+
+    monkeypatch.setattr(rendimiento, 'run_benchmarks', run_benchmarks)
+    output = tmp_path / 'resultados.json'
+    assert rendimiento.main(['--baseline', str(path), '--output', str(output)]) == status
+
+    saved = json.loads(output.read_text())
+    assert [r['size'] for r in saved['results']] == [10, 100]
+    assert ('1 regresiones' in capsys.readouterr().out) == bool(status)
+    assert rendimiento.main(['--output', str(output)]) == 0
@@ -0,0 +1,182 @@
+"""
+Pruebas diferenciales de RoundRobinSimulator contra el bucle original
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from diario import StatusJournal
+from motores import RoundRobinEngine, RoundBatch, IDLE
+from conftest import random_workload, round_robin
+from referencias import reference_round_robin
+
+SEEDS = range(40)
+
+
+def small_workload(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 14))
+    return random_workload(seed, n=n, horizon=int(rng.integers(1, 40)),
+                           max_burst=int(rng.integers(1, 15))), int(rng.integers(1, 6))
+
+
+def run(workload, quantum, **kwargs):
+    simulator = round_robin.RoundRobinSimulator(quantum)
+    simulator.load_processes(workload)
+    return simulator, simulator.run_simulation(**kwargs)
+
+
+def named(slices, process_ids):
+    return [('IDLE' if slot == IDLE else process_ids[slot], start, end)
+            for slot, start, end in slices]
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_matches_original_loop(seed):
+    workload, quantum = small_workload(seed)
+    simulator, result = run(workload, quantum)
+    table = result['processes']
+    arrival = table['arrival_time'].tolist()
+    burst = table['burst_time'].tolist()
+    expected = reference_round_robin(arrival, burst, quantum)
+
+    sequence = named(expected['slices'], table['process_id'].tolist())
+    assert list(result['execution_sequence']) == sequence
+    assert list(result['gantt_data']) == [{'process': p, 'start': s, 'end': e}
+                                          for p, s, e in sequence]
+
+    finished = [state == 'TERMINATED' for state in expected['state']]
+    turnaround = [c - a if f else 0 for c, a, f in zip(expected['completion'], arrival, finished)]
+    waiting = [t - b if f else 0 for t, b, f in zip(turnaround, burst, finished)]
+    assert table['remaining_time'].tolist() == expected['remaining']
+    assert table['completion_time'].tolist() == expected['completion']
+    assert table['first_response'].tolist() == expected['first_response']
+    assert table['state'].tolist() == expected['state']
+    assert table['turnaround_time'].tolist() == turnaround
+    assert table['waiting_time'].tolist() == waiting
+    assert result['avg_waiting_time'] == pd.Series(waiting).mean()
+    assert result['avg_turnaround_time'] == pd.Series(turnaround).mean()
+    assert result['metrics']['waiting_time']['count'] == sum(finished)
+
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_admission_with_tied_arrivals(seed):
+    # Muchas llegadas simultáneas, todas en un borde de quantum
+    rng = np.random.default_rng(seed)
+    quantum = int(rng.integers(1, 4))
+    workload = random_workload(seed, n=40, horizon=6, max_burst=8)
+    workload['arrival_time'] *= quantum
+    _, result = run(workload, quantum)
+    table = result['processes']
+    expected = reference_round_robin(table['arrival_time'].tolist(),
+                                     table['burst_time'].tolist(), quantum)
+
+    assert list(result['execution_sequence']) == named(expected['slices'],
+                                                       table['process_id'].tolist())
+    assert table['remaining_time'].tolist() == expected['remaining']
+    assert table['state'].tolist() == expected['state']
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_batch_rounds_match_single_steps(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 30))
+    arrival = np.sort(rng.integers(0, int(rng.integers(1, 400)), n))
+    burst = rng.integers(0, int(rng.integers(2, 200)), n)
+    quantum = int(rng.integers(1, 7))
+    for times in ((arrival, burst, quantum),
+                  (arrival * 0.5, burst * 0.75 + 0.25, 1.5)):
+        single = RoundRobinEngine(*times, batch_rounds=False)
+        single.run()
+        batched = RoundRobinEngine(*times)
+        batched.run()
+        for a, b in zip(single.slices(), batched.slices()):
+            np.testing.assert_array_equal(a, b)
+        for name in ('remaining', 'completion', 'first_response', 'state', 'current_time'):
+            np.testing.assert_array_equal(getattr(single, name), getattr(batched, name))
+
+
+
+def test_long_jobs_advance_in_round_blocks():
+    times = (np.array([0, 3, 3]), np.array([10**4, 10**4, 5]), 1)
+    engine = RoundRobinEngine(*times)
+    events = []
+    while (event := engine.step()) is not None:
+        events.append(event)
+    single = RoundRobinEngine(*times, batch_rounds=False)
+    single.run()
+
+    assert len(events) < 100
+    assert any(isinstance(event, RoundBatch) for event in events)
+    assert engine.completion.tolist() == single.completion.tolist()
+    for a, b in zip(engine.slices(), single.slices()):
+        np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_status_journal_matches_snapshots(seed):
+    workload, quantum = small_workload(seed)
+    simulator, result = run(workload, quantum)
+    table = result['processes']
+    expected = reference_round_robin(table['arrival_time'].tolist(),
+                                     table['burst_time'].tolist(), quantum)
+
+    journal = simulator.process_status
+    assert len(journal) == len(expected['snapshots'])
+    for step, (time, running, remaining, first, state, completion) in enumerate(expected['snapshots']):
+        frame = journal[step]
+        assert (frame['current_time'] == time).all()
+        assert frame['remaining_time'].tolist() == remaining
+        assert frame['first_response'].tolist() == first
+        # La fila en ejecución figura como RUNNING solo en el bucle original
+        others = [i for i in range(len(state)) if i != running]
+        assert frame['state'].iloc[others].tolist() == [state[i] for i in others]
+        assert frame['completion_time'].iloc[others].tolist() == [completion[i] for i in others]
+
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_journal_replays_round_blocks(seed):
+    rng = np.random.default_rng(seed)
+    workload = random_workload(seed, n=int(rng.integers(1, 8)), horizon=30, max_burst=40)
+    quantum = int(rng.integers(1, 4))
+    simulator = round_robin.RoundRobinSimulator(quantum)
+    simulator.load_processes(workload)
+    base = simulator.processes
+    arrival = base['arrival_time'].to_numpy()
+    burst = base['burst_time'].to_numpy()
+
+    journals = {}
+    for batch_rounds in (False, True):
+        journals[batch_rounds] = StatusJournal(base, burst.dtype)
+        RoundRobinEngine(arrival, burst, quantum, batch_rounds=batch_rounds,
+                         journal=journals[batch_rounds]).run()
+
+    single, batched = journals[False], journals[True]
+    assert len(batched) == len(single)
+    assert batched.nbytes <= single.nbytes
+    for step in range(len(single)):
+        assert batched[step].equals(single[step]), step
+    if len(single):
+        assert batched[-1].equals(single[len(single) - 1])
+    with pytest.raises(IndexError):
+        batched[len(single)]
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_iter_simulation_matches_run(seed):
+    workload, quantum = small_workload(seed)
+    _, expected = run(workload, quantum)
+    simulator = round_robin.RoundRobinSimulator(quantum)
+    simulator.load_processes(workload)
+    streamed = simulator.iter_simulation()
+    assert list(itertools.islice(streamed, 3)) == list(expected['execution_sequence'])[:3]
+    assert list(streamed) == list(expected['execution_sequence'])[3:]
+    assert simulator.processes.equals(expected['processes'])
+    # Sin secuencia guardada: las métricas salen del acumulador en línea
+    assert simulator._engine.timeline is None
+    assert pd.DataFrame(simulator.metrics.summary()).equals(pd.DataFrame(expected['metrics']))
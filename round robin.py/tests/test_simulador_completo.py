@@ -0,0 +1,148 @@
+"""
+Pruebas diferenciales de PlanificadorCompleto contra los bucles originales,
+SRTF contra una simulación unidad por unidad y la comparación en paralelo
+"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+import simulador_completo as sc
+from motores import IDLE
+from conftest import random_workload
+from referencias import (reference_round_robin, reference_fifo, reference_sjf,
+                         reference_priority, reference_srtf)
+
+SEEDS = range(40)
+
+
+def small_workload(seed, min_burst=0):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 14))
+    workload = random_workload(seed, n=n, horizon=int(rng.integers(1, 40)),
+                               max_burst=int(rng.integers(1, 15)))
+    workload['burst_time'] = np.maximum(workload['burst_time'], min_burst)
+    return workload, int(rng.integers(1, 6))
+
+
+def simulate(workload, quantum, method):
+    planner = sc.PlanificadorCompleto(quantum=quantum)
+    planner.load_processes(workload)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return planner, getattr(planner, method)()
+
+
+def named(slices, process_ids):
+    return [('IDLE' if slot == IDLE else process_ids[slot], start, end)
+            for slot, start, end in slices]
+
+
+def assert_schedule(result, slices, first, completion, finished=None):
+    """Compara intervalos y tabla con una referencia, fila por fila"""
+    table = result['processes']
+    arrival = table['arrival_time'].tolist()
+    burst = table['burst_time'].tolist()
+    if finished is None:
+        finished = [True] * len(arrival)
+
+    sequence = named(slices, table['process_id'].tolist())
+    assert [(r['process'], r['start'], r['end']) for r in result['gantt_data']] == sequence
+    assert list(result['execution_sequence']) == [s for s in sequence if s[0] != 'IDLE']
+
+    turnaround = [c - a if f else 0 for c, a, f in zip(completion, arrival, finished)]
+    waiting = [t - b if f else 0 for t, b, f in zip(turnaround, burst, finished)]
+    response = [s - a if s != -1 else 0 for s, a in zip(first, arrival)]
+    assert table['completion_time'].tolist() == completion
+    assert table['first_response'].tolist() == first
+    assert table['turnaround_time'].tolist() == turnaround
+    assert table['waiting_time'].tolist() == waiting
+    assert table['response_time'].tolist() == response
+    assert result['avg_waiting_time'] == pytest.approx(np.mean(waiting))
+    assert result['avg_turnaround_time'] == pytest.approx(np.mean(turnaround))
+    assert result['avg_response_time'] == pytest.approx(np.mean(response))
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_round_robin_matches_original_loop(seed):
+    workload, quantum = small_workload(seed)
+    _, result = simulate(workload, quantum, 'simulate_round_robin')
+    table = result['processes']
+    expected = reference_round_robin(table['arrival_time'].tolist(),
+                                     table['burst_time'].tolist(), quantum)
+    finished = [state == 'TERMINATED' for state in expected['state']]
+    assert_schedule(result, expected['slices'], expected['first_response'],
+                    expected['completion'], finished)
+    assert table['remaining_time'].tolist() == expected['remaining']
+    assert table['state'].tolist() == expected['state']
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_fifo_matches_original_loop(seed):
+    workload, quantum = small_workload(seed)
+    _, result = simulate(workload, quantum, 'simulate_fifo')
+    table = result['processes']
+    assert_schedule(result, *reference_fifo(table['arrival_time'].tolist(),
+                                            table['burst_time'].tolist()))
+    assert (table['state'] == 'TERMINATED').all()
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_sjf_matches_original_loop(seed):
+    workload, quantum = small_workload(seed)
+    _, result = simulate(workload, quantum, 'simulate_sjf')
+    table = result['processes']
+    assert_schedule(result, *reference_sjf(table['arrival_time'].tolist(),
+                                           table['burst_time'].tolist()))
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_priority_matches_original_loop(seed):
+    workload, quantum = small_workload(seed)
+    _, result = simulate(workload, quantum, 'simulate_priority')
+    table = result['processes']
+    assert_schedule(result, *reference_priority(table['arrival_time'].tolist(),
+                                                table['burst_time'].tolist(),
+                                                table['priority'].tolist()))
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_srtf_matches_per_tick_reference(seed):
+    workload, quantum = small_workload(seed, min_burst=1)
+    _, result = simulate(workload, quantum, 'simulate_srtf')
+    table = result['processes']
+    assert_schedule(result, *reference_srtf(table['arrival_time'].tolist(),
+                                            table['burst_time'].tolist()))
+    assert (table['remaining_time'] == 0).all()
+
+
+@pytest.mark.parametrize('algorithm', list(sc.AlgoritmoType))
+@pytest.mark.parametrize('seed', range(10))
+def test_iter_simulation_matches_simulate(algorithm, seed):
+    workload, quantum = small_workload(seed)
+    _, expected = simulate(workload, quantum, sc.SIMULATORS[algorithm])
+    planner = sc.PlanificadorCompleto(quantum=quantum)
+    planner.load_processes(workload)
+    with contextlib.redirect_stdout(io.StringIO()):
+        streamed = list(planner.iter_simulation(algorithm))
+    assert streamed == [(r['process'], r['start'], r['end']) for r in expected['gantt_data']]
+    assert planner.processes.equals(expected['processes'])
+
+
+def test_parallel_comparison_matches_sequential():
+    workload = random_workload(4, n=80)
+    results = {}
+    for workers in (1, 2):
+        planner = sc.PlanificadorCompleto(quantum=3)
+        planner.load_processes(workload)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[workers] = planner.compare_algorithms(workers=workers)
+
+    assert results[1].keys() == results[2].keys()
+    for name, expected in results[1].items():
+        got = results[2][name]
+        assert list(got['execution_sequence']) == list(expected['execution_sequence']), name
+        assert got['processes'].equals(expected['processes']), name
+        for metric in ('avg_waiting_time', 'avg_turnaround_time', 'avg_response_time'):
+            assert got[metric] == expected[metric], (name, metric)
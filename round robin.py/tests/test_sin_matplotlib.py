@@ -0,0 +1,76 @@
+"""
+Pruebas de la importación diferida de matplotlib: los simuladores corren
+sin importarlo y, si no está instalado, solo fallan los gráficos
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Hace que 'import matplotlib' falle como si no estuviera instalado
+BLOCK_MATPLOTLIB = """
+import sys
+sys.modules['matplotlib'] = None
+"""
+
+SIMULATE = """
+import contextlib
+import importlib.util
+import io
+
+import pandas as pd
+
+import simulador_completo as sc
+
+workload = pd.DataFrame({'process_id': ['A', 'B', 'C'], 'arrival_time': [0, 1, 2],
+                         'burst_time': [5, 3, 1], 'priority': [2, 1, 3]})
+planner = sc.PlanificadorCompleto(quantum=2)
+planner.load_processes(workload)
+with contextlib.redirect_stdout(io.StringIO()):
+    results = planner.compare_algorithms()
+
+spec = importlib.util.spec_from_file_location('round_robin', 'round robin.py')
+round_robin = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(round_robin)
+simulator = round_robin.RoundRobinSimulator(2)
+simulator.load_processes(workload[['process_id', 'arrival_time', 'burst_time']])
+with contextlib.redirect_stdout(io.StringIO()):
+    simulator.run_simulation()
+"""
+
+
+def run(code):
+    """Ejecuta código en un intérprete nuevo desde el directorio de los simuladores"""
+    return subprocess.run([sys.executable, '-c', textwrap.dedent(code)], cwd=HERE,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_simulation_does_not_import_matplotlib():
+    process = run(SIMULATE + """
+import sys
+
+assert len(results) > 1
+assert 'matplotlib' not in sys.modules, sorted(m for m in sys.modules if 'matplotlib' in m)
+""")
+    assert process.returncode == 0, process.stderr
+
+
+def test_charts_without_matplotlib_explain_how_to_install():
+    process = run(BLOCK_MATPLOTLIB + SIMULATE + """
+import graficos
+
+messages = []
+for draw in (graficos.pyplot, lambda: planner.generate_comparison_chart(results),
+             simulator.generate_gantt_chart):
+    try:
+        draw()
+    except ImportError as error:
+        messages.append(str(error))
+print('\\n'.join(messages))
+""")
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.splitlines() == [
+        "Se necesita matplotlib para generar gráficos (pip install matplotlib)"] * 3